@@ -1,7 +1,51 @@
+import cPickle as pickle
+import errno
+import hashlib
+import imp
+import os
+
+import numpy as np
+import ply
 import ply.lex as lex
 import ply.yacc as yacc
 
+import fastlex
 import program as prog
+import relax
+
+
+def default_table_dir():
+    """
+    Where generated lexer and parser tables are cached between runs:
+    $SIMPLESIM_CACHE_DIR, or ~/.cache/simplesim.
+    """
+    return os.environ.get("SIMPLESIM_CACHE_DIR",
+                          os.path.join(os.path.expanduser("~"), ".cache",
+                                       "simplesim"))
+
+def grammar_hash(obj, prefix):
+    """
+    Hash of everything PLY builds its tables from: the token list and the
+    rules (the docstrings of functions, or the strings, named with prefix).
+    """
+    h = hashlib.sha1(ply.__version__)
+    for name in ("tokens", "literals", "states", "reserved", "precedence"):
+        h.update(repr(getattr(obj, name, None)))
+    for name in sorted(dir(obj)):
+        if name.startswith(prefix):
+            value = getattr(obj, name)
+            if not isinstance(value, str):
+                value = value.__doc__ or ""
+            h.update(name + "\0" + value + "\0")
+    return h.hexdigest()[:16]
+
+def _make_table_dir(table_dir):
+    try:
+        os.makedirs(table_dir)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            return False
+    return os.access(table_dir, os.W_OK)
 
 
 class ASMLexer(object):
@@ -18,6 +62,8 @@ class ASMLexer(object):
         ".DSEG": "DSEG",
         ".DW": "DW",
         ".EQU": "EQU",
+        ".ESEG": "ESEG",
+        ".INCLUDE": "INCLUDE",
         ".ORG": "ORG",
         ".UNDEF": "UNDEF",
     }
@@ -25,7 +71,7 @@ class ASMLexer(object):
     tokens = ("NUMBER LABEL SYMBOL STRING REGISTER NEWLINE".split() + 
               list(reserved.values()))
     
-    literals = "=,@"
+    literals = "=,@+-"
 
     states = (
         ('text', 'exclusive'),
@@ -34,11 +80,9 @@ class ASMLexer(object):
     def t_text_BACKSLASH(self, t):
         r'\\\\'
         t.lexer.text_value += r"\\"
-        print "escbs"
 
     def t_text_ESCAPED_QUOTE(self, t):
         r'\\"'
-        print "escquote"
         t.lexer.text_value += '"'
 
     def t_text_ESCAPED_OTHER(self, t):
@@ -47,7 +91,6 @@ class ASMLexer(object):
 
     def t_text_INSTRING(self, t):
         r'[^"\\]+'
-        print "Read some"
         t.lexer.text_value += t.value
 
     t_text_ignore = ""
@@ -124,11 +167,138 @@ class ASMLexer(object):
         t.lexer.skip(1)
 
     
-    def build(self, **kwargs):
+    def build(self, table_dir=None, **kwargs):
+        """
+        Build the lexer. With a table_dir, the lexer tables are loaded from
+        there if they were generated for the current rules, and written
+        there otherwise.
+        """
+        if table_dir and _make_table_dir(table_dir):
+            tabname = "asm_lextab_" + grammar_hash(self, "t_")
+            path = os.path.join(table_dir, tabname + ".py")
+            lextab = tabname
+            if os.path.exists(path):
+                try:
+                    lextab = imp.load_source(tabname, path)
+                except Exception:
+                    # Unreadable cache file; regenerate it.
+                    pass
+            kwargs.update(optimize=1, lextab=lextab, outputdir=table_dir)
         self.lexer = lex.lex(object=self, **kwargs)
         self.built = True
 
 
+class _IncludeScope(object):
+    """
+    Stands in for the parser's variables (or defs) while an included file
+    is parsed. Writes are kept back until the file is done, and every
+    name the file reads without having defined it is noted with the value
+    it saw (None if undefined), since the parse depends on it.
+    """
+    def __init__(self, env):
+        self.env = env
+        self.reads = {}
+        self.writes = {}
+
+    def _get(self, name):
+        if name in self.writes:
+            return self.writes[name]
+        value = self.env[name] if name in self.env else None
+        self.reads.setdefault(name, value)
+        return value
+
+    def __contains__(self, name):
+        return self._get(name) is not None
+
+    def __getitem__(self, name):
+        value = self._get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name, value):
+        self.writes[name] = value
+
+    def pop(self, name):
+        value = self[name]
+        self.writes[name] = None
+        return value
+
+
+def _apply_writes(env, writes):
+    for name, value in writes.items():
+        if value is None:
+            if name in env:
+                env.pop(name)
+        else:
+            env[name] = value
+
+
+class _IncludeRecorder(object):
+    """
+    Wraps the current segment while files are being included, passing
+    calls through and logging them for every include in progress.
+    """
+    def __init__(self, target, logs):
+        self.target = target
+        self.logs = logs
+
+    def _log(self, call):
+        for log in self.logs:
+            log.append(call)
+
+    @property
+    def cur_offset(self):
+        return self.target.cur_offset
+
+    def add_label(self, label):
+        self._log(("add_label", label))
+        self.target.add_label(label)
+
+    def add_instruction(self, op, args):
+        self._log(("add_instruction", op.mnemonic, args))
+        return self.target.add_instruction(op, args)
+
+    def define_bytes(self, byte_vals):
+        self._log(("define_bytes", byte_vals))
+        self.target.define_bytes(byte_vals)
+
+    def define_words(self, word_vals):
+        self._log(("define_words", word_vals))
+        self.target.define_words(word_vals)
+
+    def reserve_bytes(self, nbytes):
+        self._log(("reserve_bytes", nbytes))
+        self.target.reserve_bytes(nbytes)
+
+    def set_origin(self, address):
+        self._log(("set_origin", address))
+        self.target.set_origin(address)
+
+
+class IncludeEntry(object):
+    """
+    What parsing an included file did: the segment calls it made (calls),
+    the variables and defs it set, the outside ones it read, and the
+    files it included in turn, as {path: content hash}.
+    """
+    def __init__(self, calls, var_reads, var_writes, def_reads, def_writes,
+                 files):
+        self.calls = calls
+        self.var_reads = var_reads
+        self.var_writes = var_writes
+        self.def_reads = def_reads
+        self.def_writes = def_writes
+        self.files = files
+
+# Parsed include files by content (and grammar) hash
+_include_cache = {}
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
 class ASMParser(object):
     def p_program(self, p):
       '''program : lines'''
@@ -183,13 +353,15 @@ class ASMParser(object):
 
     def p_code_segment(self, p):
         " statement : CSEG "
-        self.cur_seg = prog.Segment("CSEG")
-        self.segments.append(self.cur_seg)
+        self.new_segment("CSEG")
 
     def p_data_segment(self, p):
         " statement : DSEG "
-        self.cur_seg = prog.Segment("DSEG")
-        self.segments.append(self.cur_seg)
+        self.new_segment("DSEG")
+
+    def p_eeprom_segment(self, p):
+        " statement : ESEG "
+        self.new_segment("ESEG")
 
     def p_db_directive(self, p):
         " statement : DB constexpr_list "
@@ -233,6 +405,10 @@ class ASMParser(object):
         " statement : ORG constexpr "
         self.cur_seg.set_origin(p[2])
 
+    def p_include_directive(self, p):
+        " statement : INCLUDE STRING "
+        self.include(p[2])
+
 
 
     def p_instruction(self, p):
@@ -240,22 +416,22 @@ class ASMParser(object):
         instruction : SYMBOL arglist
         """
         try:
-            op = prog.AllOps[p[1].upper()]
-            if len(p[2]) != len(op.args):
-               raise prog.ASMError("Operation %s takes %d arguments." % (tok, len(op.args)))
-            for idx, (oparg, inarg) in enumerate(zip(op.args, p[2])):
-                if oparg.type == prog.kArgConst:
-                    if isinstance(inarg, prog.RegisterArg):
-                        raise prog.ASMError("Operation %s takes a register for argument %d." % (tok, idx))
-                elif oparg.type == prog.kArgReg:
-                    if isinstance(inarg, prog.ConstantArg):
-                        raise prog.ASMError("Operation %s takes a numeric argument %d." % (tok, idx))
-
-            p[0] = self.cur_seg.add_instruction(op, p[2])
-
+            op, args = prog.resolve_op(p[1].upper(), p[2])
         except KeyError:
             raise prog.ASMError("Unknown operation " + p[1] + " at line: " + str(p.lineno(1)) )
 
+        if len(args) != len(op.args):
+           raise prog.ASMError("Operation %s takes %d arguments." % (p[1], len(op.args)))
+        for idx, (oparg, inarg) in enumerate(zip(op.args, args)):
+            if oparg.type == prog.kArgConst:
+                if isinstance(inarg, prog.RegisterArg):
+                    raise prog.ASMError("Operation %s takes a register for argument %d." % (p[1], idx))
+            elif oparg.type == prog.kArgReg:
+                if isinstance(inarg, prog.ConstantArg):
+                    raise prog.ASMError("Operation %s takes a numeric argument %d." % (p[1], idx))
+
+        p[0] = self.cur_seg.add_instruction(op, args)
+
 
     def p_arglist_empty(self, p):
         'arglist : empty'
@@ -273,15 +449,33 @@ class ASMParser(object):
 
     def p_arg_register(self, p):
         " arg : REGISTER "
-        p[0] = prog.RegisterArg(p[1])
+        p[0] = prog.shared_arg(prog.RegisterArg, p[1])
 
     def p_arg_number(self, p):
         "arg : constexpr"
-        p[0] = prog.ConstantArg(p[1])
+        p[0] = prog.shared_arg(prog.ConstantArg, p[1])
 
     def p_arg_symbol(self, p):
         "arg : SYMBOL"
-        p[0] = prog.SymbolArg(p[1])
+        if p[1].upper() in ("X", "Y", "Z"):
+            p[0] = prog.shared_arg(prog.PointerArg, p[1])
+        else:
+            p[0] = prog.shared_arg(prog.SymbolArg, p[1])
+
+    def p_arg_pointer_postinc(self, p):
+        "arg : SYMBOL '+'"
+        p[0] = prog.shared_arg(prog.PointerArg, p[1],
+                                prog.kPointerPostInc)
+
+    def p_arg_pointer_predec(self, p):
+        "arg : '-' SYMBOL"
+        p[0] = prog.shared_arg(prog.PointerArg, p[2],
+                                prog.kPointerPreDec)
+
+    def p_arg_pointer_displacement(self, p):
+        "arg : SYMBOL '+' constexpr"
+        p[0] = prog.shared_arg(prog.PointerArg, p[1],
+                                prog.kPointerDisplacement, p[3])
     
     def p_constexpr_num(self, p):
         "constexpr : NUMBER"
@@ -303,7 +497,30 @@ class ASMParser(object):
       'empty :'
       pass
 
-    def __init__(self):
+    def __init__(self, table_dir=None, debug=False, relax=False,
+                 include_path=None, fast_lexer=True):
+        """
+        Generated parser tables are cached in table_dir (by default
+        default_table_dir()); pass table_dir=False to always regenerate
+        them. Parsed .INCLUDE files are cached there too. debug=True
+        writes PLY's parser.out grammar report. With relax=True, jumps,
+        calls and branches to labels are given the shortest encoding that
+        reaches (see relax.py). include_path lists directories searched
+        for included files after the including file's own. fast_lexer
+        picks fastlex.FastLexer over the PLY lexer; both give the same
+        tokens.
+        """
+        if table_dir is None:
+            table_dir = default_table_dir()
+        self.table_dir = table_dir
+        self.debug = debug
+        self.relax = relax
+        self.fast_lexer = fast_lexer
+        self.include_path = list(include_path or [])
+        self.base_dir = None
+        # (path, {path: hash} of the files it includes) for each include
+        # being parsed
+        self._includes = []
         self.built = False
 
     def var_lookup_func(self, varname):
@@ -322,11 +539,181 @@ class ASMParser(object):
         self.lexer = ASMLexer(var_lookup_func = self.var_lookup_func,
                               def_lookup_func = self.def_lookup_func
                           )
-        self.lexer.build()
+        table_dir = self.table_dir
+        if table_dir and not _make_table_dir(table_dir):
+            table_dir = None
+        if self.fast_lexer:
+            self.lexer.lexer = fastlex.FastLexer(self.lexer)
+        else:
+            self.lexer.build(table_dir=table_dir)
         self.tokens = self.lexer.tokens
-        self.parser = yacc.yacc(module=self, write_tables=False, debug=True)
+        self._grammar_hash = grammar_hash(self, "p_")
+        if table_dir:
+            picklefile = os.path.join(
+                table_dir, "asm_parsetab_%s.pickle" % self._grammar_hash)
+            self.parser = yacc.yacc(module=self, picklefile=picklefile,
+                                    debug=self.debug, outputdir=table_dir)
+        else:
+            self.parser = yacc.yacc(module=self, write_tables=False,
+                                    debug=self.debug)
         self.built = True
 
+    def make_segment(self, seg_type):
+        return prog.Segment(seg_type)
+
+    def new_segment(self, seg_type):
+        segment = self.make_segment(seg_type)
+        self.segments.append(segment)
+        if self._includes:
+            self.cur_seg = _IncludeRecorder(segment, self.cur_seg.logs)
+            self.cur_seg._log(("new_segment", seg_type))
+        else:
+            self.cur_seg = segment
+
+    def _find_include(self, name):
+        dirs = [self.base_dir or os.getcwd()] + self.include_path
+        for directory in dirs:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                return os.path.abspath(path)
+        raise prog.ASMError("Can not find include file: " + name)
+
+    def _include_cache_path(self, key):
+        if not self.table_dir:
+            return None
+        directory = os.path.join(self.table_dir, "includes")
+        if not _make_table_dir(directory):
+            return None
+        return os.path.join(directory, key + ".pickle")
+
+    def _cached_include(self, key):
+        entry = _include_cache.get(key)
+        if entry is None:
+            path = self._include_cache_path(key)
+            if path and os.path.exists(path):
+                try:
+                    with open(path, "rb") as f:
+                        entry = pickle.load(f)
+                except Exception:
+                    # Unreadable cache file; parse the include again.
+                    entry = None
+                if entry is not None:
+                    _include_cache[key] = entry
+        if entry is None:
+            return None
+        for path, digest in entry.files.items():
+            if not os.path.isfile(path) or _file_hash(path) != digest:
+                return None
+        for env, reads in ((self.variables, entry.var_reads),
+                           (self.defs, entry.def_reads)):
+            for name, value in reads.items():
+                if (env[name] if name in env else None) != value:
+                    return None
+        return entry
+
+    def _store_include(self, key, entry):
+        _include_cache[key] = entry
+        path = self._include_cache_path(key)
+        if path:
+            temp = "%s.%d.tmp" % (path, os.getpid())
+            try:
+                with open(temp, "wb") as f:
+                    pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+                os.rename(temp, path)
+            except (IOError, OSError):
+                pass
+
+    def _replay_include(self, entry):
+        _apply_writes(self.variables, entry.var_writes)
+        _apply_writes(self.defs, entry.def_writes)
+        for call in entry.calls:
+            name, args = call[0], call[1:]
+            if name == "new_segment":
+                self.new_segment(*args)
+            elif name == "add_instruction":
+                self.cur_seg.add_instruction(prog.AllOps[args[0]], args[1])
+            else:
+                getattr(self.cur_seg, name)(*args)
+
+    def include(self, name):
+        """
+        Include a file, as .INCLUDE does. A file is only parsed the first
+        time it is seen with given contents; after that, what it did is
+        replayed from the cache, as long as the files it includes and the
+        outside definitions it used are unchanged.
+        """
+        path = self._find_include(name)
+        if any(path == include[0] for include in self._includes):
+            raise prog.ASMError("Recursive include of " + name)
+        with open(path, "rb") as f:
+            text = f.read()
+        digest = hashlib.sha1(text).hexdigest()
+        for include in self._includes:
+            include[1][path] = digest
+        key = "%s_%s" % (digest, self._grammar_hash)
+        entry = self._cached_include(key)
+        if entry is not None:
+            self._replay_include(entry)
+            return
+
+        log = []
+        files = {}
+        if not self._includes:
+            self.cur_seg = _IncludeRecorder(self.cur_seg, [])
+        self.cur_seg.logs.append(log)
+        self._includes.append((path, files))
+        outer = (self.variables, self.defs, self.base_dir)
+        variables = self.variables = _IncludeScope(self.variables)
+        defs = self.defs = _IncludeScope(self.defs)
+        self.base_dir = os.path.dirname(path)
+        lexer = self.lexer.lexer.clone()
+        lexer.lineno = 1
+        lexer.begin("INITIAL")
+        try:
+            if not text.endswith("\n"):
+                text += "\n"
+            self.parser.parse(text, lexer=lexer)
+        finally:
+            self.variables, self.defs, self.base_dir = outer
+            self._includes.pop()
+            self.cur_seg.logs.pop()
+            if not self._includes:
+                self.cur_seg = self.cur_seg.target
+        _apply_writes(self.variables, variables.writes)
+        _apply_writes(self.defs, defs.writes)
+        self._store_include(key, IncludeEntry(log, variables.reads,
+                                              variables.writes, defs.reads,
+                                              defs.writes, files))
+
+    def parse_file(self, path):
+        """Parse a source file; its includes are looked for beside it."""
+        with open(path) as f:
+            text = f.read()
+        self.base_dir = os.path.dirname(os.path.abspath(path))
+        self.parse(text)
+
+    def symbols(self):
+        """Addresses of all labels: words for code, bytes for data."""
+        result = {}
+        for seg in self.segments:
+            for label in seg.labels:
+                result[label] = seg.label_address(label)
+        return result
+
+    def flash_image(self, size=None):
+        """
+        Encode the code segments of the last parse into a flash image,
+        sized to fit the code unless size (in words) is given.
+        """
+        symbols = self.symbols()
+        code = [seg for seg in self.segments if seg.seg_type == "CSEG"]
+        if size is None:
+            size = max(seg.end_address() for seg in code)
+        image = np.zeros(size, "<u2")
+        for seg in code:
+            seg.emit(image, symbols)
+        return image
+
     def parse(self, text):
         if not self.built:
             self.build()
@@ -334,5 +721,10 @@ class ASMParser(object):
         self.defs = {}
         self.cur_seg = prog.Segment("CSEG")
         self.segments = [self.cur_seg]
-        self.parser.parse(text)
+        self._includes = []
+        lexer = self.lexer.lexer
+        lexer.lineno = 1
+        self.parser.parse(text, lexer=lexer)
+        if self.relax:
+            relax.relax_segments(self.segments)
         
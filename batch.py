@@ -0,0 +1,607 @@
+import numpy as np
+
+import program as prog
+from decoder import default_decoder
+from simplesim import CPUState, SimulationError, kDefaultFlashWords
+
+class BatchCPUState(object):
+    """
+    State of N independent CPUs running the same program, one per lane.
+
+    ram holds each lane's data space, shape (N, ramsize); regs and sreg are
+    views into it, so writes through either are seen by the other. pc and
+    cycles have one entry per lane. Flash is shared by all lanes.
+    """
+    def __init__(self, lanes, ramsize, flashsize=kDefaultFlashWords):
+        self.ram = np.zeros((lanes, ramsize), np.uint8)
+        self.regs = self.ram[:, :32]
+        self.sreg = self.ram[:, prog.kSREG]
+        self.flash = np.zeros(flashsize, np.uint16)
+        self.instruction_sizes = default_decoder().sizes
+        self.pc = np.zeros(lanes, np.int64)
+        self.cycles = np.zeros(lanes, np.int64)
+        self.halted = np.zeros(lanes, bool)
+        self.sp = np.full(lanes, ramsize - 1, np.int64)
+
+    @classmethod
+    def from_cpu(cls, cpu, lanes):
+        """
+        N copies of a CPUState, e.g. a program loaded and ready to go. Its
+        I/O handlers aren't copied; the lanes' I/O registers are plain
+        memory.
+        """
+        state = cls(lanes, len(cpu.data), len(cpu.flash))
+        state.ram[:] = cpu.ram
+        state.flash[:] = cpu.flash
+        state.pc[:] = cpu.pc
+        state.cycles[:] = cpu.cycles
+        return state
+
+    @property
+    def lanes(self):
+        return len(self.ram)
+
+    @property
+    def sp(self):
+        return (self.ram[:, prog.kSPL].astype(np.int64)
+                | (self.ram[:, prog.kSPH].astype(np.int64) << 8))
+
+    @sp.setter
+    def sp(self, value):
+        value = np.asarray(value, np.int64)
+        self.ram[:, prog.kSPL] = value & 0xff
+        self.ram[:, prog.kSPH] = (value >> 8) & 0xff
+
+    def load_image(self, image, origin=0):
+        image = np.asarray(image, np.uint16)
+        self.flash[origin:origin + len(image)] = image
+
+    def lane(self, index):
+        """A CPUState copy of one lane, for inspection."""
+        cpu = CPUState(self.ram.shape[1], len(self.flash))
+        cpu.ram[:] = self.ram[index]
+        cpu.flash[:] = self.flash
+        cpu.pc = int(self.pc[index])
+        cpu.cycles = int(self.cycles[index])
+        return cpu
+
+
+# Vectorized op implementations, keyed by mnemonic. They take the batch
+# state, an array of the lanes executing the op and the decoded operands,
+# with pc and cycles already advanced as for the scalar ops. Ops without
+# one fall back to running the scalar implementation lane by lane.
+VectorOps = {}
+
+class vector_op(object):
+    def __init__(self, *mnemonics):
+        self.mnemonics = mnemonics
+
+    def __call__(self, f):
+        for mnemonic in self.mnemonics:
+            VectorOps[mnemonic] = f
+        return f
+
+
+class BatchSimulator(object):
+    """
+    Steps every lane of a BatchCPUState together.
+
+    Lanes are grouped by PC on each step and each group executes its
+    instruction as a single vector op, so while the lanes' control flow
+    agrees every instruction is one set of array operations for all of
+    them. Lanes stop at SLEEP or BREAK.
+    """
+    def __init__(self, state, decoder=None):
+        self.state = state
+        self.decoder = decoder or default_decoder()
+        state.instruction_sizes = self.decoder.sizes
+        self._decoded = {}
+
+    def _decode(self, pc):
+        op, operands, size = self.decoder.decode_at(self.state.flash, pc)
+        if op is None:
+            raise SimulationError("Illegal instruction %04x at %04x"
+                                  % (self.state.flash[pc], pc))
+        impl = VectorOps.get(op.mnemonic)
+        if impl is None:
+            entry = (_scalar_fallback, (op,) + operands, size, op.cycles)
+        else:
+            entry = (impl, operands, size, op.cycles)
+        self._decoded[pc] = entry
+        return entry
+
+    def step(self, lanes=None):
+        """
+        Execute one instruction on each of the given lanes (default: all
+        that haven't halted). Returns False if there was nothing to run.
+        """
+        state = self.state
+        if lanes is None:
+            lanes = np.flatnonzero(~state.halted)
+        if not len(lanes):
+            return False
+        pcs = state.pc[lanes]
+        first = pcs[0]
+        if (pcs == first).all():
+            groups = [(int(first), lanes)]
+        else:
+            order = np.argsort(pcs, kind="mergesort")
+            pcs = pcs[order]
+            lanes = lanes[order]
+            starts = np.flatnonzero(np.diff(pcs)) + 1
+            groups = [(int(pcs[g[0]]), lanes[g[0]:g[-1] + 1])
+                      for g in np.split(np.arange(len(pcs)), starts)]
+        decoded = self._decoded
+        for pc, group in groups:
+            entry = decoded.get(pc)
+            if entry is None:
+                entry = self._decode(pc)
+            impl, operands, size, cycles = entry
+            state.pc[group] = pc + size
+            state.cycles[group] += cycles
+            impl(state, group, *operands)
+        return True
+
+    def run(self, max_cycles=None, max_steps=None):
+        """
+        Run until every lane has halted, used up max_cycles (counted per
+        lane from the start of the call) or max_steps steps have been taken.
+        Returns the number of steps.
+        """
+        state = self.state
+        if max_cycles is not None:
+            limit = state.cycles + max_cycles
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            running = ~state.halted
+            if max_cycles is not None:
+                running &= state.cycles < limit
+            if not self.step(np.flatnonzero(running)):
+                break
+            steps += 1
+        return steps
+
+
+class _LaneCPU(CPUState):
+    # Scalar view of one lane, so that any op can run on a batch.
+    def __init__(self, state, lane):
+        self.data = bytearray(state.ram[lane].tobytes())
+        self.ram = np.frombuffer(self.data, np.uint8)
+        # Lanes have no I/O handlers
+        self.io_mask = bytearray(len(self.data))
+        self.flash = state.flash
+        self.flash_observers = []
+        self.instruction_sizes = state.instruction_sizes
+        self.pc = int(state.pc[lane])
+        self.cycles = int(state.cycles[lane])
+
+    def write_flash(self, addr, words):
+        raise SimulationError("Lanes of a batch can not write flash")
+
+def _scalar_fallback(state, lanes, op, *operands):
+    for lane in lanes:
+        cpu = _LaneCPU(state, lane)
+        try:
+            extra = op.impl(cpu, *operands)
+        except prog.StopExecution:
+            state.halted[lane] = True
+            extra = 0
+        state.ram[lane] = cpu.ram
+        state.pc[lane] = cpu.pc
+        state.cycles[lane] += extra or 0
+
+
+# Helpers for the vector ops
+
+def _get_pointer(ram, lanes, reg):
+    return (ram[lanes, reg].astype(np.int64)
+            | (ram[lanes, reg + 1].astype(np.int64) << 8))
+
+def _set_pointer(ram, lanes, reg, value):
+    ram[lanes, reg] = value & 0xff
+    ram[lanes, reg + 1] = (value >> 8) & 0xff
+
+def _push_pc(state, lanes):
+    ram = state.ram
+    sp = _get_pointer(ram, lanes, prog.kSPL)
+    pc = state.pc[lanes]
+    ram[lanes, sp] = pc & 0xff
+    ram[lanes, sp - 1] = (pc >> 8) & 0xff
+    _set_pointer(ram, lanes, prog.kSPL, sp - 2)
+
+def _pop_pc(state, lanes):
+    ram = state.ram
+    sp = _get_pointer(ram, lanes, prog.kSPL) + 2
+    _set_pointer(ram, lanes, prog.kSPL, sp)
+    return (ram[lanes, sp - 1].astype(np.int64) << 8) | ram[lanes, sp]
+
+def _skip(state, lanes, condition):
+    lanes = lanes[condition]
+    if len(lanes):
+        sizes = state.instruction_sizes[state.flash[state.pc[lanes]]]
+        state.pc[lanes] += sizes
+        state.cycles[lanes] += sizes
+
+def _branch(state, lanes, condition, k):
+    lanes = lanes[condition]
+    state.pc[lanes] += k
+    state.cycles[lanes] += 1
+
+# Arithmetic and logic
+
+# NumPy views of program.py's ALU tables, so both paths share one copy
+_add_results = np.frombuffer(prog.kAddResults, np.uint8)
+_add_flags = np.frombuffer(prog.kAddFlags, np.uint8)
+_sub_results = np.frombuffer(prog.kSubResults, np.uint8)
+_sub_flags = np.frombuffer(prog.kSubFlags, np.uint8)
+_shift_results = np.frombuffer(prog.kShiftResults, np.uint8)
+_shift_flags = np.frombuffer(prog.kShiftFlagTable, np.uint8)
+_logic_flags = np.frombuffer(prog.kLogicFlagTable, np.uint8)
+_inc_flags = np.frombuffer(prog.kIncFlagTable, np.uint8)
+_dec_flags = np.frombuffer(prog.kDecFlagTable, np.uint8)
+
+def _set_flags(ram, lanes, changed, flags):
+    sreg = ram[lanes, prog.kSREG] & (0xff & ~changed)
+    ram[lanes, prog.kSREG] = sreg | flags
+
+def _declare_arith(mnemonic, results, flag_table, carry, immediate, store):
+    # Ops indexing the add or subtract tables with (carry, Rd, Rr or K).
+    # Those with carry keep Z set only if it already was.
+    def impl(state, lanes, d, r):
+        ram = state.ram
+        index = ram[lanes, d].astype(np.int32) << 8
+        if immediate:
+            index |= r
+        else:
+            index |= ram[lanes, r]
+        if carry:
+            sreg = ram[lanes, prog.kSREG]
+            index |= (sreg & prog.kFlagC).astype(np.int32) << 16
+            flags = flag_table[index] & (sreg | (0xff & ~prog.kFlagZ))
+        else:
+            flags = flag_table[index]
+        _set_flags(ram, lanes, prog.kArithFlags, flags)
+        if store:
+            ram[lanes, d] = results[index]
+    vector_op(mnemonic)(impl)
+
+for _mnemonic, _carry, _immediate, _store in [
+        ("SUB", False, False, True), ("SUBI", False, True, True),
+        ("SBC", True, False, True), ("SBCI", True, True, True),
+        ("CP", False, False, False), ("CPC", True, False, False),
+        ("CPI", False, True, False)]:
+    _declare_arith(_mnemonic, _sub_results, _sub_flags, _carry, _immediate,
+                   _store)
+
+@vector_op("ADD")
+def _add(state, lanes, d, r):
+    ram = state.ram
+    index = (ram[lanes, d].astype(np.int32) << 8) | ram[lanes, r]
+    _set_flags(ram, lanes, prog.kArithFlags, _add_flags[index])
+    ram[lanes, d] = _add_results[index]
+
+@vector_op("ADC")
+def _adc(state, lanes, d, r):
+    ram = state.ram
+    index = ((ram[lanes, prog.kSREG] & prog.kFlagC).astype(np.int32) << 16
+             | ram[lanes, d].astype(np.int32) << 8 | ram[lanes, r])
+    _set_flags(ram, lanes, prog.kArithFlags, _add_flags[index])
+    ram[lanes, d] = _add_results[index]
+
+def _declare_word_op(mnemonic, results, flag_table, sign):
+    # ADIW and SBIW: the high byte's table entry, with the low byte's
+    # carry or borrow, gives the flags, except that Z needs both bytes.
+    def impl(state, lanes, d, k):
+        ram = state.ram
+        low = ram[lanes, d].astype(np.int32) + sign * k
+        index = ((low >> 8) & 1) << 16 | ram[lanes, d + 1].astype(np.int32) << 8
+        low &= 0xff
+        flags = flag_table[index] & np.where(low == 0, prog.kShiftFlags,
+                                             prog.kShiftFlags & ~prog.kFlagZ)
+        _set_flags(ram, lanes, prog.kShiftFlags, flags)
+        ram[lanes, d] = low
+        ram[lanes, d + 1] = results[index]
+    vector_op(mnemonic)(impl)
+
+_declare_word_op("ADIW", _add_results, _add_flags, 1)
+_declare_word_op("SBIW", _sub_results, _sub_flags, -1)
+
+@vector_op("NEG")
+def _neg(state, lanes, d):
+    ram = state.ram
+    index = ram[lanes, d]
+    _set_flags(ram, lanes, prog.kArithFlags, _sub_flags[index])
+    ram[lanes, d] = _sub_results[index]
+
+@vector_op("INC")
+def _inc(state, lanes, d):
+    ram = state.ram
+    result = ram[lanes, d] + np.uint8(1)
+    _set_flags(ram, lanes, prog.kLogicFlags, _inc_flags[result])
+    ram[lanes, d] = result
+
+@vector_op("DEC")
+def _dec(state, lanes, d):
+    ram = state.ram
+    result = ram[lanes, d] - np.uint8(1)
+    _set_flags(ram, lanes, prog.kLogicFlags, _dec_flags[result])
+    ram[lanes, d] = result
+
+def _declare_logic(mnemonic, ufunc, immediate):
+    def impl(state, lanes, d, r):
+        ram = state.ram
+        if immediate:
+            result = ufunc(ram[lanes, d], np.uint8(r))
+        else:
+            result = ufunc(ram[lanes, d], ram[lanes, r])
+        _set_flags(ram, lanes, prog.kLogicFlags, _logic_flags[result])
+        ram[lanes, d] = result
+    vector_op(mnemonic)(impl)
+
+_declare_logic("AND", np.bitwise_and, False)
+_declare_logic("ANDI", np.bitwise_and, True)
+_declare_logic("OR", np.bitwise_or, False)
+_declare_logic("ORI", np.bitwise_or, True)
+_declare_logic("EOR", np.bitwise_xor, False)
+
+@vector_op("COM")
+def _com(state, lanes, d):
+    ram = state.ram
+    result = ~ram[lanes, d]
+    _set_flags(ram, lanes, prog.kShiftFlags,
+               _logic_flags[result] | prog.kFlagC)
+    ram[lanes, d] = result
+
+def _shift(ram, lanes, d, index):
+    _set_flags(ram, lanes, prog.kShiftFlags, _shift_flags[index])
+    ram[lanes, d] = _shift_results[index]
+
+@vector_op("LSR")
+def _lsr(state, lanes, d):
+    _shift(state.ram, lanes, d, state.ram[lanes, d])
+
+@vector_op("ROR")
+def _ror(state, lanes, d):
+    ram = state.ram
+    carry = (ram[lanes, prog.kSREG] & prog.kFlagC).astype(np.int32)
+    _shift(ram, lanes, d, carry << 8 | ram[lanes, d])
+
+@vector_op("ASR")
+def _asr(state, lanes, d):
+    ram = state.ram
+    a = ram[lanes, d].astype(np.int32)
+    _shift(ram, lanes, d, (a >> 7) << 8 | a)
+
+@vector_op("SWAP")
+def _swap(state, lanes, d):
+    a = state.ram[lanes, d]
+    state.ram[lanes, d] = (a << 4) | (a >> 4)
+
+# Control flow
+
+@vector_op("RJMP")
+def _rjmp(state, lanes, k):
+    state.pc[lanes] += k
+
+@vector_op("JMP")
+def _jmp(state, lanes, k):
+    state.pc[lanes] = k
+
+@vector_op("RCALL")
+def _rcall(state, lanes, k):
+    _push_pc(state, lanes)
+    state.pc[lanes] += k
+
+@vector_op("CALL")
+def _call(state, lanes, k):
+    _push_pc(state, lanes)
+    state.pc[lanes] = k
+
+@vector_op("IJMP")
+def _ijmp(state, lanes):
+    state.pc[lanes] = _get_pointer(state.ram, lanes, prog.kZReg)
+
+@vector_op("ICALL")
+def _icall(state, lanes):
+    _push_pc(state, lanes)
+    state.pc[lanes] = _get_pointer(state.ram, lanes, prog.kZReg)
+
+@vector_op("RET")
+def _ret(state, lanes):
+    state.pc[lanes] = _pop_pc(state, lanes)
+
+@vector_op("RETI")
+def _reti(state, lanes):
+    state.pc[lanes] = _pop_pc(state, lanes)
+    state.ram[lanes, prog.kSREG] |= prog.kFlagI
+
+@vector_op("BRBS")
+def _brbs(state, lanes, s, k):
+    _branch(state, lanes, (state.ram[lanes, prog.kSREG] >> s) & 1 == 1, k)
+
+@vector_op("BRBC")
+def _brbc(state, lanes, s, k):
+    _branch(state, lanes, (state.ram[lanes, prog.kSREG] >> s) & 1 == 0, k)
+
+def _declare_branch(mnemonic, bit, if_set):
+    def impl(state, lanes, k):
+        flag = (state.ram[lanes, prog.kSREG] >> bit) & 1
+        _branch(state, lanes, flag == if_set, k)
+    vector_op(mnemonic)(impl)
+
+for _set_name, _clear_name, _bit in [("BRCS", "BRCC", 0), ("BREQ", "BRNE", 1),
+                                     ("BRMI", "BRPL", 2), ("BRVS", "BRVC", 3),
+                                     ("BRLT", "BRGE", 4), ("BRHS", "BRHC", 5),
+                                     ("BRTS", "BRTC", 6), ("BRIE", "BRID", 7)]:
+    _declare_branch(_set_name, _bit, 1)
+    _declare_branch(_clear_name, _bit, 0)
+
+@vector_op("CPSE")
+def _cpse(state, lanes, d, r):
+    _skip(state, lanes, state.ram[lanes, d] == state.ram[lanes, r])
+
+@vector_op("SBRC")
+def _sbrc(state, lanes, r, b):
+    _skip(state, lanes, (state.ram[lanes, r] >> b) & 1 == 0)
+
+@vector_op("SBRS")
+def _sbrs(state, lanes, r, b):
+    _skip(state, lanes, (state.ram[lanes, r] >> b) & 1 == 1)
+
+@vector_op("SBIC")
+def _sbic(state, lanes, a, b):
+    _skip(state, lanes, (state.ram[lanes, a + prog.kIOOffset] >> b) & 1 == 0)
+
+@vector_op("SBIS")
+def _sbis(state, lanes, a, b):
+    _skip(state, lanes, (state.ram[lanes, a + prog.kIOOffset] >> b) & 1 == 1)
+
+# Data transfer
+
+@vector_op("MOV")
+def _mov(state, lanes, d, r):
+    state.ram[lanes, d] = state.ram[lanes, r]
+
+@vector_op("MOVW")
+def _movw(state, lanes, d, r):
+    state.ram[lanes, d:d + 2] = state.ram[lanes, r:r + 2]
+
+@vector_op("LDI")
+def _ldi(state, lanes, d, k):
+    state.ram[lanes, d] = k
+
+@vector_op("LDS")
+def _lds(state, lanes, d, k):
+    state.ram[lanes, d] = state.ram[lanes, k]
+
+@vector_op("STS")
+def _sts(state, lanes, k, r):
+    state.ram[lanes, k] = state.ram[lanes, r]
+
+def _declare_pointer_ops(pointer, reg):
+    def ld(state, lanes, d):
+        ram = state.ram
+        ram[lanes, d] = ram[lanes, _get_pointer(ram, lanes, reg)]
+    def ld_inc(state, lanes, d):
+        ram = state.ram
+        addr = _get_pointer(ram, lanes, reg)
+        _set_pointer(ram, lanes, reg, addr + 1)
+        ram[lanes, d] = ram[lanes, addr]
+    def ld_dec(state, lanes, d):
+        ram = state.ram
+        addr = (_get_pointer(ram, lanes, reg) - 1) & 0xffff
+        _set_pointer(ram, lanes, reg, addr)
+        ram[lanes, d] = ram[lanes, addr]
+    def st(state, lanes, r):
+        ram = state.ram
+        ram[lanes, _get_pointer(ram, lanes, reg)] = ram[lanes, r]
+    def st_inc(state, lanes, r):
+        ram = state.ram
+        addr = _get_pointer(ram, lanes, reg)
+        value = ram[lanes, r]
+        _set_pointer(ram, lanes, reg, addr + 1)
+        ram[lanes, addr] = value
+    def st_dec(state, lanes, r):
+        ram = state.ram
+        value = ram[lanes, r]
+        addr = (_get_pointer(ram, lanes, reg) - 1) & 0xffff
+        _set_pointer(ram, lanes, reg, addr)
+        ram[lanes, addr] = value
+    vector_op("LD_%s" % pointer)(ld)
+    vector_op("LD_%s_INC" % pointer)(ld_inc)
+    vector_op("LD_%s_DEC" % pointer)(ld_dec)
+    vector_op("ST_%s" % pointer)(st)
+    vector_op("ST_%s_INC" % pointer)(st_inc)
+    vector_op("ST_%s_DEC" % pointer)(st_dec)
+
+for _pointer, _reg in [("X", prog.kXReg), ("Y", prog.kYReg), ("Z", prog.kZReg)]:
+    _declare_pointer_ops(_pointer, _reg)
+
+def _declare_displacement_ops(pointer, reg):
+    def ldd(state, lanes, d, q):
+        ram = state.ram
+        ram[lanes, d] = ram[lanes, _get_pointer(ram, lanes, reg) + q]
+    def std(state, lanes, q, r):
+        ram = state.ram
+        ram[lanes, _get_pointer(ram, lanes, reg) + q] = ram[lanes, r]
+    vector_op("LDD_%s" % pointer)(ldd)
+    vector_op("STD_%s" % pointer)(std)
+
+_declare_displacement_ops("Y", prog.kYReg)
+_declare_displacement_ops("Z", prog.kZReg)
+
+def _program_bytes(state, addr):
+    words = state.flash[addr >> 1]
+    return np.where(addr & 1, words >> 8, words & 0xff).astype(np.uint8)
+
+@vector_op("LPM")
+def _lpm(state, lanes):
+    addr = _get_pointer(state.ram, lanes, prog.kZReg)
+    state.ram[lanes, 0] = _program_bytes(state, addr)
+
+@vector_op("LPM_Z")
+def _lpm_z(state, lanes, d):
+    addr = _get_pointer(state.ram, lanes, prog.kZReg)
+    state.ram[lanes, d] = _program_bytes(state, addr)
+
+@vector_op("LPM_Z_INC")
+def _lpm_z_inc(state, lanes, d):
+    addr = _get_pointer(state.ram, lanes, prog.kZReg)
+    _set_pointer(state.ram, lanes, prog.kZReg, addr + 1)
+    state.ram[lanes, d] = _program_bytes(state, addr)
+
+@vector_op("IN")
+def _in(state, lanes, d, a):
+    state.ram[lanes, d] = state.ram[lanes, a + prog.kIOOffset]
+
+@vector_op("OUT")
+def _out(state, lanes, a, r):
+    state.ram[lanes, a + prog.kIOOffset] = state.ram[lanes, r]
+
+@vector_op("PUSH")
+def _push(state, lanes, r):
+    ram = state.ram
+    sp = _get_pointer(ram, lanes, prog.kSPL)
+    ram[lanes, sp] = ram[lanes, r]
+    _set_pointer(ram, lanes, prog.kSPL, sp - 1)
+
+@vector_op("POP")
+def _pop(state, lanes, d):
+    ram = state.ram
+    sp = _get_pointer(ram, lanes, prog.kSPL) + 1
+    _set_pointer(ram, lanes, prog.kSPL, sp)
+    ram[lanes, d] = ram[lanes, sp]
+
+# Bit and status register ops
+
+@vector_op("BSET")
+def _bset(state, lanes, s):
+    state.ram[lanes, prog.kSREG] |= 1 << s
+
+@vector_op("BCLR")
+def _bclr(state, lanes, s):
+    state.ram[lanes, prog.kSREG] &= ~(1 << s) & 0xff
+
+def _declare_flag_op(mnemonic, bit, value):
+    mask = 1 << bit
+    if value:
+        def impl(state, lanes):
+            state.ram[lanes, prog.kSREG] |= mask
+    else:
+        def impl(state, lanes):
+            state.ram[lanes, prog.kSREG] &= ~mask & 0xff
+    vector_op(mnemonic)(impl)
+
+for _bit, _flag in enumerate(prog.kFlagNames):
+    _declare_flag_op("SE" + _flag, _bit, True)
+    _declare_flag_op("CL" + _flag, _bit, False)
+
+# MCU control
+
+@vector_op("NOP", "WDR")
+def _nop(state, lanes):
+    pass
+
+@vector_op("SLEEP", "BREAK")
+def _halt(state, lanes):
+    state.halted[lanes] = True
@@ -0,0 +1,273 @@
+"""
+Benchmarks for the assembler and the simulators.
+
+The workloads are the .asm sources in benchmarks/. Each is assembled
+(parse lines per second) and, except for the tables, run to its BREAK on
+each simulator engine (instructions and cycles per second, and how much
+the peak memory of the process grew from building the simulator to the
+end of its runs). Building a new ASMParser is timed on its own, both
+generating its tables and loading them from the cache. Every simulator
+is run in a fresh worker process, so that their memory use doesn't
+include each other's, and the instructions are counted in another.
+
+Results are written as JSON: a flat "metrics" object of name -> value,
+where names ending in _per_sec are better higher and the others (seconds,
+kilobytes) better lower. With --compare, each metric is checked against
+the same one in a baseline file, and any that got worse by more than the
+threshold is reported as a regression (and the exit status is 1).
+
+Usage: python benchmark.py [NAME...] [-o RESULTS.json]
+                           [--compare BASELINE.json] [--threshold PERCENT]
+                           [--repeat N]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+
+from assembler import ASMParser
+from peripherals import Timer
+from scheduler import Scheduler
+from simplesim import CPUState, Simulator
+from translator import BlockSimulator
+
+kBenchmarkDir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "benchmarks")
+kRamSize = 0x900
+kDefaultThreshold = 10.0
+
+# Engine name -> (simulator class, fuse)
+kEngines = [
+    ("simulator", (Simulator, False)),
+    ("simulator_fused", (Simulator, True)),
+    ("block", (BlockSimulator, False)),
+    ("block_fused", (BlockSimulator, True)),
+    ]
+
+class Workload(object):
+    """
+    A benchmark source. run is how it's simulated: "break" runs it to its
+    BREAK, "timer" does the same under a Scheduler with a timer raising
+    vector 1, and None only assembles it. check, given the CPU afterwards,
+    returns whether it computed the right answer.
+    """
+    def __init__(self, name, run="break", check=None):
+        self.name = name
+        self.run = run
+        self.check = check
+
+    @property
+    def path(self):
+        return os.path.join(kBenchmarkDir, self.name + ".asm")
+
+    def source(self):
+        with open(self.path) as f:
+            return f.read()
+
+
+def _word(data, reg):
+    return data[reg] | (data[reg + 1] << 8)
+
+def _crc16(data, passes):
+    crc = 0
+    for _ in range(passes):
+        for byte in data:
+            crc ^= byte
+            for _ in range(8):
+                crc = (crc >> 1) ^ 0xa001 if crc & 1 else crc >> 1
+    return crc
+
+def _check_crc16(cpu):
+    # The table is at word 0x400
+    table = [cpu.read_program_byte(0x800 + i) for i in range(256)]
+    return _word(cpu.data, 24) == _crc16(table, 32)
+
+def _check_multiply(cpu):
+    total, a, b = 0, 11, 7
+    for _ in range(2000):
+        total = (total + a * b) & 0xffffffff
+        a = (a + 37) & 0xffff
+        b = (b + 101) & 0xffff
+    return _word(cpu.data, 2) | (_word(cpu.data, 4) << 16) == total
+
+kWorkloads = [
+    Workload("bubble", check=lambda cpu: list(cpu.data[0x100:0x180])
+             == sorted(cpu.data[0x100:0x180])),
+    Workload("crc16", check=_check_crc16),
+    Workload("multiply", check=_check_multiply),
+    Workload("memcpy", check=lambda cpu: cpu.data[0x100:0x500]
+             == cpu.data[0x500:0x900]),
+    Workload("timer", run="timer", check=lambda cpu: cpu.data[20] == 200),
+    Workload("tables", run=None),
+    ]
+
+
+def _best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def bench_build(repeat):
+    # A new parser each time, as building one again is a no-op
+    ASMParser().build()     # so that the cache is filled
+    return {"build.seconds": _best_time(
+                lambda: ASMParser(table_dir=False).build(), repeat),
+            "build_cached.seconds": _best_time(
+                lambda: ASMParser().build(), repeat)}
+
+def bench_parse(workload, repeat):
+    asm = ASMParser()
+    asm.build()
+    source = workload.source()
+    lines = source.count("\n")
+    seconds = _best_time(lambda: asm.parse(source), repeat)
+    return {"parse.%s.lines_per_sec" % workload.name: lines / seconds}
+
+def _run(workload, sim):
+    cpu = sim.cpu
+    cpu.reset()
+    if workload.run == "timer":
+        scheduler = Scheduler(sim, vector_words=1)
+        Timer(scheduler, top=0xff, prescaler=64, overflow_vector=1).start()
+        reason = scheduler.run()
+    else:
+        reason = sim.run()
+    if reason != "break":
+        raise RuntimeError("%s stopped with %r" % (workload.name, reason))
+    if workload.check and not workload.check(cpu):
+        raise RuntimeError("%s computed the wrong result" % workload.name)
+
+def _load(workload):
+    asm = ASMParser()
+    asm.parse(workload.source())
+    cpu = CPUState(kRamSize)
+    cpu.load_image(asm.flash_image())
+    return cpu
+
+def _peak_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _count_instructions(name):
+    # Runs in a worker process of its own, on the plain simulator.
+    cpu = _load(dict((w.name, w) for w in kWorkloads)[name])
+    instructions, reason = Simulator(cpu).run_instructions(float("inf"))
+    return instructions
+
+def _simulate(name, engine, repeat, instructions):
+    # Runs in a worker process of its own. The worker starts out with
+    # whatever it shares with the parent, so only the growth of its peak
+    # memory is the engine's.
+    workload = dict((w.name, w) for w in kWorkloads)[name]
+    cls, fuse = dict(kEngines)[engine]
+    cpu = _load(workload)
+    start_kb = _peak_kb()
+    sim = cls(cpu, fuse=fuse)
+    seconds = _best_time(lambda: _run(workload, sim), repeat)
+    prefix = "sim.%s.%s." % (name, engine)
+    results = {prefix + "seconds": seconds,
+               prefix + "cycles_per_sec": cpu.cycles / seconds,
+               prefix + "peak_growth_kb": _peak_kb() - start_kb}
+    if instructions is not None:
+        results[prefix + "instructions_per_sec"] = instructions / seconds
+    return results
+
+
+def run_benchmarks(names=None, repeat=3):
+    """Run the benchmarks (all, or those in names); returns the metrics."""
+    workloads = [w for w in kWorkloads if not names or w.name in names]
+    metrics = bench_build(repeat)
+    for workload in workloads:
+        metrics.update(bench_parse(workload, repeat))
+    pool = multiprocessing.Pool(1, maxtasksperchild=1)
+    try:
+        for workload in workloads:
+            if workload.run is None:
+                continue
+            instructions = None
+            if workload.run == "break":
+                instructions = pool.apply(_count_instructions,
+                                          (workload.name,))
+            for engine, _ in kEngines:
+                metrics.update(pool.apply(_simulate, (workload.name, engine,
+                                                      repeat, instructions)))
+    finally:
+        pool.close()
+        pool.join()
+    return metrics
+
+
+def _higher_is_better(name):
+    return name.endswith("_per_sec")
+
+def compare(metrics, baseline, threshold=kDefaultThreshold):
+    """
+    Compare metrics with baseline metrics. Returns (name, old, new, change
+    in percent, regressed) for each metric in both, change being positive
+    for an improvement.
+    """
+    rows = []
+    for name in sorted(set(metrics) & set(baseline)):
+        old, new = baseline[name], metrics[name]
+        if not old:
+            continue
+        change = 100.0 * (new - old) / old
+        if not _higher_is_better(name):
+            change = -change
+        rows.append((name, old, new, change, change < -threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the assembler and simulators.")
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help="workloads to run (default: all of %s)"
+                        % ", ".join(w.name for w in kWorkloads))
+    parser.add_argument("-o", "--output", help="write the results to a file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="compare with the results in BASELINE")
+    parser.add_argument("--threshold", type=float, default=kDefaultThreshold,
+                        help="percentage by which a metric has to get worse "
+                        "to count as a regression (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs of each benchmark; the best is kept "
+                        "(default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    metrics = run_benchmarks(args.names, args.repeat)
+    results = {"python": platform.python_version(),
+               "platform": platform.platform(),
+               "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+               "metrics": metrics}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if not args.compare:
+        for name in sorted(metrics):
+            print "%-50s %14.6g" % (name, metrics[name])
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)["metrics"]
+    regressions = 0
+    for name, old, new, change, regressed in compare(metrics, baseline,
+                                                     args.threshold):
+        print "%-50s %14.6g %14.6g %+7.1f%%%s" % (
+            name, old, new, change, "  REGRESSION" if regressed else "")
+        regressions += regressed
+    if regressions:
+        print "%d regression(s) above %g%%" % (regressions, args.threshold)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
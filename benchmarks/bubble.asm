@@ -0,0 +1,48 @@
+; Bubble sort: copy a table of COUNT bytes from flash to SRAM at 0x100
+; and sort it, REPEAT times.
+.EQU COUNT = 128
+.EQU PASSES = 127
+.EQU REPEAT = 8
+
+        LDI r20, REPEAT
+again:  LDI r30, 0x00           ; Z = table (byte address 0x0800)
+        LDI r31, 0x08
+        LDI r26, 0x00           ; X = 0x100
+        LDI r27, 0x01
+        LDI r16, COUNT
+copy:   LPM r0, Z+
+        ST X+, r0
+        DEC r16
+        BRNE copy
+
+        LDI r17, PASSES
+pass:   LDI r26, 0x00
+        LDI r27, 0x01
+        MOV r16, r17
+inner:  LD r0, X+
+        LD r1, X
+        CP r1, r0
+        BRSH ordered
+        ST X, r0
+        ST -X, r1
+        ADIW r26, 1
+ordered:
+        DEC r16
+        BRNE inner
+        DEC r17
+        BRNE pass
+        DEC r20
+        BRNE again
+        BREAK
+
+.CSEG
+.ORG 0x400
+table:
+        .DB 0xf0, 0x5d, 0x9b, 0x66, 0xd1, 0x87, 0x7d, 0xff, 0xb5, 0xd4, 0x6f, 0x9e, 0xa9, 0x26, 0x69, 0xef
+        .DB 0x4b, 0x6c, 0xd2, 0x1d, 0xb2, 0xd5, 0xee, 0x3f, 0x47, 0xa7, 0xc7, 0xa9, 0xb0, 0x66, 0xa6, 0xda
+        .DB 0xd4, 0xa2, 0x6d, 0xd0, 0x75, 0x68, 0x14, 0x73, 0x09, 0x84, 0xa3, 0xd7, 0x39, 0xa9, 0x76, 0x78
+        .DB 0xed, 0xbb, 0x45, 0x67, 0xbc, 0xfc, 0x48, 0x86, 0xc6, 0xac, 0xab, 0xee, 0x56, 0x43, 0xa9, 0x69
+        .DB 0x21, 0x32, 0x58, 0x02, 0x4d, 0xe0, 0x78, 0xb3, 0x75, 0x29, 0x64, 0x91, 0x7a, 0xec, 0x86, 0xf6
+        .DB 0xdf, 0xd4, 0x66, 0x24, 0x9a, 0x9a, 0x8e, 0x45, 0x80, 0x33, 0xfd, 0x6f, 0x64, 0xc6, 0x5a, 0x72
+        .DB 0xa3, 0xb5, 0x17, 0xc1, 0x25, 0x3c, 0x75, 0x1c, 0x40, 0x6b, 0x2c, 0x58, 0x78, 0xf9, 0x54, 0x52
+        .DB 0x2c, 0x40, 0x35, 0x0f, 0x37, 0x5c, 0xa1, 0x00, 0x3e, 0x8f, 0x0e, 0x5d, 0x1f, 0x35, 0x6b, 0x6a
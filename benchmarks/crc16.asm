@@ -0,0 +1,47 @@
+; CRC-16 (polynomial 0xa001, bit by bit) of a 256 byte table in flash,
+; read PASSES times. The CRC is left in r25:r24.
+.EQU PASSES = 32
+
+        CLR r24
+        CLR r25
+        LDI r19, 0x01           ; polynomial
+        LDI r20, 0xa0
+        LDI r21, PASSES
+pass:   LDI r30, 0x00           ; Z = table (byte address 0x0800)
+        LDI r31, 0x08
+        CLR r22                 ; 256 bytes
+byte:   LPM r16, Z+
+        EOR r24, r16
+        LDI r17, 8
+bit:    LSR r25
+        ROR r24
+        BRCC next
+        EOR r24, r19
+        EOR r25, r20
+next:   DEC r17
+        BRNE bit
+        DEC r22
+        BRNE byte
+        DEC r21
+        BRNE pass
+        BREAK
+
+.CSEG
+.ORG 0x400
+table:
+        .DB 0x61, 0xec, 0x5f, 0xf2, 0xa0, 0x8b, 0xe8, 0xe0, 0x6f, 0xcc, 0xe5, 0xd6, 0x44, 0x6b, 0x52, 0x9f
+        .DB 0xcb, 0x64, 0x5b, 0xb6, 0xe9, 0x07, 0x3d, 0xab, 0x01, 0x72, 0xd6, 0x13, 0x6d, 0xed, 0xfe, 0x19
+        .DB 0xdc, 0xaa, 0x05, 0xae, 0x82, 0x50, 0x73, 0x37, 0xdc, 0x22, 0x44, 0x59, 0x0c, 0xad, 0x9d, 0x81
+        .DB 0xfd, 0x52, 0xb9, 0xee, 0xde, 0xfb, 0xa7, 0x51, 0x13, 0x3e, 0x3d, 0xba, 0xd9, 0x5c, 0x30, 0x1b
+        .DB 0xdf, 0x0d, 0x8b, 0x76, 0x3c, 0xa2, 0x46, 0x6c, 0x37, 0xdc, 0x34, 0x88, 0xde, 0x51, 0x76, 0x00
+        .DB 0x3f, 0x65, 0xc1, 0xd0, 0xe4, 0x58, 0x7e, 0x95, 0x8d, 0xb6, 0xe6, 0x39, 0xcf, 0xcb, 0x90, 0xa2
+        .DB 0x74, 0x79, 0xb7, 0x74, 0xd7, 0xef, 0x9e, 0x92, 0x63, 0xef, 0x1b, 0x81, 0xc2, 0x6b, 0x86, 0xd3
+        .DB 0x44, 0xa1, 0x91, 0x44, 0x2f, 0x70, 0xed, 0x8f, 0x97, 0x7e, 0xc7, 0x90, 0x5e, 0xf5, 0xba, 0x0f
+        .DB 0xc0, 0x20, 0x44, 0x33, 0xd8, 0xa5, 0x61, 0x26, 0x82, 0x10, 0x85, 0x60, 0xde, 0x55, 0x62, 0xf1
+        .DB 0x88, 0x23, 0xec, 0x3f, 0x33, 0x89, 0x42, 0xc5, 0x32, 0x72, 0x78, 0x54, 0x97, 0x46, 0xc5, 0x37
+        .DB 0x42, 0xad, 0xd3, 0xa8, 0xaa, 0x78, 0x0a, 0x8e, 0xc3, 0x47, 0x88, 0x57, 0x83, 0x6f, 0x43, 0xdb
+        .DB 0x61, 0x40, 0x42, 0x76, 0x81, 0x0c, 0x38, 0xd8, 0xd7, 0x11, 0xf3, 0x4f, 0x8d, 0xb8, 0xec, 0xb1
+        .DB 0x95, 0xf6, 0xe5, 0x10, 0x91, 0x5f, 0xc4, 0xfd, 0xb8, 0xf8, 0xba, 0x50, 0x21, 0x89, 0x64, 0x5d
+        .DB 0xe1, 0xee, 0xa7, 0x03, 0x48, 0x3a, 0xd8, 0x19, 0x90, 0x29, 0x2a, 0xf5, 0xec, 0x6b, 0x77, 0xa0
+        .DB 0x9a, 0xf9, 0x96, 0x1c, 0x6c, 0xf2, 0x7d, 0x9e, 0xa0, 0x80, 0xa8, 0x14, 0x47, 0x85, 0xb1, 0xb0
+        .DB 0x4d, 0x1b, 0xb2, 0x07, 0xa1, 0xa1, 0x64, 0x5f, 0x91, 0xe8, 0x19, 0x51, 0x33, 0xf7, 0x86, 0xc9
@@ -0,0 +1,28 @@
+; Fill 1024 bytes at 0x100 with a pattern, then copy them to 0x500
+; REPEAT times.
+.EQU REPEAT = 32
+
+        LDI r26, 0x00           ; X = 0x100
+        LDI r27, 0x01
+        LDI r24, 0x00           ; 0x400 bytes
+        LDI r25, 0x04
+        LDI r16, 0x5a
+fill:   ST X+, r16
+        SUBI r16, 0xf9          ; += 7
+        SBIW r24, 1
+        BRNE fill
+
+        LDI r20, REPEAT
+again:  LDI r26, 0x00           ; X = 0x100
+        LDI r27, 0x01
+        LDI r28, 0x00           ; Y = 0x500
+        LDI r29, 0x05
+        LDI r24, 0x00
+        LDI r25, 0x04
+copy:   LD r0, X+
+        ST Y+, r0
+        SBIW r24, 1
+        BRNE copy
+        DEC r20
+        BRNE again
+        BREAK
@@ -0,0 +1,53 @@
+; 16 x 16 -> 32 bit shift-and-add multiply of COUNT pairs of operands,
+; summing the products (mod 2^32) in r5:r4:r3:r2. The operands start at
+; 11 and 7 and go up by 37 and 101.
+.EQU COUNT_LO = 0xd0            ; COUNT = 2000
+.EQU COUNT_HI = 0x07
+
+        CLR r2
+        CLR r3
+        CLR r4
+        CLR r5
+        LDI r16, 11             ; a
+        CLR r17
+        LDI r18, 7              ; b
+        CLR r19
+        LDI r24, COUNT_LO
+        LDI r25, COUNT_HI
+loop:   RCALL mul16
+        ADD r2, r20
+        ADC r3, r21
+        ADC r4, r22
+        ADC r5, r23
+        SUBI r16, 0xdb          ; a += 37
+        SBCI r17, 0xff
+        SUBI r18, 0x9b          ; b += 101
+        SBCI r19, 0xff
+        SBIW r24, 1
+        BRNE loop
+        BREAK
+
+; r23:r22:r21:r20 = r17:r16 * r19:r18, using r12-r15 and r26-r28
+mul16:  CLR r20
+        CLR r21
+        CLR r22
+        CLR r23
+        MOVW r12, r16           ; multiplicand, shifted left
+        CLR r14
+        CLR r15
+        MOVW r26, r18           ; multiplier, shifted right
+        LDI r28, 16
+mbit:   LSR r27
+        ROR r26
+        BRCC mnext
+        ADD r20, r12
+        ADC r21, r13
+        ADC r22, r14
+        ADC r23, r15
+mnext:  LSL r12
+        ROL r13
+        ROL r14
+        ROL r15
+        DEC r28
+        BRNE mbit
+        RET
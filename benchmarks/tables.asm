@@ -0,0 +1,2403 @@
+; A large table of constants: assembler throughput only.
+
+.EQU k_0 = 0x1b
+t_0: .DB k_0, 105, 0x66, $44, 0b01000100, k_0
+        .DW 47618, 0x06ce ; row 0
+        LDI r16, k_0
+.EQU k_1 = 0xe7
+t_1: .DB k_1, 92, 0xd4, $7e, 0b00111111, k_0
+        .DW 44898, 0xe681 ; row 1
+        LDI r17, k_1
+.EQU k_2 = 0xa7
+t_2: .DB k_2, 1, 0xd3, $e2, 0b01100111, k_1
+        .DW 16693, 0x3b6e ; row 2
+        LDI r18, k_2
+.EQU k_3 = 0xd1
+t_3: .DB k_3, 126, 0xca, $fe, 0b11100111, k_2
+        .DW 28968, 0x16a3 ; row 3
+        LDI r19, k_3
+.EQU k_4 = 0xe5
+t_4: .DB k_4, 19, 0x89, $3b, 0b10111101, k_3
+        .DW 47348, 0x23f8 ; row 4
+        LDI r20, k_4
+.EQU k_5 = 0xa7
+t_5: .DB k_5, 123, 0xf3, $8c, 0b11010000, k_4
+        .DW 49179, 0x83c0 ; row 5
+        LDI r21, k_5
+.EQU k_6 = 0x39
+t_6: .DB k_6, 4, 0x7f, $db, 0b01010011, k_5
+        .DW 19871, 0x60af ; row 6
+        LDI r22, k_6
+.EQU k_7 = 0x07
+t_7: .DB k_7, 3, 0x8a, $1e, 0b00110110, k_6
+        .DW 43805, 0x5347 ; row 7
+        LDI r23, k_7
+.EQU k_8 = 0x75
+t_8: .DB k_8, 60, 0x8c, $26, 0b01001111, k_7
+        .DW 5436, 0x802f ; row 8
+        LDI r24, k_8
+.EQU k_9 = 0xb7
+t_9: .DB k_9, 21, 0xbd, $57, 0b00110111, k_8
+        .DW 47211, 0x816b ; row 9
+        LDI r25, k_9
+.EQU k_10 = 0x06
+t_10: .DB k_10, 110, 0xe4, $7c, 0b00010010, k_9
+        .DW 18599, 0xb45f ; row 10
+        LDI r26, k_10
+.EQU k_11 = 0x88
+t_11: .DB k_11, 0, 0xeb, $7c, 0b10111011, k_10
+        .DW 57502, 0x1dae ; row 11
+        LDI r27, k_11
+.EQU k_12 = 0x4a
+t_12: .DB k_12, 53, 0xac, $22, 0b00111110, k_11
+        .DW 60267, 0x2917 ; row 12
+        LDI r28, k_12
+.EQU k_13 = 0x2b
+t_13: .DB k_13, 58, 0x01, $29, 0b01010010, k_12
+        .DW 61182, 0x6b81 ; row 13
+        LDI r29, k_13
+.EQU k_14 = 0x65
+t_14: .DB k_14, 59, 0xf1, $d1, 0b00101000, k_13
+        .DW 54736, 0xc494 ; row 14
+        LDI r30, k_14
+.EQU k_15 = 0x88
+t_15: .DB k_15, 36, 0x7c, $b8, 0b01100100, k_14
+        .DW 20335, 0xf5b3 ; row 15
+        LDI r31, k_15
+.EQU k_16 = 0x0a
+t_16: .DB k_16, 32, 0x8d, $d3, 0b01111010, k_15
+        .DW 57134, 0xcc2e ; row 16
+        LDI r16, k_16
+.EQU k_17 = 0x50
+t_17: .DB k_17, 98, 0xc0, $e3, 0b00111100, k_16
+        .DW 35401, 0x8605 ; row 17
+        LDI r17, k_17
+.EQU k_18 = 0x4b
+t_18: .DB k_18, 83, 0x3c, $b8, 0b00101001, k_17
+        .DW 45451, 0xfcb9 ; row 18
+        LDI r18, k_18
+.EQU k_19 = 0x3e
+t_19: .DB k_19, 49, 0x40, $47, 0b11101011, k_18
+        .DW 13798, 0xcc4a ; row 19
+        LDI r19, k_19
+.EQU k_20 = 0xee
+t_20: .DB k_20, 104, 0xe0, $f9, 0b10100101, k_19
+        .DW 41924, 0x79b1 ; row 20
+        LDI r20, k_20
+.EQU k_21 = 0x58
+t_21: .DB k_21, 56, 0xd3, $0d, 0b11101011, k_20
+        .DW 48024, 0x16b3 ; row 21
+        LDI r21, k_21
+.EQU k_22 = 0x9c
+t_22: .DB k_22, 41, 0x8c, $76, 0b01110000, k_21
+        .DW 57260, 0xec26 ; row 22
+        LDI r22, k_22
+.EQU k_23 = 0xb0
+t_23: .DB k_23, 22, 0xeb, $99, 0b10101100, k_22
+        .DW 2152, 0x66e2 ; row 23
+        LDI r23, k_23
+.EQU k_24 = 0xf3
+t_24: .DB k_24, 52, 0x90, $e0, 0b11011010, k_23
+        .DW 10928, 0x4a9b ; row 24
+        LDI r24, k_24
+.EQU k_25 = 0xf7
+t_25: .DB k_25, 107, 0x99, $8a, 0b10101111, k_24
+        .DW 11924, 0x4e7d ; row 25
+        LDI r25, k_25
+.EQU k_26 = 0x60
+t_26: .DB k_26, 21, 0x10, $fe, 0b01101111, k_25
+        .DW 21466, 0x503e ; row 26
+        LDI r26, k_26
+.EQU k_27 = 0x2a
+t_27: .DB k_27, 65, 0xcc, $4d, 0b10100100, k_26
+        .DW 40798, 0xa77a ; row 27
+        LDI r27, k_27
+.EQU k_28 = 0xae
+t_28: .DB k_28, 125, 0x5f, $e1, 0b01111011, k_27
+        .DW 50950, 0xe69c ; row 28
+        LDI r28, k_28
+.EQU k_29 = 0x28
+t_29: .DB k_29, 11, 0x13, $d4, 0b10010001, k_28
+        .DW 22020, 0x685c ; row 29
+        LDI r29, k_29
+.EQU k_30 = 0x17
+t_30: .DB k_30, 27, 0x47, $6a, 0b00101001, k_29
+        .DW 24490, 0x3ca1 ; row 30
+        LDI r30, k_30
+.EQU k_31 = 0x34
+t_31: .DB k_31, 86, 0x08, $34, 0b01110110, k_30
+        .DW 60338, 0x6276 ; row 31
+        LDI r31, k_31
+.EQU k_32 = 0xf4
+t_32: .DB k_32, 51, 0x05, $9c, 0b10110100, k_31
+        .DW 50778, 0x8f7a ; row 32
+        LDI r16, k_32
+.EQU k_33 = 0x0e
+t_33: .DB k_33, 19, 0xe4, $bd, 0b10100010, k_32
+        .DW 53335, 0x667a ; row 33
+        LDI r17, k_33
+.EQU k_34 = 0xe8
+t_34: .DB k_34, 38, 0x2f, $93, 0b00111111, k_33
+        .DW 21437, 0x72b9 ; row 34
+        LDI r18, k_34
+.EQU k_35 = 0xba
+t_35: .DB k_35, 63, 0xcb, $55, 0b10110101, k_34
+        .DW 28225, 0x435b ; row 35
+        LDI r19, k_35
+.EQU k_36 = 0xc5
+t_36: .DB k_36, 18, 0x5e, $7e, 0b00001101, k_35
+        .DW 39311, 0x387d ; row 36
+        LDI r20, k_36
+.EQU k_37 = 0x7f
+t_37: .DB k_37, 127, 0xae, $d7, 0b01101110, k_36
+        .DW 6503, 0x1e8f ; row 37
+        LDI r21, k_37
+.EQU k_38 = 0x8c
+t_38: .DB k_38, 55, 0xa0, $e4, 0b01101111, k_37
+        .DW 1087, 0x76aa ; row 38
+        LDI r22, k_38
+.EQU k_39 = 0x2b
+t_39: .DB k_39, 61, 0xfc, $81, 0b11110111, k_38
+        .DW 22740, 0xbc1b ; row 39
+        LDI r23, k_39
+.EQU k_40 = 0x1b
+t_40: .DB k_40, 9, 0xe6, $d2, 0b10100011, k_39
+        .DW 57195, 0xc989 ; row 40
+        LDI r24, k_40
+.EQU k_41 = 0x20
+t_41: .DB k_41, 20, 0x58, $a0, 0b10000111, k_40
+        .DW 17150, 0x328c ; row 41
+        LDI r25, k_41
+.EQU k_42 = 0xbc
+t_42: .DB k_42, 127, 0x75, $08, 0b11000010, k_41
+        .DW 23836, 0xc0cb ; row 42
+        LDI r26, k_42
+.EQU k_43 = 0xbf
+t_43: .DB k_43, 35, 0x1f, $c4, 0b01011101, k_42
+        .DW 47306, 0x28fa ; row 43
+        LDI r27, k_43
+.EQU k_44 = 0x72
+t_44: .DB k_44, 60, 0x8d, $45, 0b10011100, k_43
+        .DW 914, 0xf621 ; row 44
+        LDI r28, k_44
+.EQU k_45 = 0xbe
+t_45: .DB k_45, 111, 0xd7, $b7, 0b00011010, k_44
+        .DW 1858, 0x8ecb ; row 45
+        LDI r29, k_45
+.EQU k_46 = 0x15
+t_46: .DB k_46, 125, 0x1b, $60, 0b01100000, k_45
+        .DW 31549, 0xf24b ; row 46
+        LDI r30, k_46
+.EQU k_47 = 0x5c
+t_47: .DB k_47, 3, 0x26, $32, 0b00001100, k_46
+        .DW 14949, 0xfa65 ; row 47
+        LDI r31, k_47
+.EQU k_48 = 0x1a
+t_48: .DB k_48, 79, 0x93, $c2, 0b00011110, k_47
+        .DW 4967, 0x3c57 ; row 48
+        LDI r16, k_48
+.EQU k_49 = 0x7e
+t_49: .DB k_49, 104, 0x24, $1c, 0b00100000, k_48
+        .DW 45024, 0x2abd ; row 49
+        LDI r17, k_49
+.EQU k_50 = 0x31
+t_50: .DB k_50, 8, 0xda, $82, 0b00101000, k_49
+        .DW 14195, 0xdb31 ; row 50
+        LDI r18, k_50
+.EQU k_51 = 0x16
+t_51: .DB k_51, 122, 0xf3, $ed, 0b00111000, k_50
+        .DW 50014, 0xc47e ; row 51
+        LDI r19, k_51
+.EQU k_52 = 0x48
+t_52: .DB k_52, 48, 0xc2, $5a, 0b11111111, k_51
+        .DW 19621, 0x673c ; row 52
+        LDI r20, k_52
+.EQU k_53 = 0x6c
+t_53: .DB k_53, 12, 0x97, $98, 0b11001001, k_52
+        .DW 2860, 0xe3ab ; row 53
+        LDI r21, k_53
+.EQU k_54 = 0xb8
+t_54: .DB k_54, 7, 0xfc, $1c, 0b00000110, k_53
+        .DW 37525, 0xa5f9 ; row 54
+        LDI r22, k_54
+.EQU k_55 = 0x42
+t_55: .DB k_55, 93, 0x6f, $e0, 0b00001111, k_54
+        .DW 16508, 0x992a ; row 55
+        LDI r23, k_55
+.EQU k_56 = 0x65
+t_56: .DB k_56, 101, 0x89, $6e, 0b11100100, k_55
+        .DW 27362, 0x7133 ; row 56
+        LDI r24, k_56
+.EQU k_57 = 0xf8
+t_57: .DB k_57, 8, 0x02, $35, 0b11001010, k_56
+        .DW 7581, 0x03cc ; row 57
+        LDI r25, k_57
+.EQU k_58 = 0xde
+t_58: .DB k_58, 61, 0x5c, $82, 0b11011011, k_57
+        .DW 63680, 0xdf31 ; row 58
+        LDI r26, k_58
+.EQU k_59 = 0x83
+t_59: .DB k_59, 13, 0xe6, $15, 0b01010111, k_58
+        .DW 61195, 0xb4ee ; row 59
+        LDI r27, k_59
+.EQU k_60 = 0x36
+t_60: .DB k_60, 127, 0xdf, $66, 0b01011111, k_59
+        .DW 4762, 0xc98d ; row 60
+        LDI r28, k_60
+.EQU k_61 = 0xa3
+t_61: .DB k_61, 18, 0xa7, $a9, 0b11011010, k_60
+        .DW 38529, 0xcd68 ; row 61
+        LDI r29, k_61
+.EQU k_62 = 0x37
+t_62: .DB k_62, 79, 0xf0, $21, 0b10110011, k_61
+        .DW 55629, 0xf93d ; row 62
+        LDI r30, k_62
+.EQU k_63 = 0x2f
+t_63: .DB k_63, 74, 0xec, $b0, 0b11001111, k_62
+        .DW 7386, 0x2c1f ; row 63
+        LDI r31, k_63
+.EQU k_64 = 0x13
+t_64: .DB k_64, 115, 0xbf, $f5, 0b01101100, k_63
+        .DW 1435, 0x214e ; row 64
+        LDI r16, k_64
+.EQU k_65 = 0x2a
+t_65: .DB k_65, 23, 0x11, $b2, 0b10101011, k_64
+        .DW 31528, 0x34dc ; row 65
+        LDI r17, k_65
+.EQU k_66 = 0x11
+t_66: .DB k_66, 0, 0x27, $24, 0b00110110, k_65
+        .DW 48918, 0x0f2e ; row 66
+        LDI r18, k_66
+.EQU k_67 = 0x1a
+t_67: .DB k_67, 48, 0x8e, $8d, 0b00000111, k_66
+        .DW 55937, 0xf439 ; row 67
+        LDI r19, k_67
+.EQU k_68 = 0x31
+t_68: .DB k_68, 111, 0xf0, $a2, 0b10111011, k_67
+        .DW 31355, 0xec41 ; row 68
+        LDI r20, k_68
+.EQU k_69 = 0xd3
+t_69: .DB k_69, 24, 0xe3, $2d, 0b00011001, k_68
+        .DW 61802, 0x3884 ; row 69
+        LDI r21, k_69
+.EQU k_70 = 0xe0
+t_70: .DB k_70, 5, 0x57, $5d, 0b01011100, k_69
+        .DW 22821, 0x61d7 ; row 70
+        LDI r22, k_70
+.EQU k_71 = 0x29
+t_71: .DB k_71, 91, 0x15, $77, 0b11000011, k_70
+        .DW 248, 0x3603 ; row 71
+        LDI r23, k_71
+.EQU k_72 = 0xe2
+t_72: .DB k_72, 7, 0xc8, $1d, 0b10110011, k_71
+        .DW 47924, 0xd679 ; row 72
+        LDI r24, k_72
+.EQU k_73 = 0x85
+t_73: .DB k_73, 95, 0x6f, $f8, 0b11010011, k_72
+        .DW 19605, 0x065e ; row 73
+        LDI r25, k_73
+.EQU k_74 = 0x46
+t_74: .DB k_74, 76, 0x89, $be, 0b11101101, k_73
+        .DW 54049, 0x80e9 ; row 74
+        LDI r26, k_74
+.EQU k_75 = 0x7d
+t_75: .DB k_75, 40, 0x28, $c6, 0b00001101, k_74
+        .DW 38503, 0xcafb ; row 75
+        LDI r27, k_75
+.EQU k_76 = 0x26
+t_76: .DB k_76, 28, 0x9e, $ea, 0b00010110, k_75
+        .DW 52749, 0xc3b8 ; row 76
+        LDI r28, k_76
+.EQU k_77 = 0xa4
+t_77: .DB k_77, 36, 0x3a, $9a, 0b00110000, k_76
+        .DW 31567, 0xe678 ; row 77
+        LDI r29, k_77
+.EQU k_78 = 0x14
+t_78: .DB k_78, 85, 0xad, $e5, 0b11011111, k_77
+        .DW 18925, 0xb87b ; row 78
+        LDI r30, k_78
+.EQU k_79 = 0xde
+t_79: .DB k_79, 99, 0xc3, $e6, 0b10110100, k_78
+        .DW 15434, 0xdb23 ; row 79
+        LDI r31, k_79
+.EQU k_80 = 0x6d
+t_80: .DB k_80, 90, 0x60, $74, 0b10101100, k_79
+        .DW 48213, 0x6d9d ; row 80
+        LDI r16, k_80
+.EQU k_81 = 0x4e
+t_81: .DB k_81, 47, 0xf0, $76, 0b10110111, k_80
+        .DW 48904, 0x4c3a ; row 81
+        LDI r17, k_81
+.EQU k_82 = 0x05
+t_82: .DB k_82, 118, 0x6c, $04, 0b10110011, k_81
+        .DW 25752, 0x7fd3 ; row 82
+        LDI r18, k_82
+.EQU k_83 = 0xd9
+t_83: .DB k_83, 80, 0xa9, $13, 0b11100110, k_82
+        .DW 64422, 0xea16 ; row 83
+        LDI r19, k_83
+.EQU k_84 = 0xc8
+t_84: .DB k_84, 5, 0x4c, $7d, 0b00000101, k_83
+        .DW 65308, 0xba7a ; row 84
+        LDI r20, k_84
+.EQU k_85 = 0x5e
+t_85: .DB k_85, 79, 0x1b, $b0, 0b10010110, k_84
+        .DW 36683, 0x57c5 ; row 85
+        LDI r21, k_85
+.EQU k_86 = 0x5c
+t_86: .DB k_86, 81, 0xb9, $6b, 0b01010001, k_85
+        .DW 61451, 0x0da2 ; row 86
+        LDI r22, k_86
+.EQU k_87 = 0x29
+t_87: .DB k_87, 26, 0x2c, $31, 0b10111001, k_86
+        .DW 43844, 0xea59 ; row 87
+        LDI r23, k_87
+.EQU k_88 = 0xe0
+t_88: .DB k_88, 30, 0xb9, $9a, 0b01001100, k_87
+        .DW 57133, 0xdf2d ; row 88
+        LDI r24, k_88
+.EQU k_89 = 0x15
+t_89: .DB k_89, 35, 0x28, $ac, 0b10100010, k_88
+        .DW 3239, 0x6e41 ; row 89
+        LDI r25, k_89
+.EQU k_90 = 0x40
+t_90: .DB k_90, 25, 0x2f, $5f, 0b11011010, k_89
+        .DW 15810, 0xd7e1 ; row 90
+        LDI r26, k_90
+.EQU k_91 = 0x9e
+t_91: .DB k_91, 12, 0x36, $91, 0b00101001, k_90
+        .DW 31320, 0xad93 ; row 91
+        LDI r27, k_91
+.EQU k_92 = 0x91
+t_92: .DB k_92, 19, 0x13, $29, 0b00111010, k_91
+        .DW 5671, 0x9665 ; row 92
+        LDI r28, k_92
+.EQU k_93 = 0x2e
+t_93: .DB k_93, 33, 0x1c, $fd, 0b11110100, k_92
+        .DW 24667, 0x326c ; row 93
+        LDI r29, k_93
+.EQU k_94 = 0xb8
+t_94: .DB k_94, 2, 0x7b, $4d, 0b10011110, k_93
+        .DW 8710, 0x362f ; row 94
+        LDI r30, k_94
+.EQU k_95 = 0x99
+t_95: .DB k_95, 70, 0xc1, $80, 0b00101010, k_94
+        .DW 2472, 0xaddc ; row 95
+        LDI r31, k_95
+.EQU k_96 = 0x68
+t_96: .DB k_96, 19, 0x95, $37, 0b11101101, k_95
+        .DW 9662, 0xf05f ; row 96
+        LDI r16, k_96
+.EQU k_97 = 0x96
+t_97: .DB k_97, 36, 0x14, $c9, 0b00010100, k_96
+        .DW 61196, 0x873d ; row 97
+        LDI r17, k_97
+.EQU k_98 = 0xce
+t_98: .DB k_98, 48, 0xb2, $dd, 0b00010011, k_97
+        .DW 24376, 0x9cf4 ; row 98
+        LDI r18, k_98
+.EQU k_99 = 0x09
+t_99: .DB k_99, 127, 0x40, $db, 0b11110111, k_98
+        .DW 60089, 0xf57d ; row 99
+        LDI r19, k_99
+.EQU k_100 = 0x4a
+t_100: .DB k_100, 29, 0xae, $87, 0b00010100, k_99
+        .DW 26903, 0x3aec ; row 100
+        LDI r20, k_100
+.EQU k_101 = 0x63
+t_101: .DB k_101, 107, 0xbe, $ca, 0b00000001, k_100
+        .DW 1750, 0x3f89 ; row 101
+        LDI r21, k_101
+.EQU k_102 = 0xc8
+t_102: .DB k_102, 68, 0xb1, $f4, 0b01001100, k_101
+        .DW 32056, 0x99fc ; row 102
+        LDI r22, k_102
+.EQU k_103 = 0x62
+t_103: .DB k_103, 98, 0x0d, $df, 0b01001010, k_102
+        .DW 13667, 0x759e ; row 103
+        LDI r23, k_103
+.EQU k_104 = 0x19
+t_104: .DB k_104, 47, 0x75, $c1, 0b01010001, k_103
+        .DW 40288, 0x3152 ; row 104
+        LDI r24, k_104
+.EQU k_105 = 0xf2
+t_105: .DB k_105, 80, 0x8d, $23, 0b10101100, k_104
+        .DW 27896, 0x786c ; row 105
+        LDI r25, k_105
+.EQU k_106 = 0xf1
+t_106: .DB k_106, 107, 0x69, $66, 0b10111100, k_105
+        .DW 34714, 0x1e5d ; row 106
+        LDI r26, k_106
+.EQU k_107 = 0x26
+t_107: .DB k_107, 23, 0xec, $26, 0b11011011, k_106
+        .DW 33761, 0x5678 ; row 107
+        LDI r27, k_107
+.EQU k_108 = 0x34
+t_108: .DB k_108, 28, 0xcc, $34, 0b01001001, k_107
+        .DW 25458, 0xd3e5 ; row 108
+        LDI r28, k_108
+.EQU k_109 = 0x93
+t_109: .DB k_109, 60, 0xa9, $a0, 0b00110101, k_108
+        .DW 42798, 0x60c7 ; row 109
+        LDI r29, k_109
+.EQU k_110 = 0xae
+t_110: .DB k_110, 120, 0x4a, $43, 0b11000010, k_109
+        .DW 3321, 0xad30 ; row 110
+        LDI r30, k_110
+.EQU k_111 = 0x77
+t_111: .DB k_111, 64, 0x82, $10, 0b11111110, k_110
+        .DW 34869, 0x77aa ; row 111
+        LDI r31, k_111
+.EQU k_112 = 0x9a
+t_112: .DB k_112, 12, 0x19, $e5, 0b01101001, k_111
+        .DW 5768, 0x3293 ; row 112
+        LDI r16, k_112
+.EQU k_113 = 0x58
+t_113: .DB k_113, 41, 0x0b, $07, 0b01010010, k_112
+        .DW 53941, 0x3319 ; row 113
+        LDI r17, k_113
+.EQU k_114 = 0x59
+t_114: .DB k_114, 73, 0x02, $89, 0b10110100, k_113
+        .DW 47789, 0x2757 ; row 114
+        LDI r18, k_114
+.EQU k_115 = 0x2c
+t_115: .DB k_115, 71, 0x3c, $df, 0b11111110, k_114
+        .DW 14468, 0xd24b ; row 115
+        LDI r19, k_115
+.EQU k_116 = 0xba
+t_116: .DB k_116, 28, 0xeb, $5e, 0b11110100, k_115
+        .DW 61208, 0xe36c ; row 116
+        LDI r20, k_116
+.EQU k_117 = 0x03
+t_117: .DB k_117, 25, 0x6c, $48, 0b01111101, k_116
+        .DW 2294, 0x19d2 ; row 117
+        LDI r21, k_117
+.EQU k_118 = 0xfc
+t_118: .DB k_118, 29, 0x49, $c6, 0b00001101, k_117
+        .DW 21742, 0xbebf ; row 118
+        LDI r22, k_118
+.EQU k_119 = 0xbd
+t_119: .DB k_119, 0, 0xf7, $5f, 0b01001101, k_118
+        .DW 21551, 0x3fb3 ; row 119
+        LDI r23, k_119
+.EQU k_120 = 0x6d
+t_120: .DB k_120, 38, 0x1d, $05, 0b11110010, k_119
+        .DW 60366, 0x8abf ; row 120
+        LDI r24, k_120
+.EQU k_121 = 0xc4
+t_121: .DB k_121, 78, 0x28, $c0, 0b11100110, k_120
+        .DW 12603, 0x7292 ; row 121
+        LDI r25, k_121
+.EQU k_122 = 0xb3
+t_122: .DB k_122, 35, 0xc1, $33, 0b10010010, k_121
+        .DW 4027, 0x6a62 ; row 122
+        LDI r26, k_122
+.EQU k_123 = 0x18
+t_123: .DB k_123, 115, 0x38, $36, 0b00110000, k_122
+        .DW 24788, 0x0d1d ; row 123
+        LDI r27, k_123
+.EQU k_124 = 0x7d
+t_124: .DB k_124, 41, 0x8a, $93, 0b11011100, k_123
+        .DW 18972, 0x908c ; row 124
+        LDI r28, k_124
+.EQU k_125 = 0xb7
+t_125: .DB k_125, 57, 0x04, $25, 0b00110010, k_124
+        .DW 54240, 0x5f79 ; row 125
+        LDI r29, k_125
+.EQU k_126 = 0x04
+t_126: .DB k_126, 101, 0xd6, $6d, 0b01010101, k_125
+        .DW 9646, 0x1d2f ; row 126
+        LDI r30, k_126
+.EQU k_127 = 0xd9
+t_127: .DB k_127, 29, 0x42, $ee, 0b10011000, k_126
+        .DW 25278, 0x96b6 ; row 127
+        LDI r31, k_127
+.EQU k_128 = 0x3c
+t_128: .DB k_128, 14, 0xad, $0d, 0b11011110, k_127
+        .DW 23475, 0xf460 ; row 128
+        LDI r16, k_128
+.EQU k_129 = 0x9e
+t_129: .DB k_129, 30, 0xd4, $91, 0b00111011, k_128
+        .DW 27766, 0xf50a ; row 129
+        LDI r17, k_129
+.EQU k_130 = 0xed
+t_130: .DB k_130, 45, 0x85, $a6, 0b00110010, k_129
+        .DW 60156, 0xc110 ; row 130
+        LDI r18, k_130
+.EQU k_131 = 0x33
+t_131: .DB k_131, 41, 0x77, $db, 0b11010111, k_130
+        .DW 13127, 0x4457 ; row 131
+        LDI r19, k_131
+.EQU k_132 = 0x1a
+t_132: .DB k_132, 43, 0xb9, $c1, 0b10101011, k_131
+        .DW 37733, 0x6d95 ; row 132
+        LDI r20, k_132
+.EQU k_133 = 0x2c
+t_133: .DB k_133, 123, 0x0d, $99, 0b01110110, k_132
+        .DW 10101, 0x7f0a ; row 133
+        LDI r21, k_133
+.EQU k_134 = 0xe6
+t_134: .DB k_134, 12, 0xe9, $d1, 0b00010011, k_133
+        .DW 38894, 0xecca ; row 134
+        LDI r22, k_134
+.EQU k_135 = 0x2f
+t_135: .DB k_135, 80, 0x7b, $61, 0b01011110, k_134
+        .DW 9550, 0x25d5 ; row 135
+        LDI r23, k_135
+.EQU k_136 = 0xed
+t_136: .DB k_136, 11, 0x8c, $52, 0b11100000, k_135
+        .DW 35948, 0x6029 ; row 136
+        LDI r24, k_136
+.EQU k_137 = 0x02
+t_137: .DB k_137, 82, 0xdc, $2d, 0b00100001, k_136
+        .DW 56425, 0xa302 ; row 137
+        LDI r25, k_137
+.EQU k_138 = 0x91
+t_138: .DB k_138, 37, 0x91, $cd, 0b10011101, k_137
+        .DW 15582, 0xda44 ; row 138
+        LDI r26, k_138
+.EQU k_139 = 0x76
+t_139: .DB k_139, 102, 0x32, $4c, 0b11110100, k_138
+        .DW 61932, 0x841e ; row 139
+        LDI r27, k_139
+.EQU k_140 = 0x64
+t_140: .DB k_140, 74, 0x34, $41, 0b01000001, k_139
+        .DW 1175, 0x779c ; row 140
+        LDI r28, k_140
+.EQU k_141 = 0x5d
+t_141: .DB k_141, 74, 0xfe, $d9, 0b01010111, k_140
+        .DW 63495, 0x104d ; row 141
+        LDI r29, k_141
+.EQU k_142 = 0x3e
+t_142: .DB k_142, 84, 0x31, $a1, 0b01100100, k_141
+        .DW 47488, 0x4c07 ; row 142
+        LDI r30, k_142
+.EQU k_143 = 0x02
+t_143: .DB k_143, 54, 0x0f, $f5, 0b11010011, k_142
+        .DW 82, 0x40d2 ; row 143
+        LDI r31, k_143
+.EQU k_144 = 0x05
+t_144: .DB k_144, 89, 0x7a, $9d, 0b11001010, k_143
+        .DW 43853, 0x3ec8 ; row 144
+        LDI r16, k_144
+.EQU k_145 = 0xf7
+t_145: .DB k_145, 53, 0x71, $f9, 0b00001111, k_144
+        .DW 50298, 0x34dd ; row 145
+        LDI r17, k_145
+.EQU k_146 = 0x5c
+t_146: .DB k_146, 40, 0x55, $c0, 0b00100110, k_145
+        .DW 51193, 0xff8d ; row 146
+        LDI r18, k_146
+.EQU k_147 = 0xf7
+t_147: .DB k_147, 38, 0xdf, $08, 0b00010010, k_146
+        .DW 19565, 0xa6b8 ; row 147
+        LDI r19, k_147
+.EQU k_148 = 0x7d
+t_148: .DB k_148, 82, 0xb4, $d0, 0b00011010, k_147
+        .DW 45258, 0x32b9 ; row 148
+        LDI r20, k_148
+.EQU k_149 = 0x80
+t_149: .DB k_149, 125, 0xcc, $fb, 0b11101000, k_148
+        .DW 26634, 0x1719 ; row 149
+        LDI r21, k_149
+.EQU k_150 = 0x4a
+t_150: .DB k_150, 73, 0x8d, $d1, 0b01101000, k_149
+        .DW 1228, 0xd33a ; row 150
+        LDI r22, k_150
+.EQU k_151 = 0x1e
+t_151: .DB k_151, 66, 0x1e, $91, 0b11001110, k_150
+        .DW 17540, 0xfbe4 ; row 151
+        LDI r23, k_151
+.EQU k_152 = 0xd7
+t_152: .DB k_152, 90, 0x18, $22, 0b00111111, k_151
+        .DW 7748, 0x1e8a ; row 152
+        LDI r24, k_152
+.EQU k_153 = 0x9c
+t_153: .DB k_153, 88, 0x7b, $26, 0b00100000, k_152
+        .DW 1016, 0xdb53 ; row 153
+        LDI r25, k_153
+.EQU k_154 = 0xc8
+t_154: .DB k_154, 25, 0xeb, $81, 0b01001001, k_153
+        .DW 32207, 0x24e9 ; row 154
+        LDI r26, k_154
+.EQU k_155 = 0xf0
+t_155: .DB k_155, 82, 0xdd, $ea, 0b11000000, k_154
+        .DW 15898, 0x2843 ; row 155
+        LDI r27, k_155
+.EQU k_156 = 0x83
+t_156: .DB k_156, 21, 0xec, $a6, 0b11101001, k_155
+        .DW 24542, 0x5dd3 ; row 156
+        LDI r28, k_156
+.EQU k_157 = 0x3b
+t_157: .DB k_157, 77, 0xca, $24, 0b10001010, k_156
+        .DW 21385, 0x4f2a ; row 157
+        LDI r29, k_157
+.EQU k_158 = 0xc9
+t_158: .DB k_158, 60, 0x14, $eb, 0b00110010, k_157
+        .DW 54033, 0xa042 ; row 158
+        LDI r30, k_158
+.EQU k_159 = 0x86
+t_159: .DB k_159, 71, 0x39, $68, 0b00100110, k_158
+        .DW 61026, 0x0dc2 ; row 159
+        LDI r31, k_159
+.EQU k_160 = 0xc2
+t_160: .DB k_160, 27, 0x86, $e2, 0b10101111, k_159
+        .DW 60907, 0xda40 ; row 160
+        LDI r16, k_160
+.EQU k_161 = 0xe5
+t_161: .DB k_161, 73, 0x05, $4d, 0b01011101, k_160
+        .DW 52721, 0x69ed ; row 161
+        LDI r17, k_161
+.EQU k_162 = 0xfd
+t_162: .DB k_162, 61, 0x70, $0b, 0b00101001, k_161
+        .DW 63087, 0x1af5 ; row 162
+        LDI r18, k_162
+.EQU k_163 = 0xcf
+t_163: .DB k_163, 110, 0xe0, $73, 0b11100000, k_162
+        .DW 9885, 0xa64f ; row 163
+        LDI r19, k_163
+.EQU k_164 = 0x55
+t_164: .DB k_164, 113, 0x30, $90, 0b00100010, k_163
+        .DW 51283, 0x7a0c ; row 164
+        LDI r20, k_164
+.EQU k_165 = 0xa2
+t_165: .DB k_165, 19, 0xf4, $24, 0b00100100, k_164
+        .DW 46389, 0x3f90 ; row 165
+        LDI r21, k_165
+.EQU k_166 = 0xca
+t_166: .DB k_166, 103, 0xc1, $69, 0b11110110, k_165
+        .DW 2509, 0xadf8 ; row 166
+        LDI r22, k_166
+.EQU k_167 = 0xc9
+t_167: .DB k_167, 29, 0xe8, $47, 0b11001110, k_166
+        .DW 23143, 0xc3f5 ; row 167
+        LDI r23, k_167
+.EQU k_168 = 0xb3
+t_168: .DB k_168, 98, 0x3a, $b3, 0b00001000, k_167
+        .DW 26458, 0xe2d3 ; row 168
+        LDI r24, k_168
+.EQU k_169 = 0x4b
+t_169: .DB k_169, 42, 0xbe, $a6, 0b00000011, k_168
+        .DW 601, 0x47c2 ; row 169
+        LDI r25, k_169
+.EQU k_170 = 0x1b
+t_170: .DB k_170, 116, 0xa1, $8d, 0b00011010, k_169
+        .DW 60681, 0xf9b0 ; row 170
+        LDI r26, k_170
+.EQU k_171 = 0xc8
+t_171: .DB k_171, 96, 0x76, $83, 0b01010111, k_170
+        .DW 25664, 0xef47 ; row 171
+        LDI r27, k_171
+.EQU k_172 = 0x51
+t_172: .DB k_172, 120, 0x21, $76, 0b10001110, k_171
+        .DW 54434, 0x6475 ; row 172
+        LDI r28, k_172
+.EQU k_173 = 0x4b
+t_173: .DB k_173, 30, 0x0d, $48, 0b00110100, k_172
+        .DW 37951, 0x9d28 ; row 173
+        LDI r29, k_173
+.EQU k_174 = 0xbd
+t_174: .DB k_174, 120, 0x1e, $b0, 0b11011101, k_173
+        .DW 13464, 0x707c ; row 174
+        LDI r30, k_174
+.EQU k_175 = 0x54
+t_175: .DB k_175, 65, 0x8d, $6f, 0b01001011, k_174
+        .DW 63422, 0xd62f ; row 175
+        LDI r31, k_175
+.EQU k_176 = 0x33
+t_176: .DB k_176, 91, 0x2e, $7e, 0b01111110, k_175
+        .DW 5708, 0x9366 ; row 176
+        LDI r16, k_176
+.EQU k_177 = 0x88
+t_177: .DB k_177, 126, 0x56, $fd, 0b11101110, k_176
+        .DW 46002, 0xfe5f ; row 177
+        LDI r17, k_177
+.EQU k_178 = 0xa8
+t_178: .DB k_178, 18, 0x17, $7b, 0b01110000, k_177
+        .DW 14092, 0xc5ad ; row 178
+        LDI r18, k_178
+.EQU k_179 = 0x8c
+t_179: .DB k_179, 65, 0xd9, $67, 0b10111101, k_178
+        .DW 38845, 0xedd7 ; row 179
+        LDI r19, k_179
+.EQU k_180 = 0x5d
+t_180: .DB k_180, 19, 0xf2, $53, 0b11101011, k_179
+        .DW 4744, 0x86b6 ; row 180
+        LDI r20, k_180
+.EQU k_181 = 0x03
+t_181: .DB k_181, 18, 0x6a, $c8, 0b01111000, k_180
+        .DW 52311, 0xbd83 ; row 181
+        LDI r21, k_181
+.EQU k_182 = 0x0e
+t_182: .DB k_182, 71, 0xac, $26, 0b01001101, k_181
+        .DW 5423, 0x6af8 ; row 182
+        LDI r22, k_182
+.EQU k_183 = 0xab
+t_183: .DB k_183, 38, 0x49, $ad, 0b11100011, k_182
+        .DW 37393, 0x6c26 ; row 183
+        LDI r23, k_183
+.EQU k_184 = 0x7b
+t_184: .DB k_184, 116, 0xd6, $a2, 0b00010111, k_183
+        .DW 31368, 0xb751 ; row 184
+        LDI r24, k_184
+.EQU k_185 = 0x12
+t_185: .DB k_185, 38, 0xad, $fa, 0b11101111, k_184
+        .DW 52516, 0xa864 ; row 185
+        LDI r25, k_185
+.EQU k_186 = 0x5b
+t_186: .DB k_186, 115, 0x2c, $6d, 0b01110101, k_185
+        .DW 64483, 0xfa51 ; row 186
+        LDI r26, k_186
+.EQU k_187 = 0x7d
+t_187: .DB k_187, 88, 0x7a, $7c, 0b01101001, k_186
+        .DW 60465, 0x6b45 ; row 187
+        LDI r27, k_187
+.EQU k_188 = 0xb5
+t_188: .DB k_188, 39, 0x26, $e8, 0b11010111, k_187
+        .DW 26527, 0x29b8 ; row 188
+        LDI r28, k_188
+.EQU k_189 = 0xe3
+t_189: .DB k_189, 113, 0x4d, $b2, 0b00011001, k_188
+        .DW 52433, 0x852d ; row 189
+        LDI r29, k_189
+.EQU k_190 = 0xcd
+t_190: .DB k_190, 100, 0x9b, $5d, 0b11010010, k_189
+        .DW 42821, 0xa251 ; row 190
+        LDI r30, k_190
+.EQU k_191 = 0xc8
+t_191: .DB k_191, 47, 0xbc, $c9, 0b11111000, k_190
+        .DW 62371, 0x5c8f ; row 191
+        LDI r31, k_191
+.EQU k_192 = 0x64
+t_192: .DB k_192, 8, 0x40, $69, 0b00101001, k_191
+        .DW 910, 0xbb1a ; row 192
+        LDI r16, k_192
+.EQU k_193 = 0x0a
+t_193: .DB k_193, 93, 0x85, $53, 0b00110111, k_192
+        .DW 28459, 0xa03e ; row 193
+        LDI r17, k_193
+.EQU k_194 = 0x29
+t_194: .DB k_194, 61, 0xdd, $73, 0b01110000, k_193
+        .DW 54631, 0x349a ; row 194
+        LDI r18, k_194
+.EQU k_195 = 0xf0
+t_195: .DB k_195, 22, 0xfc, $43, 0b01011100, k_194
+        .DW 33653, 0x7a14 ; row 195
+        LDI r19, k_195
+.EQU k_196 = 0x43
+t_196: .DB k_196, 46, 0xc6, $5b, 0b10010000, k_195
+        .DW 13973, 0x8b19 ; row 196
+        LDI r20, k_196
+.EQU k_197 = 0x35
+t_197: .DB k_197, 126, 0x51, $7a, 0b00000101, k_196
+        .DW 3845, 0x6891 ; row 197
+        LDI r21, k_197
+.EQU k_198 = 0x6b
+t_198: .DB k_198, 12, 0x07, $74, 0b01111000, k_197
+        .DW 24356, 0x08dc ; row 198
+        LDI r22, k_198
+.EQU k_199 = 0x45
+t_199: .DB k_199, 11, 0x62, $bf, 0b01111001, k_198
+        .DW 44664, 0x6736 ; row 199
+        LDI r23, k_199
+.EQU k_200 = 0x30
+t_200: .DB k_200, 54, 0x91, $c2, 0b10100010, k_199
+        .DW 56195, 0xde32 ; row 200
+        LDI r24, k_200
+.EQU k_201 = 0xd8
+t_201: .DB k_201, 103, 0x2b, $e5, 0b00010000, k_200
+        .DW 48741, 0x3039 ; row 201
+        LDI r25, k_201
+.EQU k_202 = 0xf6
+t_202: .DB k_202, 32, 0x1b, $6e, 0b01100000, k_201
+        .DW 25079, 0x1631 ; row 202
+        LDI r26, k_202
+.EQU k_203 = 0x5a
+t_203: .DB k_203, 90, 0x5c, $a6, 0b10010001, k_202
+        .DW 14955, 0xed3e ; row 203
+        LDI r27, k_203
+.EQU k_204 = 0xba
+t_204: .DB k_204, 48, 0x6e, $b6, 0b00011001, k_203
+        .DW 48962, 0x3a5e ; row 204
+        LDI r28, k_204
+.EQU k_205 = 0x59
+t_205: .DB k_205, 91, 0x09, $bc, 0b00111101, k_204
+        .DW 2869, 0xa2fd ; row 205
+        LDI r29, k_205
+.EQU k_206 = 0xc8
+t_206: .DB k_206, 109, 0x22, $89, 0b10101101, k_205
+        .DW 19360, 0x3c8d ; row 206
+        LDI r30, k_206
+.EQU k_207 = 0x7b
+t_207: .DB k_207, 89, 0x61, $30, 0b01001001, k_206
+        .DW 56587, 0x54a2 ; row 207
+        LDI r31, k_207
+.EQU k_208 = 0xdf
+t_208: .DB k_208, 74, 0x84, $32, 0b00111101, k_207
+        .DW 22136, 0x7cb9 ; row 208
+        LDI r16, k_208
+.EQU k_209 = 0x9a
+t_209: .DB k_209, 36, 0xec, $ee, 0b00010111, k_208
+        .DW 46258, 0xdb0e ; row 209
+        LDI r17, k_209
+.EQU k_210 = 0x2e
+t_210: .DB k_210, 34, 0xc9, $18, 0b10000001, k_209
+        .DW 59248, 0xe02a ; row 210
+        LDI r18, k_210
+.EQU k_211 = 0x58
+t_211: .DB k_211, 89, 0x59, $13, 0b01001011, k_210
+        .DW 30673, 0x7bad ; row 211
+        LDI r19, k_211
+.EQU k_212 = 0x2f
+t_212: .DB k_212, 18, 0xb9, $d7, 0b01111010, k_211
+        .DW 44552, 0x040e ; row 212
+        LDI r20, k_212
+.EQU k_213 = 0x74
+t_213: .DB k_213, 60, 0x12, $32, 0b10011111, k_212
+        .DW 64567, 0xa929 ; row 213
+        LDI r21, k_213
+.EQU k_214 = 0x4a
+t_214: .DB k_214, 24, 0x13, $d6, 0b01000110, k_213
+        .DW 30091, 0x2795 ; row 214
+        LDI r22, k_214
+.EQU k_215 = 0x34
+t_215: .DB k_215, 75, 0xda, $41, 0b11010001, k_214
+        .DW 13135, 0xb8fe ; row 215
+        LDI r23, k_215
+.EQU k_216 = 0x2e
+t_216: .DB k_216, 14, 0xb1, $06, 0b00100100, k_215
+        .DW 13196, 0x86d5 ; row 216
+        LDI r24, k_216
+.EQU k_217 = 0x46
+t_217: .DB k_217, 108, 0x8f, $82, 0b10110100, k_216
+        .DW 15188, 0x89b5 ; row 217
+        LDI r25, k_217
+.EQU k_218 = 0x45
+t_218: .DB k_218, 110, 0xa4, $9f, 0b00100010, k_217
+        .DW 27728, 0x9679 ; row 218
+        LDI r26, k_218
+.EQU k_219 = 0x71
+t_219: .DB k_219, 59, 0x96, $9f, 0b11101001, k_218
+        .DW 28997, 0x4749 ; row 219
+        LDI r27, k_219
+.EQU k_220 = 0x62
+t_220: .DB k_220, 26, 0x75, $7c, 0b00010101, k_219
+        .DW 17626, 0x776d ; row 220
+        LDI r28, k_220
+.EQU k_221 = 0x3f
+t_221: .DB k_221, 37, 0x47, $be, 0b01110010, k_220
+        .DW 38523, 0x18b0 ; row 221
+        LDI r29, k_221
+.EQU k_222 = 0xdd
+t_222: .DB k_222, 104, 0xf8, $f8, 0b10011101, k_221
+        .DW 49589, 0x425c ; row 222
+        LDI r30, k_222
+.EQU k_223 = 0xb9
+t_223: .DB k_223, 65, 0xb5, $0b, 0b11000100, k_222
+        .DW 40322, 0x5a73 ; row 223
+        LDI r31, k_223
+.EQU k_224 = 0x6e
+t_224: .DB k_224, 97, 0x1b, $29, 0b10101111, k_223
+        .DW 27435, 0x144e ; row 224
+        LDI r16, k_224
+.EQU k_225 = 0x99
+t_225: .DB k_225, 83, 0x2c, $a5, 0b01001110, k_224
+        .DW 16830, 0xf794 ; row 225
+        LDI r17, k_225
+.EQU k_226 = 0x50
+t_226: .DB k_226, 35, 0x17, $ad, 0b01110111, k_225
+        .DW 34096, 0x904b ; row 226
+        LDI r18, k_226
+.EQU k_227 = 0x9f
+t_227: .DB k_227, 90, 0x1e, $1e, 0b10011100, k_226
+        .DW 25947, 0xfcb1 ; row 227
+        LDI r19, k_227
+.EQU k_228 = 0xec
+t_228: .DB k_228, 11, 0x0f, $4d, 0b10110110, k_227
+        .DW 44702, 0xa73d ; row 228
+        LDI r20, k_228
+.EQU k_229 = 0x7a
+t_229: .DB k_229, 56, 0x57, $ce, 0b11101011, k_228
+        .DW 57882, 0xf812 ; row 229
+        LDI r21, k_229
+.EQU k_230 = 0x1d
+t_230: .DB k_230, 17, 0x78, $ff, 0b10010011, k_229
+        .DW 32388, 0x273b ; row 230
+        LDI r22, k_230
+.EQU k_231 = 0x41
+t_231: .DB k_231, 63, 0x22, $6c, 0b11111111, k_230
+        .DW 23023, 0x4919 ; row 231
+        LDI r23, k_231
+.EQU k_232 = 0x4b
+t_232: .DB k_232, 12, 0xae, $26, 0b00110101, k_231
+        .DW 28981, 0x3333 ; row 232
+        LDI r24, k_232
+.EQU k_233 = 0xf0
+t_233: .DB k_233, 89, 0xd0, $ab, 0b00010100, k_232
+        .DW 3358, 0x3aac ; row 233
+        LDI r25, k_233
+.EQU k_234 = 0x61
+t_234: .DB k_234, 85, 0x8c, $8e, 0b00000010, k_233
+        .DW 15741, 0xa3ff ; row 234
+        LDI r26, k_234
+.EQU k_235 = 0x32
+t_235: .DB k_235, 4, 0x09, $f6, 0b11110011, k_234
+        .DW 24102, 0x1d7a ; row 235
+        LDI r27, k_235
+.EQU k_236 = 0x39
+t_236: .DB k_236, 81, 0x9b, $21, 0b11101111, k_235
+        .DW 52397, 0x7933 ; row 236
+        LDI r28, k_236
+.EQU k_237 = 0x0e
+t_237: .DB k_237, 36, 0x30, $d2, 0b00001111, k_236
+        .DW 46408, 0xd425 ; row 237
+        LDI r29, k_237
+.EQU k_238 = 0xd4
+t_238: .DB k_238, 38, 0xed, $5e, 0b00111010, k_237
+        .DW 9041, 0x0186 ; row 238
+        LDI r30, k_238
+.EQU k_239 = 0x2f
+t_239: .DB k_239, 41, 0xcc, $45, 0b10000110, k_238
+        .DW 46276, 0xa0c9 ; row 239
+        LDI r31, k_239
+.EQU k_240 = 0x2c
+t_240: .DB k_240, 93, 0x3a, $b1, 0b11001111, k_239
+        .DW 32235, 0x4775 ; row 240
+        LDI r16, k_240
+.EQU k_241 = 0xb1
+t_241: .DB k_241, 83, 0x43, $98, 0b10001001, k_240
+        .DW 30486, 0x62c3 ; row 241
+        LDI r17, k_241
+.EQU k_242 = 0x44
+t_242: .DB k_242, 60, 0x09, $3c, 0b10001111, k_241
+        .DW 62746, 0x53af ; row 242
+        LDI r18, k_242
+.EQU k_243 = 0x42
+t_243: .DB k_243, 114, 0x97, $34, 0b01101000, k_242
+        .DW 43928, 0xa1d9 ; row 243
+        LDI r19, k_243
+.EQU k_244 = 0xd1
+t_244: .DB k_244, 9, 0x9b, $3c, 0b10010101, k_243
+        .DW 14725, 0xf21b ; row 244
+        LDI r20, k_244
+.EQU k_245 = 0x00
+t_245: .DB k_245, 50, 0xcc, $4f, 0b11111100, k_244
+        .DW 10435, 0x24e7 ; row 245
+        LDI r21, k_245
+.EQU k_246 = 0xfb
+t_246: .DB k_246, 13, 0x81, $4d, 0b11110100, k_245
+        .DW 17130, 0x1aff ; row 246
+        LDI r22, k_246
+.EQU k_247 = 0x40
+t_247: .DB k_247, 87, 0xa2, $35, 0b11010101, k_246
+        .DW 140, 0x4722 ; row 247
+        LDI r23, k_247
+.EQU k_248 = 0xaf
+t_248: .DB k_248, 80, 0x1d, $55, 0b00100101, k_247
+        .DW 5418, 0x5792 ; row 248
+        LDI r24, k_248
+.EQU k_249 = 0x73
+t_249: .DB k_249, 64, 0x68, $0c, 0b01101110, k_248
+        .DW 44661, 0x23b8 ; row 249
+        LDI r25, k_249
+.EQU k_250 = 0x56
+t_250: .DB k_250, 89, 0x2b, $5c, 0b11001101, k_249
+        .DW 34493, 0x504d ; row 250
+        LDI r26, k_250
+.EQU k_251 = 0xd4
+t_251: .DB k_251, 102, 0x94, $79, 0b00001100, k_250
+        .DW 18425, 0x570e ; row 251
+        LDI r27, k_251
+.EQU k_252 = 0xe6
+t_252: .DB k_252, 67, 0x50, $10, 0b10101101, k_251
+        .DW 1686, 0x5d26 ; row 252
+        LDI r28, k_252
+.EQU k_253 = 0x86
+t_253: .DB k_253, 32, 0xad, $6f, 0b10111111, k_252
+        .DW 6120, 0x3003 ; row 253
+        LDI r29, k_253
+.EQU k_254 = 0xdb
+t_254: .DB k_254, 120, 0xac, $83, 0b10000111, k_253
+        .DW 61533, 0x74ec ; row 254
+        LDI r30, k_254
+.EQU k_255 = 0xe2
+t_255: .DB k_255, 105, 0x82, $09, 0b01010101, k_254
+        .DW 6114, 0xc631 ; row 255
+        LDI r31, k_255
+.EQU k_256 = 0x5d
+t_256: .DB k_256, 81, 0xc4, $f2, 0b10101100, k_255
+        .DW 29745, 0x68b8 ; row 256
+        LDI r16, k_256
+.EQU k_257 = 0x65
+t_257: .DB k_257, 45, 0xcd, $c0, 0b01110001, k_256
+        .DW 39931, 0x27d0 ; row 257
+        LDI r17, k_257
+.EQU k_258 = 0x2d
+t_258: .DB k_258, 0, 0x0e, $c7, 0b10110111, k_257
+        .DW 13253, 0x2efb ; row 258
+        LDI r18, k_258
+.EQU k_259 = 0xcf
+t_259: .DB k_259, 26, 0x99, $f5, 0b01001100, k_258
+        .DW 48813, 0xd50c ; row 259
+        LDI r19, k_259
+.EQU k_260 = 0xd6
+t_260: .DB k_260, 116, 0x4f, $19, 0b01101110, k_259
+        .DW 63679, 0x62c4 ; row 260
+        LDI r20, k_260
+.EQU k_261 = 0x8b
+t_261: .DB k_261, 59, 0x7a, $8a, 0b11001001, k_260
+        .DW 35982, 0xa2f4 ; row 261
+        LDI r21, k_261
+.EQU k_262 = 0xa5
+t_262: .DB k_262, 79, 0xf5, $3d, 0b01000000, k_261
+        .DW 42428, 0xfa98 ; row 262
+        LDI r22, k_262
+.EQU k_263 = 0xac
+t_263: .DB k_263, 72, 0xea, $23, 0b10010100, k_262
+        .DW 46935, 0x12b3 ; row 263
+        LDI r23, k_263
+.EQU k_264 = 0x4f
+t_264: .DB k_264, 61, 0x28, $3f, 0b10011010, k_263
+        .DW 64424, 0x07be ; row 264
+        LDI r24, k_264
+.EQU k_265 = 0x74
+t_265: .DB k_265, 78, 0x8f, $e0, 0b11001000, k_264
+        .DW 6437, 0xcdf8 ; row 265
+        LDI r25, k_265
+.EQU k_266 = 0xb6
+t_266: .DB k_266, 86, 0xdd, $42, 0b11110001, k_265
+        .DW 27695, 0xe120 ; row 266
+        LDI r26, k_266
+.EQU k_267 = 0xc7
+t_267: .DB k_267, 113, 0x3e, $21, 0b01010000, k_266
+        .DW 65466, 0xd4be ; row 267
+        LDI r27, k_267
+.EQU k_268 = 0x62
+t_268: .DB k_268, 19, 0xd4, $e5, 0b10100111, k_267
+        .DW 45855, 0x6afd ; row 268
+        LDI r28, k_268
+.EQU k_269 = 0x44
+t_269: .DB k_269, 54, 0x81, $04, 0b10001010, k_268
+        .DW 53325, 0xf437 ; row 269
+        LDI r29, k_269
+.EQU k_270 = 0x92
+t_270: .DB k_270, 6, 0xaf, $fb, 0b00001111, k_269
+        .DW 25623, 0x50bd ; row 270
+        LDI r30, k_270
+.EQU k_271 = 0xf9
+t_271: .DB k_271, 27, 0x67, $a9, 0b00100001, k_270
+        .DW 51689, 0xf8f2 ; row 271
+        LDI r31, k_271
+.EQU k_272 = 0x07
+t_272: .DB k_272, 113, 0xa5, $69, 0b11110001, k_271
+        .DW 6884, 0xc61e ; row 272
+        LDI r16, k_272
+.EQU k_273 = 0x0e
+t_273: .DB k_273, 44, 0x77, $7d, 0b10101011, k_272
+        .DW 2951, 0x55ed ; row 273
+        LDI r17, k_273
+.EQU k_274 = 0x70
+t_274: .DB k_274, 4, 0x6d, $18, 0b10011001, k_273
+        .DW 56929, 0x3eca ; row 274
+        LDI r18, k_274
+.EQU k_275 = 0xce
+t_275: .DB k_275, 45, 0x18, $f1, 0b10000001, k_274
+        .DW 16864, 0x394a ; row 275
+        LDI r19, k_275
+.EQU k_276 = 0xf1
+t_276: .DB k_276, 47, 0xa2, $7d, 0b11000101, k_275
+        .DW 15411, 0x13bc ; row 276
+        LDI r20, k_276
+.EQU k_277 = 0x56
+t_277: .DB k_277, 27, 0x4c, $73, 0b01000100, k_276
+        .DW 51530, 0x27b4 ; row 277
+        LDI r21, k_277
+.EQU k_278 = 0x25
+t_278: .DB k_278, 8, 0xca, $32, 0b10100011, k_277
+        .DW 33441, 0x7f59 ; row 278
+        LDI r22, k_278
+.EQU k_279 = 0xf1
+t_279: .DB k_279, 59, 0x3a, $ea, 0b00110100, k_278
+        .DW 8215, 0xcb43 ; row 279
+        LDI r23, k_279
+.EQU k_280 = 0xfb
+t_280: .DB k_280, 107, 0x55, $eb, 0b00100101, k_279
+        .DW 59197, 0x9278 ; row 280
+        LDI r24, k_280
+.EQU k_281 = 0x64
+t_281: .DB k_281, 87, 0x2c, $8c, 0b01100101, k_280
+        .DW 39801, 0xab8b ; row 281
+        LDI r25, k_281
+.EQU k_282 = 0xa7
+t_282: .DB k_282, 74, 0x6e, $fe, 0b10011001, k_281
+        .DW 24923, 0x3b7c ; row 282
+        LDI r26, k_282
+.EQU k_283 = 0x70
+t_283: .DB k_283, 125, 0xa4, $17, 0b10111000, k_282
+        .DW 38028, 0x08f9 ; row 283
+        LDI r27, k_283
+.EQU k_284 = 0x56
+t_284: .DB k_284, 5, 0x0f, $6f, 0b01111100, k_283
+        .DW 22130, 0x4571 ; row 284
+        LDI r28, k_284
+.EQU k_285 = 0x81
+t_285: .DB k_285, 61, 0xc0, $27, 0b01010011, k_284
+        .DW 53309, 0xd348 ; row 285
+        LDI r29, k_285
+.EQU k_286 = 0x7e
+t_286: .DB k_286, 63, 0xe1, $47, 0b10001111, k_285
+        .DW 2524, 0x1da7 ; row 286
+        LDI r30, k_286
+.EQU k_287 = 0x68
+t_287: .DB k_287, 123, 0x1c, $df, 0b00010001, k_286
+        .DW 12142, 0xbdb2 ; row 287
+        LDI r31, k_287
+.EQU k_288 = 0xaf
+t_288: .DB k_288, 92, 0x5a, $d1, 0b11000000, k_287
+        .DW 25325, 0x8d07 ; row 288
+        LDI r16, k_288
+.EQU k_289 = 0x4a
+t_289: .DB k_289, 123, 0x70, $b9, 0b01000110, k_288
+        .DW 61791, 0xf294 ; row 289
+        LDI r17, k_289
+.EQU k_290 = 0x90
+t_290: .DB k_290, 95, 0x24, $22, 0b10000101, k_289
+        .DW 25597, 0x63be ; row 290
+        LDI r18, k_290
+.EQU k_291 = 0x58
+t_291: .DB k_291, 50, 0xe8, $6c, 0b10101010, k_290
+        .DW 4744, 0x30f6 ; row 291
+        LDI r19, k_291
+.EQU k_292 = 0xe4
+t_292: .DB k_292, 98, 0x08, $74, 0b00111001, k_291
+        .DW 3202, 0xd25b ; row 292
+        LDI r20, k_292
+.EQU k_293 = 0xfa
+t_293: .DB k_293, 71, 0x25, $9e, 0b10001111, k_292
+        .DW 27027, 0x6f5c ; row 293
+        LDI r21, k_293
+.EQU k_294 = 0x3b
+t_294: .DB k_294, 93, 0x3d, $8e, 0b11110101, k_293
+        .DW 48220, 0x14b4 ; row 294
+        LDI r22, k_294
+.EQU k_295 = 0x5e
+t_295: .DB k_295, 27, 0x90, $02, 0b11110001, k_294
+        .DW 10393, 0x7d3a ; row 295
+        LDI r23, k_295
+.EQU k_296 = 0xe7
+t_296: .DB k_296, 48, 0x54, $d1, 0b00000110, k_295
+        .DW 24792, 0xb9ce ; row 296
+        LDI r24, k_296
+.EQU k_297 = 0xf3
+t_297: .DB k_297, 83, 0x49, $14, 0b11000100, k_296
+        .DW 5435, 0xbcce ; row 297
+        LDI r25, k_297
+.EQU k_298 = 0x5b
+t_298: .DB k_298, 84, 0xf6, $fd, 0b00111101, k_297
+        .DW 18353, 0xc604 ; row 298
+        LDI r26, k_298
+.EQU k_299 = 0x0e
+t_299: .DB k_299, 107, 0xdc, $8d, 0b00011110, k_298
+        .DW 21163, 0xc700 ; row 299
+        LDI r27, k_299
+.EQU k_300 = 0x56
+t_300: .DB k_300, 60, 0xdc, $e8, 0b01111101, k_299
+        .DW 6495, 0x969c ; row 300
+        LDI r28, k_300
+.EQU k_301 = 0x87
+t_301: .DB k_301, 47, 0x52, $a6, 0b00110101, k_300
+        .DW 58714, 0x91a4 ; row 301
+        LDI r29, k_301
+.EQU k_302 = 0x7a
+t_302: .DB k_302, 121, 0x79, $45, 0b10001100, k_301
+        .DW 64850, 0x9712 ; row 302
+        LDI r30, k_302
+.EQU k_303 = 0xfd
+t_303: .DB k_303, 40, 0xbd, $74, 0b01100011, k_302
+        .DW 42199, 0x0fd5 ; row 303
+        LDI r31, k_303
+.EQU k_304 = 0x3c
+t_304: .DB k_304, 47, 0x8d, $46, 0b11000000, k_303
+        .DW 50987, 0x7e0c ; row 304
+        LDI r16, k_304
+.EQU k_305 = 0x8e
+t_305: .DB k_305, 101, 0x36, $bb, 0b00111100, k_304
+        .DW 33119, 0xf0a7 ; row 305
+        LDI r17, k_305
+.EQU k_306 = 0x02
+t_306: .DB k_306, 15, 0x5b, $92, 0b01010111, k_305
+        .DW 53020, 0x999a ; row 306
+        LDI r18, k_306
+.EQU k_307 = 0x55
+t_307: .DB k_307, 122, 0x1f, $0f, 0b00011110, k_306
+        .DW 11812, 0xf3a6 ; row 307
+        LDI r19, k_307
+.EQU k_308 = 0x1f
+t_308: .DB k_308, 49, 0x7e, $9b, 0b01011001, k_307
+        .DW 57385, 0x6d7c ; row 308
+        LDI r20, k_308
+.EQU k_309 = 0xc8
+t_309: .DB k_309, 120, 0xd5, $d4, 0b10100110, k_308
+        .DW 53447, 0x6331 ; row 309
+        LDI r21, k_309
+.EQU k_310 = 0x15
+t_310: .DB k_310, 81, 0x8a, $a9, 0b10101101, k_309
+        .DW 17699, 0x36e1 ; row 310
+        LDI r22, k_310
+.EQU k_311 = 0x42
+t_311: .DB k_311, 107, 0x4c, $e1, 0b01000001, k_310
+        .DW 35760, 0xb4c1 ; row 311
+        LDI r23, k_311
+.EQU k_312 = 0xe1
+t_312: .DB k_312, 117, 0xf9, $3b, 0b11001001, k_311
+        .DW 63029, 0x8b99 ; row 312
+        LDI r24, k_312
+.EQU k_313 = 0x4d
+t_313: .DB k_313, 113, 0xae, $d7, 0b01001101, k_312
+        .DW 5896, 0x65d8 ; row 313
+        LDI r25, k_313
+.EQU k_314 = 0x05
+t_314: .DB k_314, 121, 0xa9, $61, 0b10000010, k_313
+        .DW 64436, 0x871e ; row 314
+        LDI r26, k_314
+.EQU k_315 = 0x62
+t_315: .DB k_315, 121, 0x86, $51, 0b00000101, k_314
+        .DW 25387, 0x357f ; row 315
+        LDI r27, k_315
+.EQU k_316 = 0x02
+t_316: .DB k_316, 43, 0xc4, $c3, 0b11010100, k_315
+        .DW 60386, 0x519a ; row 316
+        LDI r28, k_316
+.EQU k_317 = 0x20
+t_317: .DB k_317, 108, 0x4c, $f3, 0b00101100, k_316
+        .DW 28258, 0x37b2 ; row 317
+        LDI r29, k_317
+.EQU k_318 = 0xf6
+t_318: .DB k_318, 116, 0x9f, $75, 0b00110001, k_317
+        .DW 15110, 0x43f8 ; row 318
+        LDI r30, k_318
+.EQU k_319 = 0xfd
+t_319: .DB k_319, 9, 0x5e, $f3, 0b00001001, k_318
+        .DW 51303, 0xc18c ; row 319
+        LDI r31, k_319
+.EQU k_320 = 0x28
+t_320: .DB k_320, 9, 0xf3, $53, 0b11000100, k_319
+        .DW 58137, 0x2e59 ; row 320
+        LDI r16, k_320
+.EQU k_321 = 0xf5
+t_321: .DB k_321, 70, 0xa3, $a5, 0b10101101, k_320
+        .DW 62578, 0x62e2 ; row 321
+        LDI r17, k_321
+.EQU k_322 = 0x21
+t_322: .DB k_322, 90, 0x3e, $20, 0b01001110, k_321
+        .DW 7300, 0x3e0e ; row 322
+        LDI r18, k_322
+.EQU k_323 = 0x43
+t_323: .DB k_323, 76, 0x75, $2e, 0b11010001, k_322
+        .DW 8077, 0xb310 ; row 323
+        LDI r19, k_323
+.EQU k_324 = 0xd0
+t_324: .DB k_324, 66, 0x05, $0a, 0b00000101, k_323
+        .DW 38879, 0x7305 ; row 324
+        LDI r20, k_324
+.EQU k_325 = 0x1c
+t_325: .DB k_325, 123, 0x03, $b8, 0b00110100, k_324
+        .DW 32932, 0x4bbf ; row 325
+        LDI r21, k_325
+.EQU k_326 = 0x06
+t_326: .DB k_326, 4, 0xab, $34, 0b11011110, k_325
+        .DW 28396, 0x492c ; row 326
+        LDI r22, k_326
+.EQU k_327 = 0xcf
+t_327: .DB k_327, 3, 0x8e, $97, 0b10000010, k_326
+        .DW 35770, 0x1e90 ; row 327
+        LDI r23, k_327
+.EQU k_328 = 0xe5
+t_328: .DB k_328, 49, 0x0b, $ce, 0b00100111, k_327
+        .DW 30982, 0xdbba ; row 328
+        LDI r24, k_328
+.EQU k_329 = 0xa3
+t_329: .DB k_329, 69, 0x78, $28, 0b10011011, k_328
+        .DW 15215, 0xe59d ; row 329
+        LDI r25, k_329
+.EQU k_330 = 0x54
+t_330: .DB k_330, 37, 0x26, $e3, 0b11111111, k_329
+        .DW 11018, 0x124b ; row 330
+        LDI r26, k_330
+.EQU k_331 = 0x08
+t_331: .DB k_331, 111, 0xca, $8d, 0b10011101, k_330
+        .DW 714, 0xed33 ; row 331
+        LDI r27, k_331
+.EQU k_332 = 0x09
+t_332: .DB k_332, 93, 0x41, $b0, 0b01111010, k_331
+        .DW 55873, 0xc6aa ; row 332
+        LDI r28, k_332
+.EQU k_333 = 0x71
+t_333: .DB k_333, 43, 0x65, $ea, 0b00111000, k_332
+        .DW 15723, 0x8673 ; row 333
+        LDI r29, k_333
+.EQU k_334 = 0x9f
+t_334: .DB k_334, 63, 0xe0, $fd, 0b00011110, k_333
+        .DW 31552, 0x7e2a ; row 334
+        LDI r30, k_334
+.EQU k_335 = 0x9d
+t_335: .DB k_335, 124, 0xcd, $32, 0b01110111, k_334
+        .DW 55541, 0x54e4 ; row 335
+        LDI r31, k_335
+.EQU k_336 = 0xf6
+t_336: .DB k_336, 66, 0x49, $fd, 0b01001101, k_335
+        .DW 36006, 0x3f81 ; row 336
+        LDI r16, k_336
+.EQU k_337 = 0xf9
+t_337: .DB k_337, 52, 0xf4, $fd, 0b10000001, k_336
+        .DW 31820, 0x3aab ; row 337
+        LDI r17, k_337
+.EQU k_338 = 0x61
+t_338: .DB k_338, 11, 0xd3, $3f, 0b01000111, k_337
+        .DW 40817, 0x69f4 ; row 338
+        LDI r18, k_338
+.EQU k_339 = 0x9b
+t_339: .DB k_339, 58, 0xa5, $de, 0b01000000, k_338
+        .DW 50025, 0x7a41 ; row 339
+        LDI r19, k_339
+.EQU k_340 = 0xd5
+t_340: .DB k_340, 72, 0x38, $4d, 0b11100001, k_339
+        .DW 59726, 0xcdce ; row 340
+        LDI r20, k_340
+.EQU k_341 = 0x26
+t_341: .DB k_341, 74, 0x66, $a6, 0b10010100, k_340
+        .DW 61304, 0xe35b ; row 341
+        LDI r21, k_341
+.EQU k_342 = 0x45
+t_342: .DB k_342, 102, 0xca, $7c, 0b11011000, k_341
+        .DW 25721, 0xa6b9 ; row 342
+        LDI r22, k_342
+.EQU k_343 = 0x03
+t_343: .DB k_343, 103, 0x64, $31, 0b00011110, k_342
+        .DW 2570, 0xe745 ; row 343
+        LDI r23, k_343
+.EQU k_344 = 0x18
+t_344: .DB k_344, 127, 0xcf, $dc, 0b10011011, k_343
+        .DW 19338, 0xd9e1 ; row 344
+        LDI r24, k_344
+.EQU k_345 = 0x62
+t_345: .DB k_345, 113, 0x5c, $dc, 0b11011100, k_344
+        .DW 2920, 0x9b0d ; row 345
+        LDI r25, k_345
+.EQU k_346 = 0xab
+t_346: .DB k_346, 101, 0xac, $c2, 0b10111001, k_345
+        .DW 28824, 0x527b ; row 346
+        LDI r26, k_346
+.EQU k_347 = 0xc5
+t_347: .DB k_347, 43, 0xf3, $9c, 0b01001011, k_346
+        .DW 39713, 0x43c8 ; row 347
+        LDI r27, k_347
+.EQU k_348 = 0x59
+t_348: .DB k_348, 10, 0x2b, $6a, 0b10000001, k_347
+        .DW 31467, 0x3c20 ; row 348
+        LDI r28, k_348
+.EQU k_349 = 0x66
+t_349: .DB k_349, 36, 0xf2, $36, 0b01000000, k_348
+        .DW 33079, 0x71e5 ; row 349
+        LDI r29, k_349
+.EQU k_350 = 0x26
+t_350: .DB k_350, 38, 0x46, $41, 0b10110101, k_349
+        .DW 33189, 0x7d45 ; row 350
+        LDI r30, k_350
+.EQU k_351 = 0x91
+t_351: .DB k_351, 19, 0x9d, $a4, 0b10111000, k_350
+        .DW 25694, 0x5dd3 ; row 351
+        LDI r31, k_351
+.EQU k_352 = 0x3e
+t_352: .DB k_352, 46, 0x53, $a5, 0b10010010, k_351
+        .DW 4292, 0xce93 ; row 352
+        LDI r16, k_352
+.EQU k_353 = 0x88
+t_353: .DB k_353, 96, 0x23, $f5, 0b11000110, k_352
+        .DW 29831, 0xc5dc ; row 353
+        LDI r17, k_353
+.EQU k_354 = 0x36
+t_354: .DB k_354, 42, 0x33, $fd, 0b10111010, k_353
+        .DW 50509, 0xb497 ; row 354
+        LDI r18, k_354
+.EQU k_355 = 0x0c
+t_355: .DB k_355, 125, 0x80, $3a, 0b01001100, k_354
+        .DW 22449, 0xd21f ; row 355
+        LDI r19, k_355
+.EQU k_356 = 0x3b
+t_356: .DB k_356, 98, 0x74, $c6, 0b10011111, k_355
+        .DW 52522, 0x7380 ; row 356
+        LDI r20, k_356
+.EQU k_357 = 0xab
+t_357: .DB k_357, 32, 0x2a, $58, 0b11000010, k_356
+        .DW 31261, 0xf1c0 ; row 357
+        LDI r21, k_357
+.EQU k_358 = 0x37
+t_358: .DB k_358, 53, 0x24, $d2, 0b11111111, k_357
+        .DW 12763, 0x52e3 ; row 358
+        LDI r22, k_358
+.EQU k_359 = 0xd1
+t_359: .DB k_359, 18, 0x32, $43, 0b00100100, k_358
+        .DW 64706, 0x54ef ; row 359
+        LDI r23, k_359
+.EQU k_360 = 0xef
+t_360: .DB k_360, 21, 0x9c, $d4, 0b10010001, k_359
+        .DW 41902, 0x8fea ; row 360
+        LDI r24, k_360
+.EQU k_361 = 0xec
+t_361: .DB k_361, 121, 0x0d, $b1, 0b01000000, k_360
+        .DW 21002, 0x8ec5 ; row 361
+        LDI r25, k_361
+.EQU k_362 = 0xe1
+t_362: .DB k_362, 46, 0x00, $66, 0b10111010, k_361
+        .DW 18901, 0x3d2f ; row 362
+        LDI r26, k_362
+.EQU k_363 = 0x2b
+t_363: .DB k_363, 87, 0x20, $fe, 0b01110111, k_362
+        .DW 10596, 0xfb12 ; row 363
+        LDI r27, k_363
+.EQU k_364 = 0x71
+t_364: .DB k_364, 47, 0x3b, $55, 0b11010101, k_363
+        .DW 43051, 0x8ae1 ; row 364
+        LDI r28, k_364
+.EQU k_365 = 0x15
+t_365: .DB k_365, 79, 0x4d, $23, 0b11111011, k_364
+        .DW 40649, 0x6a1f ; row 365
+        LDI r29, k_365
+.EQU k_366 = 0x02
+t_366: .DB k_366, 101, 0x3d, $61, 0b10010001, k_365
+        .DW 18386, 0x4bea ; row 366
+        LDI r30, k_366
+.EQU k_367 = 0x69
+t_367: .DB k_367, 27, 0xe7, $1b, 0b00100001, k_366
+        .DW 4686, 0x9ead ; row 367
+        LDI r31, k_367
+.EQU k_368 = 0x82
+t_368: .DB k_368, 3, 0x9c, $e9, 0b10001001, k_367
+        .DW 16625, 0x4e83 ; row 368
+        LDI r16, k_368
+.EQU k_369 = 0xb6
+t_369: .DB k_369, 38, 0xa4, $94, 0b11001000, k_368
+        .DW 10573, 0x473b ; row 369
+        LDI r17, k_369
+.EQU k_370 = 0x41
+t_370: .DB k_370, 36, 0xe6, $d4, 0b10000010, k_369
+        .DW 34351, 0x3a02 ; row 370
+        LDI r18, k_370
+.EQU k_371 = 0x1b
+t_371: .DB k_371, 50, 0xc2, $dc, 0b10111100, k_370
+        .DW 53125, 0x5737 ; row 371
+        LDI r19, k_371
+.EQU k_372 = 0xf6
+t_372: .DB k_372, 20, 0xea, $05, 0b01000111, k_371
+        .DW 15506, 0x9eeb ; row 372
+        LDI r20, k_372
+.EQU k_373 = 0x55
+t_373: .DB k_373, 69, 0xfc, $9d, 0b10111111, k_372
+        .DW 28987, 0x6ba4 ; row 373
+        LDI r21, k_373
+.EQU k_374 = 0x80
+t_374: .DB k_374, 117, 0x9d, $10, 0b10101010, k_373
+        .DW 48983, 0x4793 ; row 374
+        LDI r22, k_374
+.EQU k_375 = 0x37
+t_375: .DB k_375, 25, 0x4a, $22, 0b00001100, k_374
+        .DW 49138, 0x52d2 ; row 375
+        LDI r23, k_375
+.EQU k_376 = 0xe0
+t_376: .DB k_376, 122, 0x0f, $16, 0b01010110, k_375
+        .DW 23548, 0xa880 ; row 376
+        LDI r24, k_376
+.EQU k_377 = 0x36
+t_377: .DB k_377, 49, 0xfe, $db, 0b00111101, k_376
+        .DW 63234, 0xa495 ; row 377
+        LDI r25, k_377
+.EQU k_378 = 0xfa
+t_378: .DB k_378, 11, 0x29, $ec, 0b11001011, k_377
+        .DW 58091, 0xc11a ; row 378
+        LDI r26, k_378
+.EQU k_379 = 0xf5
+t_379: .DB k_379, 125, 0xbd, $49, 0b10001001, k_378
+        .DW 30963, 0x3172 ; row 379
+        LDI r27, k_379
+.EQU k_380 = 0x19
+t_380: .DB k_380, 57, 0x8f, $99, 0b10100100, k_379
+        .DW 13719, 0x7e43 ; row 380
+        LDI r28, k_380
+.EQU k_381 = 0xe6
+t_381: .DB k_381, 56, 0x98, $b7, 0b01011000, k_380
+        .DW 54753, 0x525e ; row 381
+        LDI r29, k_381
+.EQU k_382 = 0x4e
+t_382: .DB k_382, 45, 0xf2, $9f, 0b11101010, k_381
+        .DW 28719, 0xbf69 ; row 382
+        LDI r30, k_382
+.EQU k_383 = 0x56
+t_383: .DB k_383, 91, 0x54, $52, 0b11110101, k_382
+        .DW 9679, 0x5362 ; row 383
+        LDI r31, k_383
+.EQU k_384 = 0x10
+t_384: .DB k_384, 0, 0x6d, $86, 0b00001000, k_383
+        .DW 7837, 0x157a ; row 384
+        LDI r16, k_384
+.EQU k_385 = 0xdb
+t_385: .DB k_385, 29, 0xb8, $d6, 0b00110101, k_384
+        .DW 22629, 0x19e4 ; row 385
+        LDI r17, k_385
+.EQU k_386 = 0xda
+t_386: .DB k_386, 118, 0xe0, $66, 0b11111111, k_385
+        .DW 48972, 0xd3c7 ; row 386
+        LDI r18, k_386
+.EQU k_387 = 0xf9
+t_387: .DB k_387, 121, 0xde, $18, 0b01010110, k_386
+        .DW 20974, 0xd181 ; row 387
+        LDI r19, k_387
+.EQU k_388 = 0xa7
+t_388: .DB k_388, 19, 0xd2, $22, 0b10111001, k_387
+        .DW 23938, 0x7725 ; row 388
+        LDI r20, k_388
+.EQU k_389 = 0xb5
+t_389: .DB k_389, 91, 0x44, $ed, 0b11011111, k_388
+        .DW 28198, 0x4dbd ; row 389
+        LDI r21, k_389
+.EQU k_390 = 0x93
+t_390: .DB k_390, 112, 0x96, $34, 0b01101000, k_389
+        .DW 45481, 0x722b ; row 390
+        LDI r22, k_390
+.EQU k_391 = 0xc3
+t_391: .DB k_391, 39, 0xa5, $2a, 0b10000010, k_390
+        .DW 22911, 0xca73 ; row 391
+        LDI r23, k_391
+.EQU k_392 = 0xc7
+t_392: .DB k_392, 108, 0x02, $e6, 0b10001111, k_391
+        .DW 65399, 0xeb37 ; row 392
+        LDI r24, k_392
+.EQU k_393 = 0x65
+t_393: .DB k_393, 119, 0x8d, $79, 0b11100100, k_392
+        .DW 44469, 0x0b85 ; row 393
+        LDI r25, k_393
+.EQU k_394 = 0x98
+t_394: .DB k_394, 19, 0xe7, $ea, 0b00000111, k_393
+        .DW 45644, 0xafcb ; row 394
+        LDI r26, k_394
+.EQU k_395 = 0x3a
+t_395: .DB k_395, 31, 0x76, $88, 0b00101011, k_394
+        .DW 44938, 0x1bb3 ; row 395
+        LDI r27, k_395
+.EQU k_396 = 0xc5
+t_396: .DB k_396, 24, 0x0d, $df, 0b01000010, k_395
+        .DW 44740, 0xdfdf ; row 396
+        LDI r28, k_396
+.EQU k_397 = 0xae
+t_397: .DB k_397, 51, 0xae, $17, 0b10100110, k_396
+        .DW 12976, 0x2144 ; row 397
+        LDI r29, k_397
+.EQU k_398 = 0xd2
+t_398: .DB k_398, 81, 0x03, $ee, 0b11110000, k_397
+        .DW 63277, 0x2369 ; row 398
+        LDI r30, k_398
+.EQU k_399 = 0x4b
+t_399: .DB k_399, 69, 0x50, $25, 0b01101011, k_398
+        .DW 43644, 0xff3c ; row 399
+        LDI r31, k_399
+.EQU k_400 = 0xe2
+t_400: .DB k_400, 108, 0x6a, $b7, 0b01100100, k_399
+        .DW 10819, 0xb588 ; row 400
+        LDI r16, k_400
+.EQU k_401 = 0x68
+t_401: .DB k_401, 28, 0x25, $50, 0b11100010, k_400
+        .DW 6359, 0xfe85 ; row 401
+        LDI r17, k_401
+.EQU k_402 = 0x35
+t_402: .DB k_402, 117, 0x1e, $7c, 0b00010111, k_401
+        .DW 60857, 0x316a ; row 402
+        LDI r18, k_402
+.EQU k_403 = 0x9e
+t_403: .DB k_403, 14, 0xd8, $77, 0b10000011, k_402
+        .DW 499, 0x0093 ; row 403
+        LDI r19, k_403
+.EQU k_404 = 0xa8
+t_404: .DB k_404, 74, 0xb5, $8f, 0b10010100, k_403
+        .DW 40100, 0x1625 ; row 404
+        LDI r20, k_404
+.EQU k_405 = 0xd3
+t_405: .DB k_405, 49, 0x42, $89, 0b00001010, k_404
+        .DW 49893, 0xc5c9 ; row 405
+        LDI r21, k_405
+.EQU k_406 = 0xd3
+t_406: .DB k_406, 124, 0xf4, $2d, 0b01000111, k_405
+        .DW 33503, 0x2591 ; row 406
+        LDI r22, k_406
+.EQU k_407 = 0x31
+t_407: .DB k_407, 14, 0x17, $4a, 0b11111101, k_406
+        .DW 53120, 0xada5 ; row 407
+        LDI r23, k_407
+.EQU k_408 = 0xa5
+t_408: .DB k_408, 110, 0x40, $2e, 0b00000111, k_407
+        .DW 8325, 0xf924 ; row 408
+        LDI r24, k_408
+.EQU k_409 = 0x33
+t_409: .DB k_409, 47, 0x6f, $21, 0b10101000, k_408
+        .DW 6279, 0x23ab ; row 409
+        LDI r25, k_409
+.EQU k_410 = 0xcd
+t_410: .DB k_410, 86, 0x5a, $2d, 0b00011110, k_409
+        .DW 20912, 0xc8f7 ; row 410
+        LDI r26, k_410
+.EQU k_411 = 0xd3
+t_411: .DB k_411, 8, 0x05, $04, 0b01010001, k_410
+        .DW 37801, 0xa585 ; row 411
+        LDI r27, k_411
+.EQU k_412 = 0x47
+t_412: .DB k_412, 43, 0xa4, $1c, 0b10010011, k_411
+        .DW 42961, 0xf93b ; row 412
+        LDI r28, k_412
+.EQU k_413 = 0xc4
+t_413: .DB k_413, 11, 0x1d, $e4, 0b00111111, k_412
+        .DW 29293, 0xaf7b ; row 413
+        LDI r29, k_413
+.EQU k_414 = 0x38
+t_414: .DB k_414, 51, 0x55, $09, 0b11110001, k_413
+        .DW 11069, 0x157f ; row 414
+        LDI r30, k_414
+.EQU k_415 = 0x7e
+t_415: .DB k_415, 22, 0x27, $1d, 0b10100111, k_414
+        .DW 5048, 0xe00d ; row 415
+        LDI r31, k_415
+.EQU k_416 = 0xe2
+t_416: .DB k_416, 103, 0xe3, $3f, 0b00000001, k_415
+        .DW 41544, 0x46df ; row 416
+        LDI r16, k_416
+.EQU k_417 = 0x4d
+t_417: .DB k_417, 61, 0xb5, $82, 0b10000000, k_416
+        .DW 21366, 0x0ff2 ; row 417
+        LDI r17, k_417
+.EQU k_418 = 0x71
+t_418: .DB k_418, 68, 0x59, $ba, 0b00110111, k_417
+        .DW 25505, 0x86b2 ; row 418
+        LDI r18, k_418
+.EQU k_419 = 0x80
+t_419: .DB k_419, 29, 0xa3, $24, 0b00011011, k_418
+        .DW 34395, 0x71f3 ; row 419
+        LDI r19, k_419
+.EQU k_420 = 0x67
+t_420: .DB k_420, 62, 0x89, $30, 0b10000101, k_419
+        .DW 51652, 0x880e ; row 420
+        LDI r20, k_420
+.EQU k_421 = 0xea
+t_421: .DB k_421, 38, 0x00, $22, 0b10010101, k_420
+        .DW 35053, 0x3d71 ; row 421
+        LDI r21, k_421
+.EQU k_422 = 0x88
+t_422: .DB k_422, 29, 0xe5, $25, 0b00110101, k_421
+        .DW 65191, 0xa13f ; row 422
+        LDI r22, k_422
+.EQU k_423 = 0x88
+t_423: .DB k_423, 54, 0x7d, $cd, 0b11011001, k_422
+        .DW 25185, 0xdb39 ; row 423
+        LDI r23, k_423
+.EQU k_424 = 0xe8
+t_424: .DB k_424, 85, 0xbc, $3b, 0b01100111, k_423
+        .DW 53475, 0xc80b ; row 424
+        LDI r24, k_424
+.EQU k_425 = 0x31
+t_425: .DB k_425, 69, 0x90, $87, 0b11000010, k_424
+        .DW 15931, 0xcdcc ; row 425
+        LDI r25, k_425
+.EQU k_426 = 0x99
+t_426: .DB k_426, 77, 0xcc, $81, 0b10110111, k_425
+        .DW 12024, 0xc4f9 ; row 426
+        LDI r26, k_426
+.EQU k_427 = 0x0e
+t_427: .DB k_427, 1, 0xcf, $b9, 0b01001100, k_426
+        .DW 10774, 0xea36 ; row 427
+        LDI r27, k_427
+.EQU k_428 = 0x2d
+t_428: .DB k_428, 63, 0xc5, $6f, 0b10001011, k_427
+        .DW 61503, 0x9f6c ; row 428
+        LDI r28, k_428
+.EQU k_429 = 0xb4
+t_429: .DB k_429, 72, 0x17, $1c, 0b10010101, k_428
+        .DW 5099, 0x8b5c ; row 429
+        LDI r29, k_429
+.EQU k_430 = 0x24
+t_430: .DB k_430, 17, 0xc4, $18, 0b10000100, k_429
+        .DW 29798, 0xb952 ; row 430
+        LDI r30, k_430
+.EQU k_431 = 0x3f
+t_431: .DB k_431, 16, 0xa2, $82, 0b00011010, k_430
+        .DW 899, 0x8770 ; row 431
+        LDI r31, k_431
+.EQU k_432 = 0x26
+t_432: .DB k_432, 11, 0x68, $60, 0b10100010, k_431
+        .DW 61967, 0xcce0 ; row 432
+        LDI r16, k_432
+.EQU k_433 = 0xa1
+t_433: .DB k_433, 80, 0xf7, $07, 0b11000110, k_432
+        .DW 20004, 0xed80 ; row 433
+        LDI r17, k_433
+.EQU k_434 = 0x6d
+t_434: .DB k_434, 32, 0xc2, $0e, 0b10010101, k_433
+        .DW 15740, 0x52f4 ; row 434
+        LDI r18, k_434
+.EQU k_435 = 0xa3
+t_435: .DB k_435, 103, 0xe4, $ff, 0b10101110, k_434
+        .DW 5107, 0xd5ee ; row 435
+        LDI r19, k_435
+.EQU k_436 = 0x89
+t_436: .DB k_436, 31, 0x38, $cd, 0b01100100, k_435
+        .DW 1368, 0x3962 ; row 436
+        LDI r20, k_436
+.EQU k_437 = 0xfd
+t_437: .DB k_437, 79, 0xd4, $ae, 0b01011110, k_436
+        .DW 41300, 0x1692 ; row 437
+        LDI r21, k_437
+.EQU k_438 = 0xb6
+t_438: .DB k_438, 76, 0x0e, $70, 0b10110110, k_437
+        .DW 7689, 0xdf2d ; row 438
+        LDI r22, k_438
+.EQU k_439 = 0x96
+t_439: .DB k_439, 71, 0xdc, $f6, 0b00111101, k_438
+        .DW 53365, 0x834c ; row 439
+        LDI r23, k_439
+.EQU k_440 = 0xe2
+t_440: .DB k_440, 69, 0xa5, $c0, 0b10111101, k_439
+        .DW 9722, 0xdc75 ; row 440
+        LDI r24, k_440
+.EQU k_441 = 0x76
+t_441: .DB k_441, 59, 0xef, $da, 0b01011001, k_440
+        .DW 48584, 0x8457 ; row 441
+        LDI r25, k_441
+.EQU k_442 = 0x2b
+t_442: .DB k_442, 50, 0xce, $d5, 0b00000011, k_441
+        .DW 11406, 0x4d18 ; row 442
+        LDI r26, k_442
+.EQU k_443 = 0xb5
+t_443: .DB k_443, 93, 0x9a, $0d, 0b11100000, k_442
+        .DW 2595, 0xb5e7 ; row 443
+        LDI r27, k_443
+.EQU k_444 = 0xc5
+t_444: .DB k_444, 45, 0x3b, $10, 0b01100111, k_443
+        .DW 60246, 0x191f ; row 444
+        LDI r28, k_444
+.EQU k_445 = 0x69
+t_445: .DB k_445, 15, 0xee, $5e, 0b01111010, k_444
+        .DW 12458, 0x8f27 ; row 445
+        LDI r29, k_445
+.EQU k_446 = 0x3d
+t_446: .DB k_446, 82, 0xe8, $eb, 0b11001010, k_445
+        .DW 32871, 0x0d41 ; row 446
+        LDI r30, k_446
+.EQU k_447 = 0xb9
+t_447: .DB k_447, 60, 0x56, $3c, 0b11110110, k_446
+        .DW 3566, 0x8d1e ; row 447
+        LDI r31, k_447
+.EQU k_448 = 0x96
+t_448: .DB k_448, 15, 0x09, $19, 0b11011110, k_447
+        .DW 46645, 0xb18a ; row 448
+        LDI r16, k_448
+.EQU k_449 = 0x3a
+t_449: .DB k_449, 51, 0xcd, $be, 0b01011011, k_448
+        .DW 43548, 0x9fad ; row 449
+        LDI r17, k_449
+.EQU k_450 = 0xe9
+t_450: .DB k_450, 57, 0x44, $ee, 0b10010110, k_449
+        .DW 22490, 0x012e ; row 450
+        LDI r18, k_450
+.EQU k_451 = 0x4e
+t_451: .DB k_451, 28, 0x44, $b0, 0b00110100, k_450
+        .DW 28248, 0x4660 ; row 451
+        LDI r19, k_451
+.EQU k_452 = 0xb3
+t_452: .DB k_452, 109, 0xff, $54, 0b11010110, k_451
+        .DW 12574, 0x0931 ; row 452
+        LDI r20, k_452
+.EQU k_453 = 0xe5
+t_453: .DB k_453, 85, 0x77, $e2, 0b11110010, k_452
+        .DW 30977, 0x8895 ; row 453
+        LDI r21, k_453
+.EQU k_454 = 0x11
+t_454: .DB k_454, 54, 0x74, $46, 0b10000000, k_453
+        .DW 52909, 0x4c01 ; row 454
+        LDI r22, k_454
+.EQU k_455 = 0xb8
+t_455: .DB k_455, 72, 0x98, $2a, 0b11000010, k_454
+        .DW 9386, 0xd1d6 ; row 455
+        LDI r23, k_455
+.EQU k_456 = 0xbf
+t_456: .DB k_456, 28, 0xcc, $2e, 0b10001010, k_455
+        .DW 20116, 0x81f0 ; row 456
+        LDI r24, k_456
+.EQU k_457 = 0x91
+t_457: .DB k_457, 4, 0x98, $c4, 0b10111000, k_456
+        .DW 2518, 0xa849 ; row 457
+        LDI r25, k_457
+.EQU k_458 = 0xc1
+t_458: .DB k_458, 24, 0xe0, $74, 0b00011111, k_457
+        .DW 56214, 0xc605 ; row 458
+        LDI r26, k_458
+.EQU k_459 = 0x14
+t_459: .DB k_459, 22, 0x4d, $93, 0b00110001, k_458
+        .DW 44111, 0x5179 ; row 459
+        LDI r27, k_459
+.EQU k_460 = 0xe7
+t_460: .DB k_460, 61, 0xcf, $63, 0b00101000, k_459
+        .DW 57519, 0x42b5 ; row 460
+        LDI r28, k_460
+.EQU k_461 = 0x32
+t_461: .DB k_461, 25, 0x4c, $83, 0b00000000, k_460
+        .DW 39608, 0x3d74 ; row 461
+        LDI r29, k_461
+.EQU k_462 = 0x37
+t_462: .DB k_462, 47, 0x5a, $73, 0b00011011, k_461
+        .DW 25966, 0x7cd5 ; row 462
+        LDI r30, k_462
+.EQU k_463 = 0xb3
+t_463: .DB k_463, 83, 0xb4, $70, 0b01110000, k_462
+        .DW 38274, 0xf59f ; row 463
+        LDI r31, k_463
+.EQU k_464 = 0x0b
+t_464: .DB k_464, 126, 0x66, $3c, 0b10001001, k_463
+        .DW 54090, 0xf700 ; row 464
+        LDI r16, k_464
+.EQU k_465 = 0xc7
+t_465: .DB k_465, 26, 0x14, $88, 0b11111010, k_464
+        .DW 59274, 0x7e40 ; row 465
+        LDI r17, k_465
+.EQU k_466 = 0x6b
+t_466: .DB k_466, 3, 0x26, $e9, 0b10100010, k_465
+        .DW 43451, 0x4777 ; row 466
+        LDI r18, k_466
+.EQU k_467 = 0x5a
+t_467: .DB k_467, 89, 0x80, $65, 0b10110011, k_466
+        .DW 8737, 0x2340 ; row 467
+        LDI r19, k_467
+.EQU k_468 = 0x9c
+t_468: .DB k_468, 74, 0xbc, $69, 0b01111110, k_467
+        .DW 15517, 0xcd7e ; row 468
+        LDI r20, k_468
+.EQU k_469 = 0x8e
+t_469: .DB k_469, 95, 0x83, $09, 0b10101000, k_468
+        .DW 2732, 0x9add ; row 469
+        LDI r21, k_469
+.EQU k_470 = 0x13
+t_470: .DB k_470, 89, 0x8d, $3b, 0b00100101, k_469
+        .DW 42973, 0xf445 ; row 470
+        LDI r22, k_470
+.EQU k_471 = 0x75
+t_471: .DB k_471, 2, 0x41, $62, 0b00100010, k_470
+        .DW 61878, 0xf2b9 ; row 471
+        LDI r23, k_471
+.EQU k_472 = 0x62
+t_472: .DB k_472, 93, 0x28, $1c, 0b11111110, k_471
+        .DW 47347, 0x5367 ; row 472
+        LDI r24, k_472
+.EQU k_473 = 0x77
+t_473: .DB k_473, 25, 0xb9, $fb, 0b10101111, k_472
+        .DW 15599, 0xa8bf ; row 473
+        LDI r25, k_473
+.EQU k_474 = 0xff
+t_474: .DB k_474, 58, 0x45, $48, 0b00010011, k_473
+        .DW 8695, 0xe705 ; row 474
+        LDI r26, k_474
+.EQU k_475 = 0x99
+t_475: .DB k_475, 72, 0x73, $d1, 0b01010011, k_474
+        .DW 45283, 0x4111 ; row 475
+        LDI r27, k_475
+.EQU k_476 = 0xd0
+t_476: .DB k_476, 44, 0xd6, $3a, 0b00101110, k_475
+        .DW 27644, 0xaa6c ; row 476
+        LDI r28, k_476
+.EQU k_477 = 0x22
+t_477: .DB k_477, 15, 0x09, $dc, 0b10000010, k_476
+        .DW 64243, 0x2b46 ; row 477
+        LDI r29, k_477
+.EQU k_478 = 0xc1
+t_478: .DB k_478, 27, 0xa6, $c2, 0b00111101, k_477
+        .DW 56065, 0xc462 ; row 478
+        LDI r30, k_478
+.EQU k_479 = 0x7a
+t_479: .DB k_479, 17, 0x78, $bc, 0b00110111, k_478
+        .DW 33828, 0x2e91 ; row 479
+        LDI r31, k_479
+.EQU k_480 = 0x43
+t_480: .DB k_480, 107, 0x57, $e8, 0b01100110, k_479
+        .DW 42220, 0xb680 ; row 480
+        LDI r16, k_480
+.EQU k_481 = 0xe6
+t_481: .DB k_481, 88, 0x7c, $8c, 0b11111101, k_480
+        .DW 9869, 0x93d3 ; row 481
+        LDI r17, k_481
+.EQU k_482 = 0x4d
+t_482: .DB k_482, 42, 0xec, $33, 0b11000000, k_481
+        .DW 46817, 0xa973 ; row 482
+        LDI r18, k_482
+.EQU k_483 = 0x42
+t_483: .DB k_483, 98, 0x4c, $4b, 0b11010100, k_482
+        .DW 48173, 0xcd23 ; row 483
+        LDI r19, k_483
+.EQU k_484 = 0xa3
+t_484: .DB k_484, 103, 0x83, $3b, 0b11001001, k_483
+        .DW 59238, 0x5ba3 ; row 484
+        LDI r20, k_484
+.EQU k_485 = 0x44
+t_485: .DB k_485, 106, 0x61, $63, 0b00101110, k_484
+        .DW 35286, 0x22ce ; row 485
+        LDI r21, k_485
+.EQU k_486 = 0x0f
+t_486: .DB k_486, 88, 0xe4, $d1, 0b11101101, k_485
+        .DW 42799, 0xbaaf ; row 486
+        LDI r22, k_486
+.EQU k_487 = 0x6d
+t_487: .DB k_487, 64, 0x50, $1b, 0b00000000, k_486
+        .DW 39872, 0x7810 ; row 487
+        LDI r23, k_487
+.EQU k_488 = 0x5b
+t_488: .DB k_488, 3, 0x62, $d8, 0b00010011, k_487
+        .DW 24003, 0x7cb7 ; row 488
+        LDI r24, k_488
+.EQU k_489 = 0x0d
+t_489: .DB k_489, 96, 0x6d, $d7, 0b10110001, k_488
+        .DW 33565, 0x7b8c ; row 489
+        LDI r25, k_489
+.EQU k_490 = 0x9b
+t_490: .DB k_490, 109, 0x02, $70, 0b10111111, k_489
+        .DW 15922, 0xb4d2 ; row 490
+        LDI r26, k_490
+.EQU k_491 = 0x6c
+t_491: .DB k_491, 67, 0xe6, $aa, 0b10100111, k_490
+        .DW 20972, 0x6479 ; row 491
+        LDI r27, k_491
+.EQU k_492 = 0x1b
+t_492: .DB k_492, 50, 0x5e, $90, 0b11111100, k_491
+        .DW 42520, 0x2533 ; row 492
+        LDI r28, k_492
+.EQU k_493 = 0x23
+t_493: .DB k_493, 14, 0xa3, $38, 0b01110110, k_492
+        .DW 9310, 0x92f3 ; row 493
+        LDI r29, k_493
+.EQU k_494 = 0x33
+t_494: .DB k_494, 45, 0x8e, $23, 0b01100001, k_493
+        .DW 48781, 0x6ddc ; row 494
+        LDI r30, k_494
+.EQU k_495 = 0xf1
+t_495: .DB k_495, 3, 0xc9, $43, 0b01011111, k_494
+        .DW 61497, 0xd5a9 ; row 495
+        LDI r31, k_495
+.EQU k_496 = 0xa9
+t_496: .DB k_496, 112, 0xb1, $3f, 0b00011011, k_495
+        .DW 2355, 0xea9b ; row 496
+        LDI r16, k_496
+.EQU k_497 = 0x38
+t_497: .DB k_497, 4, 0x8e, $c9, 0b00100001, k_496
+        .DW 36866, 0x120e ; row 497
+        LDI r17, k_497
+.EQU k_498 = 0x7f
+t_498: .DB k_498, 105, 0xca, $5b, 0b01110011, k_497
+        .DW 49618, 0xe267 ; row 498
+        LDI r18, k_498
+.EQU k_499 = 0x18
+t_499: .DB k_499, 4, 0x90, $61, 0b11011101, k_498
+        .DW 56216, 0x18ca ; row 499
+        LDI r19, k_499
+.EQU k_500 = 0xdb
+t_500: .DB k_500, 0, 0x00, $5b, 0b01111100, k_499
+        .DW 4689, 0x513d ; row 500
+        LDI r20, k_500
+.EQU k_501 = 0x03
+t_501: .DB k_501, 53, 0x30, $ad, 0b11100000, k_500
+        .DW 30359, 0xe6c1 ; row 501
+        LDI r21, k_501
+.EQU k_502 = 0x68
+t_502: .DB k_502, 102, 0xa4, $0b, 0b11111000, k_501
+        .DW 4960, 0x0de8 ; row 502
+        LDI r22, k_502
+.EQU k_503 = 0x26
+t_503: .DB k_503, 9, 0xef, $a8, 0b01111000, k_502
+        .DW 36925, 0x7d33 ; row 503
+        LDI r23, k_503
+.EQU k_504 = 0x71
+t_504: .DB k_504, 27, 0x2d, $33, 0b01111010, k_503
+        .DW 53453, 0x8795 ; row 504
+        LDI r24, k_504
+.EQU k_505 = 0x7b
+t_505: .DB k_505, 77, 0xae, $1d, 0b00001010, k_504
+        .DW 39822, 0x7f7e ; row 505
+        LDI r25, k_505
+.EQU k_506 = 0xa2
+t_506: .DB k_506, 45, 0xd1, $44, 0b00000010, k_505
+        .DW 41051, 0x25cc ; row 506
+        LDI r26, k_506
+.EQU k_507 = 0x2b
+t_507: .DB k_507, 51, 0x7f, $74, 0b00111011, k_506
+        .DW 12707, 0x22fc ; row 507
+        LDI r27, k_507
+.EQU k_508 = 0xf4
+t_508: .DB k_508, 38, 0xd5, $b5, 0b00111011, k_507
+        .DW 8080, 0x1150 ; row 508
+        LDI r28, k_508
+.EQU k_509 = 0x6e
+t_509: .DB k_509, 59, 0x9e, $b6, 0b01101110, k_508
+        .DW 32564, 0xba05 ; row 509
+        LDI r29, k_509
+.EQU k_510 = 0x90
+t_510: .DB k_510, 82, 0x2f, $8b, 0b00001001, k_509
+        .DW 47720, 0x36df ; row 510
+        LDI r30, k_510
+.EQU k_511 = 0x3b
+t_511: .DB k_511, 60, 0xb8, $c1, 0b10010011, k_510
+        .DW 5349, 0x47b5 ; row 511
+        LDI r31, k_511
+.EQU k_512 = 0x81
+t_512: .DB k_512, 12, 0xd8, $c0, 0b10110001, k_511
+        .DW 33095, 0xfd87 ; row 512
+        LDI r16, k_512
+.EQU k_513 = 0xb0
+t_513: .DB k_513, 77, 0x8f, $3f, 0b10111101, k_512
+        .DW 39889, 0xeb7d ; row 513
+        LDI r17, k_513
+.EQU k_514 = 0xa5
+t_514: .DB k_514, 43, 0x7f, $ef, 0b10111111, k_513
+        .DW 8323, 0x671b ; row 514
+        LDI r18, k_514
+.EQU k_515 = 0xc9
+t_515: .DB k_515, 65, 0x12, $70, 0b00000010, k_514
+        .DW 52481, 0xc667 ; row 515
+        LDI r19, k_515
+.EQU k_516 = 0x6d
+t_516: .DB k_516, 48, 0xa1, $28, 0b00001000, k_515
+        .DW 52761, 0xdf2f ; row 516
+        LDI r20, k_516
+.EQU k_517 = 0xad
+t_517: .DB k_517, 51, 0xe5, $27, 0b00000100, k_516
+        .DW 51397, 0x443f ; row 517
+        LDI r21, k_517
+.EQU k_518 = 0x08
+t_518: .DB k_518, 17, 0xf5, $e2, 0b01110010, k_517
+        .DW 31676, 0xad61 ; row 518
+        LDI r22, k_518
+.EQU k_519 = 0x6c
+t_519: .DB k_519, 44, 0xb9, $0c, 0b10000101, k_518
+        .DW 56003, 0xff9b ; row 519
+        LDI r23, k_519
+.EQU k_520 = 0xf5
+t_520: .DB k_520, 125, 0x0a, $26, 0b10011001, k_519
+        .DW 60329, 0xe869 ; row 520
+        LDI r24, k_520
+.EQU k_521 = 0xe5
+t_521: .DB k_521, 56, 0xc1, $fc, 0b01101011, k_520
+        .DW 34972, 0x5a20 ; row 521
+        LDI r25, k_521
+.EQU k_522 = 0x2c
+t_522: .DB k_522, 74, 0x89, $5d, 0b00001100, k_521
+        .DW 7542, 0x9a96 ; row 522
+        LDI r26, k_522
+.EQU k_523 = 0x0b
+t_523: .DB k_523, 54, 0x21, $38, 0b10011011, k_522
+        .DW 6703, 0xb4f1 ; row 523
+        LDI r27, k_523
+.EQU k_524 = 0x08
+t_524: .DB k_524, 94, 0x34, $e3, 0b00111100, k_523
+        .DW 55244, 0xd8fb ; row 524
+        LDI r28, k_524
+.EQU k_525 = 0xd6
+t_525: .DB k_525, 125, 0x54, $8e, 0b01010010, k_524
+        .DW 49970, 0x3e08 ; row 525
+        LDI r29, k_525
+.EQU k_526 = 0xc4
+t_526: .DB k_526, 59, 0xf7, $47, 0b11110000, k_525
+        .DW 13937, 0x24c3 ; row 526
+        LDI r30, k_526
+.EQU k_527 = 0x30
+t_527: .DB k_527, 51, 0xae, $73, 0b11011110, k_526
+        .DW 47102, 0xa921 ; row 527
+        LDI r31, k_527
+.EQU k_528 = 0x5c
+t_528: .DB k_528, 123, 0x3f, $56, 0b01011101, k_527
+        .DW 13588, 0xdc4f ; row 528
+        LDI r16, k_528
+.EQU k_529 = 0x20
+t_529: .DB k_529, 82, 0x69, $b0, 0b10110000, k_528
+        .DW 36337, 0xb0bc ; row 529
+        LDI r17, k_529
+.EQU k_530 = 0x2d
+t_530: .DB k_530, 76, 0x8a, $3c, 0b11000011, k_529
+        .DW 26833, 0x78b2 ; row 530
+        LDI r18, k_530
+.EQU k_531 = 0x4f
+t_531: .DB k_531, 31, 0x0d, $c7, 0b01011001, k_530
+        .DW 694, 0xedca ; row 531
+        LDI r19, k_531
+.EQU k_532 = 0x24
+t_532: .DB k_532, 93, 0x7e, $d1, 0b10000100, k_531
+        .DW 17489, 0x4ee5 ; row 532
+        LDI r20, k_532
+.EQU k_533 = 0x57
+t_533: .DB k_533, 98, 0x02, $bf, 0b10010101, k_532
+        .DW 31527, 0xf776 ; row 533
+        LDI r21, k_533
+.EQU k_534 = 0xeb
+t_534: .DB k_534, 51, 0xc3, $ec, 0b01101111, k_533
+        .DW 63969, 0x0014 ; row 534
+        LDI r22, k_534
+.EQU k_535 = 0x67
+t_535: .DB k_535, 72, 0x08, $68, 0b10011011, k_534
+        .DW 35840, 0x28b8 ; row 535
+        LDI r23, k_535
+.EQU k_536 = 0xb6
+t_536: .DB k_536, 26, 0x25, $c5, 0b01111001, k_535
+        .DW 55810, 0xb562 ; row 536
+        LDI r24, k_536
+.EQU k_537 = 0xf0
+t_537: .DB k_537, 87, 0xa5, $ae, 0b01101000, k_536
+        .DW 49980, 0x493f ; row 537
+        LDI r25, k_537
+.EQU k_538 = 0x8a
+t_538: .DB k_538, 62, 0x4f, $b5, 0b11101111, k_537
+        .DW 40212, 0x8d95 ; row 538
+        LDI r26, k_538
+.EQU k_539 = 0xc1
+t_539: .DB k_539, 64, 0x18, $22, 0b01000001, k_538
+        .DW 14772, 0xf5c5 ; row 539
+        LDI r27, k_539
+.EQU k_540 = 0x37
+t_540: .DB k_540, 26, 0x82, $65, 0b00110000, k_539
+        .DW 22082, 0x1374 ; row 540
+        LDI r28, k_540
+.EQU k_541 = 0x53
+t_541: .DB k_541, 118, 0xd7, $ce, 0b00101010, k_540
+        .DW 64050, 0x9c36 ; row 541
+        LDI r29, k_541
+.EQU k_542 = 0x6f
+t_542: .DB k_542, 102, 0x83, $af, 0b00011001, k_541
+        .DW 23186, 0x3632 ; row 542
+        LDI r30, k_542
+.EQU k_543 = 0x23
+t_543: .DB k_543, 85, 0x13, $8f, 0b01011101, k_542
+        .DW 62943, 0x5e7a ; row 543
+        LDI r31, k_543
+.EQU k_544 = 0xdb
+t_544: .DB k_544, 92, 0x4e, $11, 0b10101101, k_543
+        .DW 36481, 0x80e1 ; row 544
+        LDI r16, k_544
+.EQU k_545 = 0x7e
+t_545: .DB k_545, 54, 0x17, $bc, 0b00100100, k_544
+        .DW 506, 0x8ba3 ; row 545
+        LDI r17, k_545
+.EQU k_546 = 0xa5
+t_546: .DB k_546, 24, 0x60, $b3, 0b00000010, k_545
+        .DW 15483, 0x4bdb ; row 546
+        LDI r18, k_546
+.EQU k_547 = 0xd4
+t_547: .DB k_547, 68, 0xbb, $f5, 0b11001111, k_546
+        .DW 48816, 0x022f ; row 547
+        LDI r19, k_547
+.EQU k_548 = 0x1c
+t_548: .DB k_548, 16, 0x28, $43, 0b01101110, k_547
+        .DW 33541, 0x9fd1 ; row 548
+        LDI r20, k_548
+.EQU k_549 = 0xce
+t_549: .DB k_549, 25, 0xf9, $9d, 0b10000111, k_548
+        .DW 4012, 0x6664 ; row 549
+        LDI r21, k_549
+.EQU k_550 = 0x1b
+t_550: .DB k_550, 59, 0xf3, $41, 0b01011010, k_549
+        .DW 3453, 0x9e9e ; row 550
+        LDI r22, k_550
+.EQU k_551 = 0x47
+t_551: .DB k_551, 8, 0xc0, $89, 0b10001010, k_550
+        .DW 36613, 0x6d84 ; row 551
+        LDI r23, k_551
+.EQU k_552 = 0xa8
+t_552: .DB k_552, 91, 0xce, $0d, 0b11101010, k_551
+        .DW 3405, 0xf8f2 ; row 552
+        LDI r24, k_552
+.EQU k_553 = 0x56
+t_553: .DB k_553, 108, 0xb8, $91, 0b11001111, k_552
+        .DW 34737, 0xa13b ; row 553
+        LDI r25, k_553
+.EQU k_554 = 0x41
+t_554: .DB k_554, 33, 0x94, $65, 0b10100111, k_553
+        .DW 38981, 0x73e6 ; row 554
+        LDI r26, k_554
+.EQU k_555 = 0xf6
+t_555: .DB k_555, 8, 0x9c, $93, 0b00101010, k_554
+        .DW 57848, 0x8bc1 ; row 555
+        LDI r27, k_555
+.EQU k_556 = 0x85
+t_556: .DB k_556, 72, 0x58, $9f, 0b00010000, k_555
+        .DW 64417, 0x4326 ; row 556
+        LDI r28, k_556
+.EQU k_557 = 0xdc
+t_557: .DB k_557, 1, 0xf4, $be, 0b00011100, k_556
+        .DW 62154, 0xdb26 ; row 557
+        LDI r29, k_557
+.EQU k_558 = 0x52
+t_558: .DB k_558, 16, 0x48, $d3, 0b00010000, k_557
+        .DW 35618, 0x3323 ; row 558
+        LDI r30, k_558
+.EQU k_559 = 0xff
+t_559: .DB k_559, 84, 0xdd, $43, 0b10101011, k_558
+        .DW 58796, 0x5de0 ; row 559
+        LDI r31, k_559
+.EQU k_560 = 0xaa
+t_560: .DB k_560, 26, 0x9e, $95, 0b01011111, k_559
+        .DW 54274, 0xccca ; row 560
+        LDI r16, k_560
+.EQU k_561 = 0x3a
+t_561: .DB k_561, 29, 0x69, $7c, 0b10011111, k_560
+        .DW 25666, 0x6467 ; row 561
+        LDI r17, k_561
+.EQU k_562 = 0xf1
+t_562: .DB k_562, 73, 0x60, $83, 0b11110000, k_561
+        .DW 13666, 0xfbe0 ; row 562
+        LDI r18, k_562
+.EQU k_563 = 0xcb
+t_563: .DB k_563, 44, 0xb6, $10, 0b10100010, k_562
+        .DW 65353, 0x8419 ; row 563
+        LDI r19, k_563
+.EQU k_564 = 0x3f
+t_564: .DB k_564, 24, 0xd9, $e2, 0b01100110, k_563
+        .DW 30156, 0xc592 ; row 564
+        LDI r20, k_564
+.EQU k_565 = 0xdf
+t_565: .DB k_565, 64, 0xd9, $68, 0b00000001, k_564
+        .DW 4988, 0x3325 ; row 565
+        LDI r21, k_565
+.EQU k_566 = 0x50
+t_566: .DB k_566, 34, 0xf7, $f2, 0b00010010, k_565
+        .DW 42528, 0x4293 ; row 566
+        LDI r22, k_566
+.EQU k_567 = 0xc7
+t_567: .DB k_567, 102, 0xdd, $04, 0b00000111, k_566
+        .DW 56460, 0xf8ed ; row 567
+        LDI r23, k_567
+.EQU k_568 = 0x74
+t_568: .DB k_568, 84, 0xfc, $97, 0b11001010, k_567
+        .DW 27127, 0xd92f ; row 568
+        LDI r24, k_568
+.EQU k_569 = 0x84
+t_569: .DB k_569, 52, 0xf9, $3b, 0b01111000, k_568
+        .DW 52402, 0xadb2 ; row 569
+        LDI r25, k_569
+.EQU k_570 = 0x51
+t_570: .DB k_570, 109, 0x9e, $46, 0b10110011, k_569
+        .DW 39672, 0x4eed ; row 570
+        LDI r26, k_570
+.EQU k_571 = 0x72
+t_571: .DB k_571, 126, 0x85, $85, 0b10110010, k_570
+        .DW 62180, 0xdf27 ; row 571
+        LDI r27, k_571
+.EQU k_572 = 0x30
+t_572: .DB k_572, 13, 0x0e, $4e, 0b11111110, k_571
+        .DW 40871, 0x2357 ; row 572
+        LDI r28, k_572
+.EQU k_573 = 0x14
+t_573: .DB k_573, 45, 0x78, $76, 0b01011111, k_572
+        .DW 10480, 0xf5a5 ; row 573
+        LDI r29, k_573
+.EQU k_574 = 0x75
+t_574: .DB k_574, 0, 0x91, $6e, 0b10011001, k_573
+        .DW 12866, 0xf0b1 ; row 574
+        LDI r30, k_574
+.EQU k_575 = 0xfd
+t_575: .DB k_575, 31, 0xdf, $72, 0b01111101, k_574
+        .DW 3290, 0x3c69 ; row 575
+        LDI r31, k_575
+.EQU k_576 = 0x9c
+t_576: .DB k_576, 48, 0x79, $b8, 0b01011010, k_575
+        .DW 33826, 0x2978 ; row 576
+        LDI r16, k_576
+.EQU k_577 = 0x7e
+t_577: .DB k_577, 73, 0xaf, $b4, 0b11000110, k_576
+        .DW 27850, 0x4bb0 ; row 577
+        LDI r17, k_577
+.EQU k_578 = 0x3d
+t_578: .DB k_578, 63, 0xbc, $17, 0b11011011, k_577
+        .DW 22336, 0xad9d ; row 578
+        LDI r18, k_578
+.EQU k_579 = 0xf4
+t_579: .DB k_579, 100, 0xf2, $93, 0b10010110, k_578
+        .DW 23868, 0x6365 ; row 579
+        LDI r19, k_579
+.EQU k_580 = 0x56
+t_580: .DB k_580, 60, 0xb3, $c6, 0b01010101, k_579
+        .DW 8509, 0xe5db ; row 580
+        LDI r20, k_580
+.EQU k_581 = 0x2f
+t_581: .DB k_581, 69, 0x79, $33, 0b11101101, k_580
+        .DW 16409, 0x46fd ; row 581
+        LDI r21, k_581
+.EQU k_582 = 0xa5
+t_582: .DB k_582, 51, 0x1d, $03, 0b00010000, k_581
+        .DW 38575, 0xb786 ; row 582
+        LDI r22, k_582
+.EQU k_583 = 0x6f
+t_583: .DB k_583, 108, 0xde, $92, 0b11001101, k_582
+        .DW 49349, 0xc089 ; row 583
+        LDI r23, k_583
+.EQU k_584 = 0x16
+t_584: .DB k_584, 106, 0x48, $43, 0b00001010, k_583
+        .DW 44708, 0x63a7 ; row 584
+        LDI r24, k_584
+.EQU k_585 = 0xff
+t_585: .DB k_585, 15, 0xf9, $3b, 0b11110101, k_584
+        .DW 12335, 0x6bc2 ; row 585
+        LDI r25, k_585
+.EQU k_586 = 0x47
+t_586: .DB k_586, 95, 0x80, $a6, 0b00101110, k_585
+        .DW 24604, 0x0205 ; row 586
+        LDI r26, k_586
+.EQU k_587 = 0x6d
+t_587: .DB k_587, 110, 0xab, $90, 0b00100111, k_586
+        .DW 7169, 0x310e ; row 587
+        LDI r27, k_587
+.EQU k_588 = 0x47
+t_588: .DB k_588, 30, 0x94, $e0, 0b11111111, k_587
+        .DW 48780, 0x0ef2 ; row 588
+        LDI r28, k_588
+.EQU k_589 = 0x26
+t_589: .DB k_589, 46, 0x54, $85, 0b01111110, k_588
+        .DW 58436, 0x17e1 ; row 589
+        LDI r29, k_589
+.EQU k_590 = 0x07
+t_590: .DB k_590, 118, 0xc1, $85, 0b10101110, k_589
+        .DW 47865, 0x016c ; row 590
+        LDI r30, k_590
+.EQU k_591 = 0x74
+t_591: .DB k_591, 15, 0x4e, $55, 0b00110010, k_590
+        .DW 42707, 0xeed6 ; row 591
+        LDI r31, k_591
+.EQU k_592 = 0xe7
+t_592: .DB k_592, 46, 0x4a, $01, 0b11111100, k_591
+        .DW 9267, 0x95ca ; row 592
+        LDI r16, k_592
+.EQU k_593 = 0xcc
+t_593: .DB k_593, 81, 0x3c, $4b, 0b10011010, k_592
+        .DW 64203, 0xd33a ; row 593
+        LDI r17, k_593
+.EQU k_594 = 0x00
+t_594: .DB k_594, 58, 0x9b, $b9, 0b00000001, k_593
+        .DW 52087, 0x8614 ; row 594
+        LDI r18, k_594
+.EQU k_595 = 0x4f
+t_595: .DB k_595, 32, 0xa4, $af, 0b11010010, k_594
+        .DW 33410, 0x58e1 ; row 595
+        LDI r19, k_595
+.EQU k_596 = 0xb8
+t_596: .DB k_596, 54, 0x98, $34, 0b10001011, k_595
+        .DW 30695, 0xa85f ; row 596
+        LDI r20, k_596
+.EQU k_597 = 0x1c
+t_597: .DB k_597, 120, 0x25, $45, 0b11110001, k_596
+        .DW 3115, 0x7aa6 ; row 597
+        LDI r21, k_597
+.EQU k_598 = 0x5d
+t_598: .DB k_598, 10, 0x56, $9a, 0b00000101, k_597
+        .DW 26145, 0xc2e0 ; row 598
+        LDI r22, k_598
+.EQU k_599 = 0x7b
+t_599: .DB k_599, 40, 0x48, $f5, 0b11110111, k_598
+        .DW 11349, 0xe04b ; row 599
+        LDI r23, k_599
+        BREAK
@@ -0,0 +1,21 @@
+; The timer overflow interrupt (vector 1, with one word vectors) counts
+; ticks while the main loop waits for TICKS of them. Run under a
+; Scheduler, which skips the waiting.
+.EQU TICKS = 200
+.EQU SREG = 0x3f
+
+        RJMP main
+        RJMP tick
+
+main:   CLR r20
+        SEI
+wait:   CPI r20, TICKS
+        BRNE wait
+        BREAK
+
+tick:   PUSH r16
+        IN r16, SREG
+        INC r20
+        OUT SREG, r16
+        POP r16
+        RETI
@@ -0,0 +1,94 @@
+"""
+Differential check of the fast lexer against the PLY one.
+
+Lexes a set of hand-written inputs and random strings made of the
+characters the rules care about with both lexers, and compares the tokens
+(type, value, line and position) and any "Illegal character" messages.
+Inputs the PLY lexer itself fails on are skipped.
+
+Usage: python check_fastlex.py [-n CASES] [--seed N]
+
+Exits with status 1 if any input lexes differently.
+"""
+import argparse
+import random
+import sys
+from StringIO import StringIO
+
+from assembler import ASMParser
+
+kCases = [
+    'LDI r16, K\n',
+    'lab: .DB "a\\"b\\\\c\\n", 1,2 ; x\n',
+    '-X Y+ Z+3 -5 0x1f $FF 0b101 012 r1abc 12abc 0x\n',
+    '.equ X = 3\nX = 4\n .Org 10 \t .cseg .dseg .eseg .include "f"\n',
+    'acc, K big Kx . .. a.b: @ # !\n',
+    '"multi\nline" x\n',
+    'a "unterminated\nmore\n',
+    'x  ',
+    '  ',
+    '\t;c  \n  ',
+    ]
+
+kAlphabet = 'ab r1 0x$;:"\\\n\t,.-+=@XYZK#9_'
+
+def _tokens(fast, text):
+    parser = ASMParser(fast_lexer=fast)
+    parser.build()
+    parser.variables = {"K": 5, "big": 300}
+    parser.defs = {"acc": 17}
+    lexer = parser.lexer.lexer
+    lexer.lineno = 1
+    lexer.begin("INITIAL")
+    stdout = sys.stdout
+    sys.stdout = messages = StringIO()
+    try:
+        lexer.input(text)
+        tokens = []
+        while True:
+            tok = lexer.token()
+            if tok is None:
+                break
+            tokens.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+    finally:
+        sys.stdout = stdout
+    return tokens, messages.getvalue()
+
+def random_cases(count, seed):
+    rand = random.Random(seed)
+    return ["".join(rand.choice(kAlphabet)
+                    for _ in range(rand.randint(0, 30)))
+            for _ in range(count)]
+
+def check(cases):
+    """Returns (the cases lexed differently, the number skipped)."""
+    mismatches = []
+    skipped = 0
+    for text in cases:
+        try:
+            expected = _tokens(False, text)
+        except Exception:
+            skipped += 1
+            continue
+        if _tokens(True, text) != expected:
+            mismatches.append(text)
+    return mismatches, skipped
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check the fast lexer against the PLY lexer.")
+    parser.add_argument("-n", "--cases", type=int, default=3000,
+                        help="random inputs (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    cases = kCases + random_cases(args.cases, args.seed)
+    mismatches, skipped = check(cases)
+    for text in mismatches[:5]:
+        print "Mismatch: %r" % text
+    print "%d of %d inputs lexed differently (%d skipped)" % (
+        len(mismatches), len(cases), skipped)
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
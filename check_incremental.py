@@ -0,0 +1,126 @@
+"""
+Differential check of incremental reassembly against ASMParser.
+
+Starts from a random program and applies a series of random edits to it
+(changing, inserting and deleting lines, labels included), updating an
+IncrementalAssembler after each one and comparing its flash image and
+symbols with a full parse of the edited source. Edits that make the
+source invalid are skipped.
+
+Usage: python check_incremental.py [-n EDITS] [--lines N] [--seed N]
+
+Exits with status 1 at the first edit that reassembles differently.
+"""
+import argparse
+import random
+import sys
+
+import program as prog
+from assembler import ASMParser
+from incremental import IncrementalAssembler
+
+def random_line(rand, i, labels):
+    choice = rand.random()
+    if choice < 0.15:
+        return "lab%d:" % i
+    elif choice < 0.3 and labels:
+        return "    RJMP %s" % rand.choice(labels)
+    elif choice < 0.4 and labels:
+        return "    CALL %s" % rand.choice(labels)
+    elif choice < 0.45 and labels:
+        return "    BRNE %s" % labels[-1]
+    elif choice < 0.5:
+        return "    .DB 1, 2, 3"
+    elif choice < 0.55:
+        return "    STS var%d, r1" % rand.randint(0, 2)
+    return "    LDI r%d, %d" % (rand.randint(16, 31), rand.randint(0, 255))
+
+def _labels(lines):
+    return [line[:-1] for line in lines if line.endswith(":")]
+
+def random_program(rand, count):
+    lines = [".EQU count = 10"]
+    for i in range(count):
+        lines.append(random_line(rand, i, _labels(lines)))
+    lines += [".DSEG", "var0: .BYTE 2", "var1: .BYTE 1", "var2: .BYTE 1",
+              ""]
+    return lines
+
+def random_edit(rand, lines, serial):
+    """An edited copy of lines, or None if the edit would be invalid."""
+    edited = list(lines)
+    i = rand.randint(1, len(lines) - 7)
+    line = random_line(rand, serial, _labels(lines))
+    choice = rand.random()
+    if choice < 0.4:
+        edited[i] = line
+    elif choice < 0.7:
+        edited.insert(i, line)
+    elif lines[i].endswith(":"):
+        return None
+    else:
+        del edited[i]
+    if edited[i - 1].endswith(":") and edited[i - 1] in edited[:i - 1]:
+        return None
+    return edited
+
+def _full_parse(text):
+    parser = ASMParser()
+    parser.parse(text)
+    return parser.flash_image(), parser.symbols()
+
+def check(rand, edits, lines):
+    """
+    Returns (number of edits checked, the first edit that differed as
+    (old lines, new lines), or None).
+    """
+    lines = random_program(rand, lines)
+    incremental = IncrementalAssembler()
+    incremental.parse("\n".join(lines))
+    checked = 0
+    for serial in range(edits):
+        edited = random_edit(rand, lines, 1000 + serial)
+        if edited is None:
+            continue
+        text = "\n".join(edited)
+        try:
+            image, symbols = _full_parse(text)
+        except prog.ASMError:
+            continue
+        incremental.update(text)
+        if (incremental.source() != text
+            or len(incremental.image) != len(image)
+            or (incremental.image != image).any()
+            or incremental.symbols() != symbols):
+            return checked, (lines, edited)
+        lines = edited
+        checked += 1
+    return checked, None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check incremental reassembly against ASMParser.")
+    parser.add_argument("-n", "--edits", type=int, default=300,
+                        help="random edits (default: %(default)s)")
+    parser.add_argument("--lines", type=int, default=400,
+                        help="lines of the starting program (default: "
+                        "%(default)s)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    checked, failure = check(random.Random(args.seed), args.edits,
+                             args.lines)
+    if failure is not None:
+        old, new = failure
+        changed = [i for i in range(min(len(old), len(new)))
+                   if old[i] != new[i]][:1]
+        at = changed[0] if changed else min(len(old), len(new))
+        print "Mismatch after %d edits, at line %d: %r -> %r" % (
+            checked, at + 1, old[at] if at < len(old) else None,
+            new[at] if at < len(new) else None)
+        return 1
+    print "%d edits reassembled the same as a full parse" % checked
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
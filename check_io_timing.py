@@ -0,0 +1,101 @@
+"""
+Check that I/O handlers see the same cycle counts however a program runs.
+
+Runs programs that store to and load from an I/O register with handlers
+on Simulator and BlockSimulator (with and without superinstructions),
+each plain, under a Debugger and under a Profiler, recording cpu.cycles
+at every handler call, and compares the records with the plain
+Simulator's.
+
+Usage: python check_io_timing.py
+
+Exits with status 1 if any run records different cycles.
+"""
+import sys
+
+from assembler import ASMParser
+from debugger import Debugger
+from profiler import Profiler
+from simplesim import CPUState, Simulator
+from translator import BlockSimulator
+
+kRegister = 0x40
+
+kPrograms = [
+    # The stores end at cycles 6 and 10
+    """
+        LDI r16, 1
+        LDI r17, 2
+        NOP
+        NOP
+        STS 0x40, r16
+        NOP
+        NOP
+        STS 0x40, r17
+        BREAK
+    """,
+    # Loads and stores in a loop, with branches and a call
+    """
+        LDI r20, 5
+    loop:
+        IN r16, 0x20
+        RCALL sub
+        OUT 0x20, r16
+        DEC r20
+        BRNE loop
+        BREAK
+    sub:
+        LDS r17, 0x40
+        INC r17
+        STS 0x40, r17
+        RET
+    """,
+    ]
+
+kEngines = [
+    ("simulator", Simulator, False),
+    ("simulator_fused", Simulator, True),
+    ("block", BlockSimulator, False),
+    ("block_fused", BlockSimulator, True),
+    ]
+
+def _record(source, cls, fuse, runner):
+    asm = ASMParser()
+    asm.parse(source)
+    cpu = CPUState(0x900)
+    cpu.load_image(asm.flash_image())
+    record = []
+    cpu.add_io_handler(
+        kRegister, read=lambda addr: record.append(("r", cpu.cycles)) or 7,
+        write=lambda addr, value: record.append(("w", cpu.cycles)))
+    sim = cls(cpu, fuse=fuse)
+    if runner == "debugger":
+        reason = Debugger(sim).run()
+    elif runner == "profiler":
+        reason = Profiler(sim).run()
+    else:
+        reason = sim.run()
+    return reason, record
+
+def check():
+    """Returns a description of each run that differed."""
+    failures = []
+    for number, source in enumerate(kPrograms):
+        expected = _record(source, Simulator, False, "plain")
+        for name, cls, fuse in kEngines:
+            for runner in ("plain", "debugger", "profiler"):
+                result = _record(source, cls, fuse, runner)
+                if result != expected:
+                    failures.append("program %d, %s %s: %r, expected %r" % (
+                        number, name, runner, result, expected))
+    return failures
+
+def main(argv=None):
+    failures = check()
+    for failure in failures:
+        print failure
+    print "%d runs saw different handler cycles" % len(failures)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
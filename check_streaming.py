@@ -0,0 +1,87 @@
+"""
+Differential check of the streaming assembler against ASMParser.
+
+Generates random programs (forward and backward jumps and calls, data,
+.EQU/.DEF, data segment variables referred to before they are defined,
+and a second code segment with an .ORG), assembles each with
+StreamingAssembler.assemble_into() and with ASMParser, and compares the
+flash images and the symbol tables.
+
+Usage: python check_streaming.py [-n PROGRAMS] [--lines N] [--seed N]
+
+Exits with status 1 if any program assembles differently.
+"""
+import argparse
+import random
+import sys
+
+import numpy as np
+
+import program as prog
+from assembler import ASMParser
+from streaming import StreamingAssembler
+
+def random_program(rand, lines):
+    source = [".EQU count = 10", ".DEF tmp = r20"]
+    labels = ["lab%d" % i for i in range(0, lines, 7)]
+    for i in range(lines):
+        if i % 7 == 0:
+            source.append("lab%d:" % i)
+        choice = rand.random()
+        if choice < 0.2:
+            source.append("    RJMP %s" % rand.choice(labels))
+        elif choice < 0.3:
+            source.append("    CALL %s" % rand.choice(labels))
+        elif choice < 0.35:
+            source.append("    .DB 1, 2, 3")
+        elif choice < 0.4:
+            source.append("    STS var%d, r1" % rand.randint(0, 2))
+        elif choice < 0.45:
+            source.append("    LDI tmp, count")
+        elif choice < 0.5:
+            source.append("    LD r3, Y+")
+        else:
+            source.append("    LDI r%d, %d" % (rand.randint(16, 31),
+                                                rand.randint(0, 255)))
+    source += [".DSEG", "var0: .BYTE 2", "var1: .BYTE 1", "var2: .BYTE 1",
+               ".CSEG", ".ORG 0x700", "far: RJMP lab0", "    .DW 0x1234, 7"]
+    return source
+
+def check_program(source):
+    """Whether source streams to the same image and symbols."""
+    parser = ASMParser()
+    parser.parse("\n".join(source) + "\n")
+    expected = parser.flash_image()
+    streaming = StreamingAssembler()
+    image = np.zeros(len(expected), "<u2")
+    end = streaming.assemble_into(iter(source), image)
+    return (end == len(expected) and (image == expected).all()
+            and streaming.symbols() == parser.symbols())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check the streaming assembler against ASMParser.")
+    parser.add_argument("-n", "--programs", type=int, default=20,
+                        help="random programs (default: %(default)s)")
+    parser.add_argument("--lines", type=int, default=1000,
+                        help="instructions per program (default: "
+                        "%(default)s)")
+    parser.add_argument("--seed", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    rand = random.Random(args.seed)
+    failed = 0
+    for i in range(args.programs):
+        try:
+            if check_program(random_program(rand, args.lines)):
+                continue
+            print "Mismatch in program %d" % i
+        except prog.ASMError as e:
+            print "Error in program %d: %s" % (i, e)
+        failed += 1
+    print "%d of %d programs assembled differently" % (failed,
+                                                        args.programs)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
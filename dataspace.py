@@ -0,0 +1,71 @@
+"""
+Data space layout of the AVR parts.
+
+The data space starts with the register file (0x00-0x1f) and the 64 I/O
+registers (0x20-0x5f); larger parts then have extended I/O registers, and
+SRAM follows. A DeviceProfile gives these sizes for one part, and
+CPUState.for_device() makes a CPU with its data space and flash.
+
+Everything is held in CPUState.data and the ops index it directly. An I/O
+register that a peripheral needs to see the reads or writes of is given
+handlers with CPUState.add_io_handler(); its address is then flagged in
+CPUState.io_mask, a bytearray the load and store ops check before
+touching data, and its accesses go to the handlers. The handlers
+themselves are only kept in a dict, looked up for flagged addresses.
+"""
+from collections import namedtuple
+
+import program as prog
+
+kRegisterRegion = "registers"
+kIORegion = "io"
+kExtendedIORegion = "extended io"
+kSRAMRegion = "sram"
+
+class DeviceProfile(namedtuple("DeviceProfile",
+                               "name ext_io_size sram_size flash_words")):
+    __slots__ = ()
+
+    @property
+    def ext_io_start(self):
+        return prog.kIOOffset + prog.kIOSize
+
+    @property
+    def sram_start(self):
+        return self.ext_io_start + self.ext_io_size
+
+    @property
+    def ramend(self):
+        return self.sram_start + self.sram_size - 1
+
+    @property
+    def data_size(self):
+        return self.ramend + 1
+
+    def region(self, addr):
+        """Which part of the data space addr is in, or None if beyond it."""
+        if addr < prog.kIOOffset:
+            return kRegisterRegion
+        elif addr < self.ext_io_start:
+            return kIORegion
+        elif addr < self.sram_start:
+            return kExtendedIORegion
+        elif addr <= self.ramend:
+            return kSRAMRegion
+        return None
+
+
+kDevices = dict((device.name, device) for device in [
+    DeviceProfile("attiny85", 0, 512, 0x1000),
+    DeviceProfile("atmega8", 0, 1024, 0x1000),
+    DeviceProfile("atmega168", 160, 1024, 0x2000),
+    DeviceProfile("atmega328p", 160, 2048, 0x4000),
+    DeviceProfile("atmega1284p", 160, 16384, 0x10000),
+    ])
+
+def get_device(name):
+    try:
+        return kDevices[name.lower()]
+    except KeyError:
+        raise ValueError("Unknown device: %s (known: %s)"
+                         % (name, ", ".join(sorted(kDevices))))
@@ -0,0 +1,339 @@
+"""
+Breakpoints and watchpoints.
+
+Breakpoints are kept in a bitmap with one entry per flash word, and
+watchpoints in one with an entry per data space byte, so checking an
+instruction or a memory access costs one index however many of them are
+set. When there are none at all, Debugger.run is just the simulator's own
+run loop.
+
+Watchpoints see the data space accesses made by the memory instructions
+(loads and stores, IN/OUT, SBIC/SBIS, and the stack accesses of PUSH, POP,
+calls and returns). Register operands of other instructions, and the
+stack pointer updates made by push and pop, are not reported.
+"""
+from functools import partial
+
+import numpy as np
+
+import program as prog
+from simplesim import SimulationError
+
+kWatchRead = 1
+kWatchWrite = 2
+kWatchChange = 4    # a write that changes the stored value
+kWatchAccess = kWatchRead | kWatchWrite
+
+class Breakpoint(object):
+    """
+    Stops execution before the instruction at pc. If condition is given
+    it is called with the CPUState and the breakpoint only counts when it
+    returns true; the first ignore counted hits don't stop.
+    """
+    def __init__(self, pc, condition=None, ignore=0):
+        self.pc = pc
+        self.condition = condition
+        self.ignore = ignore
+        self.enabled = True
+        self.hits = 0
+
+    def __repr__(self):
+        return "<Breakpoint %04x hits=%d>" % (self.pc, self.hits)
+
+
+class Watchpoint(object):
+    """
+    Stops execution after an instruction accesses addr in one of the ways
+    in kind (a combination of kWatchRead, kWatchWrite and kWatchChange).
+    condition is called with the CPUState, the address and the old and new
+    values.
+    """
+    def __init__(self, addr, kind=kWatchWrite, condition=None, ignore=0):
+        self.addr = addr
+        self.kind = kind
+        self.condition = condition
+        self.ignore = ignore
+        self.enabled = True
+        self.hits = 0
+
+    def __repr__(self):
+        return "<Watchpoint %04x kind=%d hits=%d>" % (self.addr, self.kind,
+                                                      self.hits)
+
+
+# Functions giving the data space accesses an instruction is about to make,
+# by mnemonic. They take the CPU state and the operands, like the ops, and
+# return a list of (address, is_write) pairs.
+MemoryAccesses = {}
+
+class memory_access(object):
+    def __init__(self, *mnemonics):
+        self.mnemonics = mnemonics
+
+    def __call__(self, f):
+        for mnemonic in self.mnemonics:
+            MemoryAccesses[mnemonic] = f
+        return f
+
+def _stack_top(data):
+    return data[prog.kSPL] | (data[prog.kSPH] << 8)
+
+@memory_access("LDS")
+def _lds_access(cpu_state, d, k):
+    return [(k, False)]
+
+@memory_access("STS")
+def _sts_access(cpu_state, k, r):
+    return [(k, True)]
+
+@memory_access("IN")
+def _in_access(cpu_state, d, a):
+    return [(a + prog.kIOOffset, False)]
+
+@memory_access("OUT")
+def _out_access(cpu_state, a, r):
+    return [(a + prog.kIOOffset, True)]
+
+@memory_access("SBIC", "SBIS")
+def _sbic_access(cpu_state, a, b):
+    return [(a + prog.kIOOffset, False)]
+
+@memory_access("PUSH")
+def _push_access(cpu_state, r):
+    return [(_stack_top(cpu_state.data), True)]
+
+@memory_access("POP")
+def _pop_access(cpu_state, d):
+    return [(_stack_top(cpu_state.data) + 1, False)]
+
+@memory_access("RCALL", "CALL", "ICALL")
+def _call_access(cpu_state, *operands):
+    sp = _stack_top(cpu_state.data)
+    return [(sp, True), (sp - 1, True)]
+
+@memory_access("RET", "RETI")
+def _return_access(cpu_state):
+    sp = _stack_top(cpu_state.data)
+    return [(sp + 1, False), (sp + 2, False)]
+
+def _declare_pointer_accesses(pointer, reg):
+    def make(write):
+        def plain(cpu_state, x):
+            return [(prog.get_pointer(cpu_state.data, reg), write)]
+        def pre_dec(cpu_state, x):
+            addr = (prog.get_pointer(cpu_state.data, reg) - 1) & 0xffff
+            return [(addr, write)]
+        return plain, pre_dec
+    for name, write in (("LD_%s", False), ("ST_%s", True)):
+        plain, pre_dec = make(write)
+        memory_access(name % pointer, (name + "_INC") % pointer)(plain)
+        memory_access((name + "_DEC") % pointer)(pre_dec)
+
+for _pointer, _reg in (("X", prog.kXReg), ("Y", prog.kYReg),
+                       ("Z", prog.kZReg)):
+    _declare_pointer_accesses(_pointer, _reg)
+
+@memory_access("LDD_Y")
+def _ldd_y_access(cpu_state, d, q):
+    return [(prog.get_pointer(cpu_state.data, prog.kYReg) + q, False)]
+
+@memory_access("LDD_Z")
+def _ldd_z_access(cpu_state, d, q):
+    return [(prog.get_pointer(cpu_state.data, prog.kZReg) + q, False)]
+
+@memory_access("STD_Y")
+def _std_y_access(cpu_state, q, r):
+    return [(prog.get_pointer(cpu_state.data, prog.kYReg) + q, True)]
+
+@memory_access("STD_Z")
+def _std_z_access(cpu_state, q, r):
+    return [(prog.get_pointer(cpu_state.data, prog.kZReg) + q, True)]
+
+
+class Debugger(object):
+    """
+    Runs a Simulator (or BlockSimulator) with breakpoints and watchpoints.
+
+    pc_bitmap and watch_bitmap are boolean arrays the size of flash and of
+    the data space marking the addresses that have any breakpoint or
+    watchpoint. run() and step() return "breakpoint" or "watchpoint" when
+    one stops execution, with the details in last_stop, and otherwise
+    whatever the simulator's run() would.
+    """
+    def __init__(self, sim):
+        self.sim = sim
+        self.cpu = sim.cpu
+        # Kept as bytearrays for cheap indexing, like CPUState.data
+        self._pc_flags = bytearray(len(self.cpu.flash))
+        self._watch_flags = bytearray(len(self.cpu.data))
+        self.pc_bitmap = np.frombuffer(self._pc_flags, np.bool_)
+        self.watch_bitmap = np.frombuffer(self._watch_flags, np.bool_)
+        self.breakpoints = {}
+        self.watchpoints = {}
+        self.last_stop = None
+        # Per PC, the bound access function of a memory instruction, False
+        # for other instructions, or None if not looked up yet
+        self._accesses = [None] * len(self.cpu.flash)
+        self._resume_pc = None
+        self.cpu.add_flash_observer(self._invalidate)
+
+    def _invalidate(self, start, end):
+        accesses = self._accesses
+        for pc in range(max(start - 1, 0), min(end, len(accesses))):
+            accesses[pc] = None
+
+    def _lookup_access(self, pc):
+        op, operands, size = self.sim.decoder.decode_at(self.cpu.flash, pc)
+        access = False
+        if op is not None and op.mnemonic in MemoryAccesses:
+            access = partial(MemoryAccesses[op.mnemonic], self.cpu, *operands)
+        self._accesses[pc] = access
+        return access
+
+    def add_breakpoint(self, pc, condition=None, ignore=0):
+        bp = Breakpoint(pc, condition, ignore)
+        self.breakpoints.setdefault(pc, []).append(bp)
+        self._pc_flags[pc] = 1
+        return bp
+
+    def remove_breakpoint(self, bp):
+        bps = self.breakpoints.get(bp.pc, [])
+        if bp in bps:
+            bps.remove(bp)
+        if not bps:
+            self.breakpoints.pop(bp.pc, None)
+            self._pc_flags[bp.pc] = 0
+
+    def add_watchpoint(self, addr, kind=kWatchWrite, condition=None,
+                       ignore=0):
+        wp = Watchpoint(addr, kind, condition, ignore)
+        self.watchpoints.setdefault(addr, []).append(wp)
+        self._watch_flags[addr] = 1
+        return wp
+
+    def remove_watchpoint(self, wp):
+        wps = self.watchpoints.get(wp.addr, [])
+        if wp in wps:
+            wps.remove(wp)
+        if not wps:
+            self.watchpoints.pop(wp.addr, None)
+            self._watch_flags[wp.addr] = 0
+
+    def clear(self):
+        for pc in self.breakpoints:
+            self._pc_flags[pc] = 0
+        for addr in self.watchpoints:
+            self._watch_flags[addr] = 0
+        self.breakpoints = {}
+        self.watchpoints = {}
+
+    def _check_breakpoints(self, pc):
+        stop = None
+        for bp in self.breakpoints.get(pc, ()):
+            if not bp.enabled:
+                continue
+            if bp.condition is not None and not bp.condition(self.cpu):
+                continue
+            bp.hits += 1
+            if bp.hits > bp.ignore and stop is None:
+                stop = bp
+        return stop
+
+    def _check_watchpoints(self, addr, write, old):
+        new = self.cpu.data[addr]
+        stop = None
+        for wp in self.watchpoints.get(addr, ()):
+            if not wp.enabled:
+                continue
+            if write:
+                if not (wp.kind & kWatchWrite
+                        or (wp.kind & kWatchChange and new != old)):
+                    continue
+            elif not wp.kind & kWatchRead:
+                continue
+            if (wp.condition is not None
+                and not wp.condition(self.cpu, addr, old, new)):
+                continue
+            wp.hits += 1
+            if wp.hits > wp.ignore and stop is None:
+                stop = wp
+        return stop
+
+    def run(self, max_cycles=None, max_instructions=None):
+        """
+        Run until max_cycles have elapsed, max_instructions have been
+        executed, a breakpoint or watchpoint stops execution or an op does
+        (BREAK, SLEEP). A breakpoint at the PC execution stopped at last
+        time is stepped over.
+        """
+        cpu = self.cpu
+        if (not self.breakpoints and not self.watchpoints
+            and max_instructions is None):
+            return self.sim.run(max_cycles)
+        resume_pc = self._resume_pc
+        self._resume_pc = None
+        self.last_stop = None
+
+        code = self.sim._code
+        decode = self.sim._decode
+        accesses = self._accesses
+        lookup_access = self._lookup_access
+        pc_flags = self._pc_flags
+        watch_flags = self._watch_flags
+        data = cpu.data
+        pc = cpu.pc
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cpu.cycles + max_cycles
+        if max_instructions is None:
+            max_instructions = float("inf")
+        executed = 0
+        try:
+            while cpu.cycles < limit and executed < max_instructions:
+                if pc_flags[pc] and pc != resume_pc:
+                    bp = self._check_breakpoints(pc)
+                    if bp is not None:
+                        self.last_stop = bp
+                        self._resume_pc = pc
+                        return "breakpoint"
+                resume_pc = None
+                access = accesses[pc]
+                if access is None:
+                    access = lookup_access(pc)
+                watched = None
+                if access:
+                    for addr, write in access():
+                        if watch_flags[addr]:
+                            if watched is None:
+                                watched = []
+                            watched.append((addr, write, data[addr]))
+                entry = code[pc]
+                if entry is None:
+                    entry = decode(pc)
+                handler, size, cost = entry
+                cpu.pc = pc + size
+                cpu.cycles += cost
+                executed += 1
+                extra = handler()
+                if extra:
+                    cpu.cycles += extra
+                pc = cpu.pc
+                if watched is not None:
+                    for addr, write, old in watched:
+                        wp = self._check_watchpoints(addr, write, old)
+                        if wp is not None:
+                            self.last_stop = (wp, addr, old, data[addr])
+                            return "watchpoint"
+        except prog.StopExecution as e:
+            return e.reason
+        except IndexError:
+            if cpu.pc >= len(code):
+                raise SimulationError("PC out of range: %04x" % cpu.pc)
+            raise
+        return None
+
+    def step(self):
+        """Execute one instruction, even if there's a breakpoint on it."""
+        self._resume_pc = self.cpu.pc
+        return self.run(max_instructions=1)
@@ -0,0 +1,99 @@
+import numpy as np
+
+import program as prog
+
+kTableSize = 1 << 16
+
+class Decoder(object):
+    """
+    Table driven instruction decoder.
+
+    Every opcode pattern registered with declare_op is compiled into a
+    65536 entry table indexed by the first instruction word, so decoding
+    costs one table lookup plus operand extraction regardless of how many
+    ops are declared.
+    """
+    def __init__(self, ops=None):
+        if ops is None:
+            ops = prog.AllOps.values()
+        # Alternative mnemonics share a single Op
+        ops = dict((id(op), op) for op in ops).values()
+        # Fill the table from the least to the most specific pattern, so
+        # that an op which is a special case of another (BREQ vs BRBS) wins
+        # for the words it covers.
+        self.ops = sorted(ops, key=lambda op: (bin(self._first_word(op)[0])
+                                               .count("1"), op.mnemonic))
+        self.op_index = np.full(kTableSize, -1, np.int16)
+        self.sizes = np.ones(kTableSize, np.uint8)
+        words = np.arange(kTableSize, dtype=np.uint32)
+        for idx, op in enumerate(self.ops):
+            mask, value = self._first_word(op)
+            matches = (words & mask) == value
+            self.op_index[matches] = idx
+            self.sizes[matches] = op.words
+
+    @staticmethod
+    def _first_word(op):
+        shift = (op.words - 1) * 16
+        return ((op.fixed_mask >> shift) & 0xffff,
+                (op.fixed_bits >> shift) & 0xffff)
+
+    def lookup(self, word):
+        """Return the Op for an instruction's first word, or None."""
+        idx = self.op_index[word]
+        if idx < 0:
+            return None
+        return self.ops[idx]
+
+    def size(self, word):
+        """Number of words in the instruction starting with word."""
+        return int(self.sizes[word])
+
+    def decode(self, word, next_word=0):
+        """
+        Decode an instruction, returning (op, operands, size in words).
+        next_word is only consulted for 32-bit instructions. Unknown words
+        decode to (None, (), 1).
+        """
+        idx = self.op_index[word]
+        if idx < 0:
+            return None, (), 1
+        op = self.ops[idx]
+        if op.words == 2:
+            value = (int(word) << 16) | int(next_word)
+        else:
+            value = int(word)
+        return op, op.Decode(value), op.words
+
+    def decode_at(self, flash, addr):
+        """Decode the instruction at word address addr of a flash image."""
+        word = flash[addr]
+        next_word = flash[addr + 1] if addr + 1 < len(flash) else 0
+        return self.decode(word, next_word)
+
+    def disassemble(self, flash, start=0, end=None):
+        """
+        Yield (address, op, operands) for a run of flash words. Unknown
+        words are reported with op None.
+        """
+        if end is None:
+            end = len(flash)
+        addr = start
+        while addr < end:
+            op, operands, size = self.decode_at(flash, addr)
+            yield addr, op, operands
+            addr += size
+
+_default_decoder = None
+_default_decoder_ops = 0
+
+def default_decoder():
+    """
+    Decoder for all ops in program.AllOps, built on first use and rebuilt
+    if more ops have been declared since.
+    """
+    global _default_decoder, _default_decoder_ops
+    if _default_decoder is None or _default_decoder_ops != len(prog.AllOps):
+        _default_decoder = Decoder()
+        _default_decoder_ops = len(prog.AllOps)
+    return _default_decoder
@@ -0,0 +1,188 @@
+"""
+Run one program against many test cases on a pool of worker processes.
+
+The flash image is placed in shared memory once, before the workers are
+started, and each worker maps it read-only instead of receiving a copy
+with every task.
+
+Usage: python farm.py IMAGE CASES [-j N] [--max-cycles N] [-o RESULTS]
+
+IMAGE is an assembly source (.asm), an Intel HEX file (.hex) or a raw
+little-endian flash image.
+CASES is a JSON list of cases, each an object with any of:
+    "regs": {"16": 5, ...}          initial register values
+    "ram": {"0x100": [1, 2, 3]}     bytes stored from the given address
+    "pc": 0                         start address (words)
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+from multiprocessing.sharedctypes import RawArray
+
+import numpy as np
+
+import ihex
+from assembler import ASMParser
+from simplesim import CPUState, kDefaultFlashWords
+from translator import BlockSimulator
+
+kDefaultRamSize = 0x900
+kDefaultMaxCycles = 10000000
+
+class RunResult(object):
+    def __init__(self, cpu, stopped):
+        self.regs = [int(x) for x in cpu.ram[:32]]
+        self.sreg = cpu.sreg
+        self.sp = cpu.sp
+        self.pc = cpu.pc
+        self.cycles = cpu.cycles
+        self.stopped = stopped
+        self.ram = cpu.ram.copy()
+
+    def to_json(self, include_ram=False):
+        result = {
+            "regs": self.regs,
+            "sreg": self.sreg,
+            "sp": self.sp,
+            "pc": self.pc,
+            "cycles": self.cycles,
+            "stopped": self.stopped,
+        }
+        if include_ram:
+            result["ram"] = self.ram.tobytes().encode("hex")
+        return result
+
+    def __repr__(self):
+        return "<RunResult pc=%04x cycles=%d stopped=%s>" % (
+            self.pc, self.cycles, self.stopped)
+
+
+def setup_case(cpu, case):
+    """Apply a case's initial register/RAM values to a freshly reset CPU."""
+    ram = case.get("ram")
+    if ram is not None:
+        if isinstance(ram, dict):
+            for addr, values in ram.items():
+                addr = int(addr, 0) if isinstance(addr, basestring) else addr
+                if isinstance(values, int):
+                    values = [values]
+                cpu.ram[addr:addr + len(values)] = values
+        else:
+            ram = np.asarray(ram, np.uint8)
+            cpu.ram[:len(ram)] = ram
+    for reg, value in case.get("regs", {}).items():
+        reg = int(reg, 0) if isinstance(reg, basestring) else reg
+        cpu.data[reg] = value
+    if "pc" in case:
+        cpu.pc = case["pc"]
+
+
+# Per worker process state, set up by _init_worker
+_worker = None
+
+class _Worker(object):
+    def __init__(self, shared_flash, ramsize, max_cycles):
+        self.flash = np.frombuffer(shared_flash, np.uint16)
+        self.flash.flags.writeable = False
+        self.cpu = CPUState(ramsize, len(self.flash))
+        self.cpu.flash = self.flash
+        # The simulator is kept across cases, so blocks translated for one
+        # case are reused by the next.
+        self.sim = BlockSimulator(self.cpu)
+        self.max_cycles = max_cycles
+
+    def run(self, case):
+        cpu = self.cpu
+        cpu.reset()
+        if cpu.flash is not self.flash:
+            # The last case wrote flash (SPM); go back to the shared image.
+            cpu.flash = self.flash
+            self.sim.invalidate(0, len(self.flash))
+        setup_case(cpu, case)
+        stopped = self.sim.run(case.get("max_cycles", self.max_cycles))
+        return RunResult(cpu, stopped)
+
+def _init_worker(shared_flash, ramsize, max_cycles):
+    global _worker
+    _worker = _Worker(shared_flash, ramsize, max_cycles)
+
+def _run_case(case):
+    return _worker.run(case)
+
+
+def run_batch(image, cases, ramsize=kDefaultRamSize,
+              flashsize=kDefaultFlashWords, max_cycles=kDefaultMaxCycles,
+              processes=None, chunksize=None):
+    """
+    Run every case in cases (see setup_case) from a reset CPU with image
+    loaded at address 0, and return a RunResult for each, in order.
+    processes defaults to one per CPU; with processes=1 the cases are run
+    in this process.
+    """
+    image = np.asarray(image, np.uint16)
+    if len(image) > flashsize:
+        raise ValueError("Image of %d words doesn't fit in %d words of flash"
+                         % (len(image), flashsize))
+    shared_flash = RawArray("H", flashsize)
+    np.frombuffer(shared_flash, np.uint16)[:len(image)] = image
+    cases = list(cases)
+
+    if processes == 1:
+        _init_worker(shared_flash, ramsize, max_cycles)
+        return [_run_case(case) for case in cases]
+
+    pool = multiprocessing.Pool(processes, _init_worker,
+                                (shared_flash, ramsize, max_cycles))
+    try:
+        if chunksize is None:
+            workers = processes or multiprocessing.cpu_count()
+            chunksize = max(1, len(cases) // (workers * 4))
+        return pool.map(_run_case, cases, chunksize)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def load_image(path):
+    if path.lower().endswith(".asm"):
+        parser = ASMParser()
+        parser.parse_file(path)
+        return parser.flash_image()
+    elif path.lower().endswith(".hex"):
+        data = ihex.load_hex(path)
+        if len(data) % 2:
+            # Pad the last word as load_hex fills gaps
+            data = np.append(data, np.uint8(0xff))
+        return data.view("<u2")
+    return ihex.map_bin(path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run a program against many test cases in parallel.")
+    parser.add_argument("image", help="assembly source, HEX file or raw flash image")
+    parser.add_argument("cases", help="JSON file with a list of cases")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--ramsize", type=lambda x: int(x, 0),
+                        default=kDefaultRamSize)
+    parser.add_argument("--max-cycles", type=int, default=kDefaultMaxCycles)
+    parser.add_argument("--dump-ram", action="store_true",
+                        help="include final RAM contents in the results")
+    parser.add_argument("-o", "--output", help="results file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    with open(args.cases) as f:
+        cases = json.load(f)
+    results = run_batch(load_image(args.image), cases, ramsize=args.ramsize,
+                        max_cycles=args.max_cycles, processes=args.jobs)
+    output = [r.to_json(args.dump_ram) for r in results]
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=1)
+    else:
+        json.dump(output, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+A faster lexer for the assembler.
+
+FastLexer produces the same tokens as ASMLexer's PLY lexer but matches
+them with a single compiled regular expression, in the same order of
+preference as PLY's master regex, and turns the matches into tokens a
+line at a time, with the conversions done inline rather than by a rule
+function per token. Tokens are only made a line ahead of the parser, so
+that .EQU and .DEF definitions affect the lines after them, as with the
+PLY lexer.
+
+Usage: python fastlex.py [FILE.asm] [-n LINES]
+
+Times both lexers (and a full parse with each) on FILE, or on a generated
+.DB/.EQU-heavy source of LINES lines, and prints lines per second.
+"""
+import argparse
+import re
+import time
+from functools import partial
+
+from ply.lex import LexToken
+
+# ASMLexer's rules as one pattern, after any blanks (PLY skips them, as
+# t_ignore, before trying the rules). PLY takes the first rule that
+# matches; the alternatives here are in order of frequency instead, which
+# gives the same result as the symbol alternative refuses anything an
+# earlier rule (a label, number or register) would have matched, and the
+# others can't match the same text.
+kTokenPattern = re.compile(r"""
+    [ \t]*
+    (?:
+      (?P<symbol>(?!\d|[rR]\d)[\w.]+(?![\w.:]))
+    | (?P<label>[\w.]+:)
+    | (?P<number>-?(?:0x[0-9a-fA-F]+|\$[0-9a-fA-F]+|0b[01]+|\d+))
+    | (?P<register>[rR]\d\d?)
+    | (?P<newline>\n)
+    | (?P<literal>[=,@+-])
+    | (?P<string>"(?:[^"\\]|\\.)*")
+    | (?P<open_string>")
+    | (?P<comment>;[^\n]*)
+    | (?P<error>[^ \t])
+    )""", re.VERBOSE | re.DOTALL)
+
+kEscape = re.compile(r"\\(\\|.)", re.DOTALL)
+
+def _unescape(match):
+    # As ASMLexer's string rules: a doubled backslash stays doubled, and
+    # any other escaped character stands for itself.
+    if match.group(1) == "\\":
+        return "\\\\"
+    return match.group(1)
+
+class _Token(LexToken):
+    __slots__ = ("type", "value", "lineno", "lexpos")
+
+def _number(text):
+    sign = 1
+    if text.startswith("-"):
+        sign = -1
+        text = text[1:]
+    if text.startswith("$"):
+        return sign * int(text[1:], 16)
+    elif text.startswith("0x"):
+        return sign * int(text[2:], 16)
+    elif text.startswith("0b"):
+        return sign * int(text[2:], 2)
+    return sign * int(text)
+
+
+class FastLexer(object):
+    """
+    Lexer for ASMParser, interchangeable with the PLY lexer built by
+    ASMLexer (whose reserved words and lookup functions it uses).
+    """
+    def __init__(self, asm_lexer):
+        self.asm_lexer = asm_lexer
+        self.lineno = 1
+        self.lexdata = ""
+        self.lexpos = 0
+        self.token = partial(next, iter(()), None)
+
+    def clone(self):
+        lexer = FastLexer(self.asm_lexer)
+        lexer.lineno = self.lineno
+        return lexer
+
+    def begin(self, state):
+        # Strings are matched whole, so there is only the initial state.
+        pass
+
+    def input(self, text):
+        self.lexdata = text
+        self.lexpos = 0
+        # Handing out the tokens is the generator's next(), with no Python
+        # call in between.
+        self.token = partial(next, self._generate(text), None)
+
+    def _generate(self, text):
+        reserved = self.asm_lexer.reserved
+        var_lookup = self.asm_lexer.var_lookup_func
+        def_lookup = self.asm_lexer.def_lookup_func
+        batch = []
+        for match in kTokenPattern.finditer(text):
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "symbol":
+                # The reserved words are all directives
+                if value[0] == ".":
+                    kind = reserved.get(value.upper(), "SYMBOL")
+                else:
+                    kind = "SYMBOL"
+                if kind == "SYMBOL":
+                    found = var_lookup(value)
+                    if found is not None:
+                        kind = "NUMBER"
+                        value = found
+                    else:
+                        found = def_lookup(value)
+                        if found is not None:
+                            kind = "REGISTER"
+                            value = found
+            elif kind == "literal":
+                kind = value
+            elif kind == "newline":
+                kind = "NEWLINE"
+            elif kind == "number":
+                kind = "NUMBER"
+                if value.isdigit():
+                    value = int(value)
+                else:
+                    value = _number(value)
+            elif kind == "register":
+                kind = "REGISTER"
+                value = int(value[1:])
+            elif kind == "label":
+                kind = "LABEL"
+                value = value[:-1]
+            elif kind == "string":
+                kind = "STRING"
+                value = kEscape.sub(_unescape, value[1:-1])
+            elif kind == "comment":
+                continue
+            elif kind == "open_string":
+                # An unterminated string takes the rest of the input.
+                break
+            else:
+                print("Illegal character '%s'" % value)
+                continue
+            tok = _Token()
+            tok.type = kind
+            tok.value = value
+            tok.lineno = self.lineno
+            if kind == "STRING":
+                # PLY gives the position of the closing quote
+                tok.lexpos = match.end() - 1
+            else:
+                tok.lexpos = match.start(match.lastindex)
+            batch.append(tok)
+            if kind == "NEWLINE":
+                self.lineno += 1
+                self.lexpos = match.end()
+                for tok in batch:
+                    yield tok
+                batch = []
+        self.lexpos = len(text)
+        for tok in batch:
+            yield tok
+
+
+def _generated_source(lines):
+    source = []
+    for i in range(lines // 4):
+        source.append(".EQU value%d = 0x%x" % (i, i & 0xff))
+        source.append("table%d: .DB value%d, %d, $%x, 0b101, \"ab\"" % (
+            i, i, i & 0x7f, i & 0xff))
+        source.append("  .DW %d, %d ; comment" % (i, i * 3 & 0xffff))
+        source.append("  LDI r16, value%d" % i)
+    return "\n".join(source) + "\n"
+
+def _count_tokens(lexer, text):
+    lexer.input(text)
+    count = 0
+    while lexer.token() is not None:
+        count += 1
+    return count
+
+def main(argv=None):
+    from assembler import ASMParser
+
+    parser = argparse.ArgumentParser(
+        description="Compare the speed of the PLY and fast lexers.")
+    parser.add_argument("source", nargs="?", help="assembly source")
+    parser.add_argument("-n", "--lines", type=int, default=20000,
+                        help="lines of generated source (default: 20000)")
+    args = parser.parse_args(argv)
+    if args.source:
+        with open(args.source) as f:
+            text = f.read()
+    else:
+        text = _generated_source(args.lines)
+    lines = text.count("\n")
+
+    for fast in (False, True):
+        asm = ASMParser(fast_lexer=fast)
+        asm.build()
+        asm.variables = {}
+        asm.defs = {}
+        start = time.time()
+        tokens = _count_tokens(asm.lexer.lexer, text)
+        lex_time = time.time() - start
+        start = time.time()
+        asm.parse(text)
+        parse_time = time.time() - start
+        print("%-4s lexer: %d tokens, %9.0f lines/s lexing, "
+              "%9.0f lines/s parsing" % ("fast" if fast else "PLY", tokens,
+                                         lines / lex_time,
+                                         lines / parse_time))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Superinstructions: common runs of ops (ADD/ADC, CP/CPC/BRNE, LDI pairs,
+MOVW/ADIW) executed as a single call with the same effect as the ops.
+Simulators constructed with fuse=True use one only when execution reaches
+the first instruction of its run; stepping and debugging run single ops.
+"""
+import program as prog
+
+# Longest run of words a superinstruction can cover, so that a flash
+# write knows how far back to look for ones it changes.
+kMaxFusionWords = 4
+
+class Fusion(object):
+    def __init__(self, name, ops, impl):
+        self.name = name
+        self.ops = tuple(ops)
+        self.impl = impl
+        self.cycles = sum(op.cycles for op in self.ops)
+        self.words = sum(op.words for op in self.ops)
+        self.flow = self.ops[-1].flow
+        if any(op.flow != prog.kFlowNext for op in self.ops[:-1]):
+            raise ValueError("%s: only the last op can change the flow of "
+                             "control" % name)
+        if self.words > kMaxFusionWords:
+            raise ValueError("%s: more than %d words"
+                             % (name, kMaxFusionWords))
+
+    def __repr__(self):
+        return "<Fusion %s: %s>" % (self.name, " ".join(
+            op.mnemonic for op in self.ops))
+
+AllFusions = {}
+# First op -> the fusions starting with it, longest first
+_fusions_by_op = {}
+
+class declare_fusion(object):
+    def __init__(self, *mnemonics):
+        self.mnemonics = mnemonics
+
+    def __call__(self, f):
+        fusion = Fusion(f.__name__, [prog.AllOps[m] for m in self.mnemonics],
+                        f)
+        AllFusions[f.__name__] = fusion
+        candidates = _fusions_by_op.setdefault(fusion.ops[0], [])
+        candidates.append(fusion)
+        candidates.sort(key=lambda fusion: -len(fusion.ops))
+        return f
+
+
+def match(decoder, flash, pc):
+    """
+    Find the longest superinstruction whose run starts at pc. Returns
+    (fusion, operands of all its ops, size in words), or None.
+    """
+    op, operands, size = decoder.decode_at(flash, pc)
+    candidates = _fusions_by_op.get(op)
+    if not candidates:
+        return None
+    decoded = [(op, operands, size)]
+    end = pc + size
+    for fusion in candidates:
+        while len(decoded) < len(fusion.ops) and end < len(flash):
+            decoded.append(decoder.decode_at(flash, end))
+            end += decoded[-1][2]
+        if len(decoded) < len(fusion.ops):
+            continue
+        run = decoded[:len(fusion.ops)]
+        if all(op is want for (op, _, _), want in zip(run, fusion.ops)):
+            operands = sum((entry[1] for entry in run), ())
+            return fusion, operands, sum(entry[2] for entry in run)
+    return None
+
+
+# The implementations work on data and the ALU tables (see program.py)
+# directly, as the single ops do.
+
+kSREG = prog.kSREG
+kFlagC = prog.kFlagC
+kFlagZ = prog.kFlagZ
+kArithFlags = prog.kArithFlags
+kShiftFlags = prog.kShiftFlags
+kAddResults = prog.kAddResults
+kAddFlags = prog.kAddFlags
+kSubResults = prog.kSubResults
+kSubFlags = prog.kSubFlags
+
+# 16-bit arithmetic. The second op takes its carry from the first's flags,
+# and (for SBC/SBCI/CPC) only keeps Z if the first set it.
+
+@declare_fusion("ADD", "ADC")
+def ADD_ADC(cpu_state, d1, r1, d2, r2):
+    data = cpu_state.data
+    i = (data[d1] << 8) | data[r1]
+    data[d1] = kAddResults[i]
+    i = ((kAddFlags[i] & kFlagC) << 16) | (data[d2] << 8) | data[r2]
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | kAddFlags[i]
+    data[d2] = kAddResults[i]
+
+@declare_fusion("SUB", "SBC")
+def SUB_SBC(cpu_state, d1, r1, d2, r2):
+    data = cpu_state.data
+    i = (data[d1] << 8) | data[r1]
+    data[d1] = kSubResults[i]
+    flags = kSubFlags[i]
+    i = ((flags & kFlagC) << 16) | (data[d2] << 8) | data[r2]
+    data[kSREG] = ((data[kSREG] & ~kArithFlags)
+                   | (kSubFlags[i] & (flags | ~kFlagZ)))
+    data[d2] = kSubResults[i]
+
+@declare_fusion("SUBI", "SBCI")
+def SUBI_SBCI(cpu_state, d1, k1, d2, k2):
+    data = cpu_state.data
+    i = (data[d1] << 8) | k1
+    data[d1] = kSubResults[i]
+    flags = kSubFlags[i]
+    i = ((flags & kFlagC) << 16) | (data[d2] << 8) | k2
+    data[kSREG] = ((data[kSREG] & ~kArithFlags)
+                   | (kSubFlags[i] & (flags | ~kFlagZ)))
+    data[d2] = kSubResults[i]
+
+@declare_fusion("CP", "CPC")
+def CP_CPC(cpu_state, d1, r1, d2, r2):
+    data = cpu_state.data
+    flags = kSubFlags[(data[d1] << 8) | data[r1]]
+    i = ((flags & kFlagC) << 16) | (data[d2] << 8) | data[r2]
+    data[kSREG] = ((data[kSREG] & ~kArithFlags)
+                   | (kSubFlags[i] & (flags | ~kFlagZ)))
+
+@declare_fusion("CP", "CPC", "BRNE")
+def CP_CPC_BRNE(cpu_state, d1, r1, d2, r2, k):
+    data = cpu_state.data
+    flags = kSubFlags[(data[d1] << 8) | data[r1]]
+    i = ((flags & kFlagC) << 16) | (data[d2] << 8) | data[r2]
+    flags = kSubFlags[i] & (flags | ~kFlagZ)
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | flags
+    if not flags & kFlagZ:
+        cpu_state.pc += k
+        return 1
+
+# Loop counters
+
+@declare_fusion("DEC", "BRNE")
+def DEC_BRNE(cpu_state, d, k):
+    data = cpu_state.data
+    result = (data[d] - 1) & 0xff
+    data[kSREG] = ((data[kSREG] & ~prog.kLogicFlags)
+                   | prog.kDecFlagTable[result])
+    data[d] = result
+    if result:
+        cpu_state.pc += k
+        return 1
+
+@declare_fusion("SBIW", "BRNE")
+def SBIW_BRNE(cpu_state, d, k1, k2):
+    data = cpu_state.data
+    low = data[d] - k1
+    i = ((low < 0) << 16) | (data[d + 1] << 8)
+    flags = kSubFlags[i]
+    low &= 0xff
+    if low:
+        flags &= ~kFlagZ
+    data[kSREG] = (data[kSREG] & ~kShiftFlags) | (flags & kShiftFlags)
+    data[d] = low
+    data[d + 1] = kSubResults[i]
+    if not flags & kFlagZ:
+        cpu_state.pc += k2
+        return 1
+
+# Pointers
+
+@declare_fusion("LDI", "LDI")
+def LDI_LDI(cpu_state, d1, k1, d2, k2):
+    data = cpu_state.data
+    data[d1] = k1
+    data[d2] = k2
+
+@declare_fusion("MOVW", "ADIW")
+def MOVW_ADIW(cpu_state, d1, r1, d2, k):
+    data = cpu_state.data
+    data[d1] = data[r1]
+    data[d1 + 1] = data[r1 + 1]
+    low = data[d2] + k
+    i = ((low >> 8) << 16) | (data[d2 + 1] << 8)
+    flags = kAddFlags[i]
+    low &= 0xff
+    if low:
+        flags &= ~kFlagZ
+    data[kSREG] = (data[kSREG] & ~kShiftFlags) | (flags & kShiftFlags)
+    data[d2] = low
+    data[d2 + 1] = kAddResults[i]
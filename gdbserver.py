@@ -0,0 +1,485 @@
+"""
+GDB remote serial protocol server.
+
+A GDBServer listens on a local TCP port for avr-gdb (or any other RSP
+client) and debugs one simulator: its registers, data space and flash,
+breakpoints and watchpoints (through a Debugger), single steps and
+continuing. Any number of servers, each with its own simulator, can be
+served by one loop() in the same process.
+
+Once continued, the simulator runs freely in slices of slice_cycles, with
+the sockets polled between slices, until a breakpoint or watchpoint, a
+BREAK or SLEEP, or a Ctrl-C from the client stops it.
+
+Addresses are as avr-gdb gives them: flash by byte address from 0, the
+data space from 0x800000. The registers are r0-r31, SREG, SP (2 bytes)
+and the PC (4 bytes, a byte address).
+
+Usage: python gdbserver.py IMAGE [--port N] [--device NAME] [--block]
+                           [--fuse]
+
+IMAGE is an assembly source (.asm), an Intel HEX file (.hex) or a raw
+little-endian flash image.
+"""
+import argparse
+import asynchat
+import asyncore
+import socket
+
+import debugger
+from farm import kDefaultRamSize, load_image
+from simplesim import CPUState, SimulationError, Simulator
+from translator import BlockSimulator
+
+kDefaultPort = 1234
+# Cycles run between polls of the sockets while continuing
+kSliceCycles = 20000
+# How long loop() waits for a packet when nothing is running, in seconds
+kPollTimeout = 0.5
+kPacketSize = 0x1000
+
+kDataOffset = 0x800000
+kEEPROMOffset = 0x810000
+
+kRegSREG = 32
+kRegSP = 33
+kRegPC = 34
+
+# Signals given in stop replies
+kSIGINT = 2
+kSIGILL = 4
+kSIGTRAP = 5
+
+# Z/z packet type -> watchpoint kind (0 and 1 are breakpoints)
+kWatchKinds = {2: debugger.kWatchWrite, 3: debugger.kWatchRead,
+               4: debugger.kWatchAccess}
+kWatchNames = {debugger.kWatchWrite: "watch", debugger.kWatchRead: "rwatch",
+               debugger.kWatchAccess: "awatch"}
+
+class GDBError(Exception):
+    """A request that is answered with an error reply."""
+    pass
+
+
+def _checksum(payload):
+    return sum(bytearray(payload)) & 0xff
+
+def _hex_bytes(values):
+    return str(bytearray(values)).encode("hex")
+
+def _parse_bytes(text):
+    # str.decode("hex") raises TypeError for odd lengths and non-hex digits
+    try:
+        return bytearray(text.decode("hex"))
+    except TypeError:
+        raise ValueError("Bad hex data: %r" % text)
+
+
+class GDBServer(asyncore.dispatcher):
+    """
+    Serves sim (a Simulator or BlockSimulator) to one client at a time, on
+    host:port (with port 0, any free port; see address). The breakpoints
+    and watchpoints a client sets are removed when it disconnects.
+    """
+    def __init__(self, sim, host="127.0.0.1", port=kDefaultPort,
+                 slice_cycles=kSliceCycles, map=None):
+        asyncore.dispatcher.__init__(self, map=map)
+        self.sim = sim
+        self.cpu = sim.cpu
+        self.debugger = debugger.Debugger(sim)
+        self.slice_cycles = slice_cycles
+        self.session = None
+        self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.set_reuse_addr()
+        self.bind((host, port))
+        self.listen(1)
+
+    @property
+    def address(self):
+        return self.socket.getsockname()
+
+    def handle_accept(self):
+        pair = self.accept()
+        if pair is None:
+            return
+        sock, addr = pair
+        if self.session is not None:
+            sock.close()
+            return
+        self.session = GDBSession(self, sock, self._map)
+
+    def handle_close(self):
+        if self.session is not None:
+            self.session.close()
+        self.close()
+
+
+class GDBSession(asynchat.async_chat):
+    """One client's connection to a GDBServer."""
+    def __init__(self, server, sock, map=None):
+        asynchat.async_chat.__init__(self, sock, map=map)
+        # Packets are framed by hand: "$payload#xx", and a bare \x03 to
+        # interrupt.
+        self.set_terminator(None)
+        self.server = server
+        self.cpu = server.cpu
+        self.debugger = server.debugger
+        self.running = False
+        self.ack = True
+        self._buffer = ""
+        self._last_reply = None
+        # (packet type, address, length) -> its breakpoints or watchpoints
+        self._points = {}
+
+    # Framing
+
+    def collect_incoming_data(self, data):
+        self._buffer += data
+        while self._buffer:
+            char = self._buffer[0]
+            if char == "$":
+                end = self._buffer.find("#")
+                if end < 0 or len(self._buffer) < end + 3:
+                    return
+                payload = self._buffer[1:end]
+                checksum = self._buffer[end + 1:end + 3]
+                self._buffer = self._buffer[end + 3:]
+                try:
+                    valid = int(checksum, 16) == _checksum(payload)
+                except ValueError:
+                    valid = False
+                if not self.ack:
+                    valid = True
+                elif not valid:
+                    self.push("-")
+                    continue
+                else:
+                    self.push("+")
+                self.handle_packet(payload)
+            else:
+                self._buffer = self._buffer[1:]
+                if char == "\x03":
+                    self.interrupt()
+                elif char == "-" and self._last_reply is not None:
+                    self.push(self._last_reply)
+
+    def found_terminator(self):
+        pass
+
+    def reply(self, payload):
+        packet = "$%s#%02x" % (payload, _checksum(payload))
+        self._last_reply = packet
+        self.push(packet)
+
+    def _detach(self):
+        # Leave the simulator as the client found it, and free the server
+        # for another client.
+        self.running = False
+        for points in self._points.values():
+            self._remove_points(points)
+        self._points = {}
+        if self.server.session is self:
+            self.server.session = None
+
+    def handle_close(self):
+        self._detach()
+        self.close()
+
+    # Running
+
+    def interrupt(self):
+        if self.running:
+            self.stopped(kSIGINT)
+
+    def stopped(self, signal, reason=None):
+        self.running = False
+        payload = "T%02x" % signal
+        if reason == "watchpoint":
+            wp, addr = self.debugger.last_stop[:2]
+            payload += "%s:%x;" % (kWatchNames.get(wp.kind, "awatch"),
+                                   kDataOffset + addr)
+        self.reply(payload)
+
+    def _execute(self, run):
+        try:
+            reason = run()
+        except SimulationError:
+            self.stopped(kSIGILL)
+            return
+        if reason is not None or not self.running:
+            self.stopped(kSIGTRAP, reason)
+
+    def run_slice(self):
+        """Run the simulator for a slice, replying if it stops."""
+        self._execute(lambda: self.debugger.run(self.server.slice_cycles))
+
+    # Packets
+
+    def handle_packet(self, payload):
+        kind = payload[:1]
+        if kind == "?":
+            handler = self.packet_status
+        else:
+            handler = getattr(self, "packet_" + kind, None)
+        if handler is None:
+            self.reply("")
+            return
+        try:
+            result = handler(payload[1:])
+        except GDBError:
+            self.reply("E01")
+        except (ValueError, IndexError):
+            self.reply("E02")
+        else:
+            if result is not None:
+                self.reply(result)
+
+    def packet_status(self, args):
+        return "S%02x" % kSIGTRAP
+
+    def packet_q(self, args):
+        name = args.split(":", 1)[0].split(",", 1)[0]
+        if name == "Supported":
+            return "PacketSize=%x;QStartNoAckMode+" % kPacketSize
+        elif name == "Attached":
+            return "1"
+        elif name == "C":
+            return "QC1"
+        elif name == "fThreadInfo":
+            return "m1"
+        elif name == "sThreadInfo":
+            return "l"
+        elif name == "Rcmd":
+            return self.monitor(str(_parse_bytes(args.split(",", 1)[1])))
+        return ""
+
+    def packet_Q(self, args):
+        if args == "StartNoAckMode":
+            self.reply("OK")
+            self.ack = False
+            return None
+        return ""
+
+    def packet_H(self, args):
+        return "OK"
+
+    def packet_g(self, args):
+        cpu = self.cpu
+        pc = cpu.pc * 2
+        return _hex_bytes(cpu.data[:32]) + _hex_bytes(
+            [cpu.sreg, cpu.sp & 0xff, cpu.sp >> 8, pc & 0xff, (pc >> 8) & 0xff,
+             (pc >> 16) & 0xff, pc >> 24])
+
+    def packet_G(self, args):
+        values = _parse_bytes(args)
+        if len(values) < 39:
+            raise GDBError()
+        cpu = self.cpu
+        cpu.data[:32] = values[:32]
+        cpu.sreg = values[32]
+        cpu.sp = values[33] | (values[34] << 8)
+        cpu.pc = (values[35] | (values[36] << 8) | (values[37] << 16)) >> 1
+        return "OK"
+
+    def packet_p(self, args):
+        reg = int(args, 16)
+        cpu = self.cpu
+        if reg < 32:
+            return _hex_bytes([cpu.data[reg]])
+        elif reg == kRegSREG:
+            return _hex_bytes([cpu.sreg])
+        elif reg == kRegSP:
+            return _hex_bytes([cpu.sp & 0xff, cpu.sp >> 8])
+        elif reg == kRegPC:
+            pc = cpu.pc * 2
+            return _hex_bytes([pc & 0xff, (pc >> 8) & 0xff, pc >> 16, 0])
+        raise GDBError()
+
+    def packet_P(self, args):
+        reg, value = args.split("=")
+        reg = int(reg, 16)
+        value = _parse_bytes(value)
+        number = sum(byte << (8 * i) for i, byte in enumerate(value))
+        cpu = self.cpu
+        if reg < 32:
+            cpu.data[reg] = number & 0xff
+        elif reg == kRegSREG:
+            cpu.sreg = number & 0xff
+        elif reg == kRegSP:
+            cpu.sp = number & 0xffff
+        elif reg == kRegPC:
+            cpu.pc = number >> 1
+        else:
+            raise GDBError()
+        return "OK"
+
+    def packet_m(self, args):
+        addr, length = [int(x, 16) for x in args.split(",")]
+        return _hex_bytes(self.read_memory(addr, length))
+
+    def packet_M(self, args):
+        location, data = args.split(":")
+        addr, length = [int(x, 16) for x in location.split(",")]
+        values = _parse_bytes(data)
+        if len(values) != length:
+            raise GDBError()
+        self.write_memory(addr, values)
+        return "OK"
+
+    def packet_c(self, args):
+        if args:
+            self.cpu.pc = int(args, 16) >> 1
+        self.running = True
+        # The reply is sent when the simulator stops.
+        return None
+
+    def packet_s(self, args):
+        if args:
+            self.cpu.pc = int(args, 16) >> 1
+        self.running = False
+        self._execute(self.debugger.step)
+        return None
+
+    def packet_Z(self, args):
+        kind, addr, length = [int(x, 16) for x in args.split(",")[:3]]
+        key = (kind, addr, length)
+        if key in self._points:
+            return "OK"
+        if kind in (0, 1):
+            pc = addr >> 1
+            if addr >= kDataOffset or pc >= len(self.cpu.flash):
+                raise GDBError()
+            points = [self.debugger.add_breakpoint(pc)]
+        elif kind in kWatchKinds:
+            start = addr - kDataOffset
+            if not 0 <= start <= start + length <= len(self.cpu.data):
+                raise GDBError()
+            points = [self.debugger.add_watchpoint(a, kWatchKinds[kind])
+                      for a in range(start, start + length)]
+        else:
+            return ""
+        self._points[key] = points
+        return "OK"
+
+    def packet_z(self, args):
+        kind, addr, length = [int(x, 16) for x in args.split(",")[:3]]
+        if kind not in (0, 1) and kind not in kWatchKinds:
+            return ""
+        self._remove_points(self._points.pop((kind, addr, length), ()))
+        return "OK"
+
+    def _remove_points(self, points):
+        for point in points:
+            if isinstance(point, debugger.Breakpoint):
+                self.debugger.remove_breakpoint(point)
+            else:
+                self.debugger.remove_watchpoint(point)
+
+    def packet_D(self, args):
+        self.reply("OK")
+        # The socket is closed once the reply has been sent.
+        self.close_when_done()
+        self._detach()
+        return None
+
+    def packet_k(self, args):
+        self.handle_close()
+        return None
+
+    # Memory
+
+    def read_memory(self, addr, length):
+        cpu = self.cpu
+        if addr >= kEEPROMOffset:
+            raise GDBError()
+        elif addr >= kDataOffset:
+            start = addr - kDataOffset
+            if start + length > len(cpu.data):
+                raise GDBError()
+            # Straight from data: a debugger looking doesn't go through the
+            # I/O handlers.
+            return cpu.data[start:start + length]
+        if addr + length > 2 * len(cpu.flash):
+            raise GDBError()
+        return [cpu.read_program_byte(a) for a in range(addr, addr + length)]
+
+    def write_memory(self, addr, values):
+        cpu = self.cpu
+        length = len(values)
+        if addr >= kEEPROMOffset:
+            raise GDBError()
+        elif addr >= kDataOffset:
+            start = addr - kDataOffset
+            if start + length > len(cpu.data):
+                raise GDBError()
+            cpu.data[start:start + length] = values
+            return
+        if not length:
+            return
+        if addr + length > 2 * len(cpu.flash):
+            raise GDBError()
+        # Whole words, keeping the other half of any partly written one
+        first, last = addr >> 1, (addr + length - 1) >> 1
+        image = bytearray(cpu.flash[first:last + 1].astype("<u2").tostring())
+        offset = addr - first * 2
+        image[offset:offset + length] = values
+        cpu.write_flash(first, [image[i] | (image[i + 1] << 8)
+                                for i in range(0, len(image), 2)])
+
+    # Monitor commands
+
+    def monitor(self, command):
+        command = command.strip()
+        if command == "reset":
+            self.cpu.reset()
+            output = "CPU reset\n"
+        elif command == "cycles":
+            output = "%d cycles\n" % self.cpu.cycles
+        else:
+            output = "Monitor commands: reset, cycles\n"
+        return output.encode("hex")
+
+
+def loop(map=None, timeout=kPollTimeout):
+    """
+    Serve every GDBServer in map (by default asyncore's socket map) until
+    they are all closed, running the simulators of the sessions that have
+    been continued.
+    """
+    if map is None:
+        map = asyncore.socket_map
+    while map:
+        running = [channel for channel in map.values()
+                   if isinstance(channel, GDBSession) and channel.running]
+        for session in running:
+            session.run_slice()
+        asyncore.loop(0 if running else timeout, map=map, count=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Debug a program on the simulator with GDB.")
+    parser.add_argument("image",
+                        help="assembly source, HEX file or raw flash image")
+    parser.add_argument("--port", type=int, default=kDefaultPort)
+    parser.add_argument("--device", help="part to simulate, e.g. atmega328p")
+    parser.add_argument("--ramsize", type=lambda x: int(x, 0),
+                        default=kDefaultRamSize)
+    parser.add_argument("--block", action="store_true",
+                        help="use the basic-block simulator")
+    parser.add_argument("--fuse", action="store_true",
+                        help="use superinstructions")
+    args = parser.parse_args(argv)
+
+    if args.device:
+        cpu = CPUState.for_device(args.device)
+    else:
+        cpu = CPUState(args.ramsize)
+    cpu.load_image(load_image(args.image))
+    cls = BlockSimulator if args.block else Simulator
+    server = GDBServer(cls(cpu, fuse=args.fuse), port=args.port)
+    print "Listening on %s:%d" % server.address
+    loop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Intel HEX and raw binary images.
+
+HEX files are written and read one record at a time, straight from and
+into the image array. Raw .bin images can be mapped into memory instead of
+read, so loading them copies nothing.
+"""
+import binascii
+import mmap
+import os
+
+import numpy as np
+
+kRecordData = 0
+kRecordEOF = 1
+kRecordExtSegment = 2
+kRecordStartSegment = 3
+kRecordExtLinear = 4
+kRecordStartLinear = 5
+
+kDefaultRecordBytes = 16
+
+class HexError(Exception):
+    pass
+
+def _record(stream, rtype, addr, data):
+    checksum = len(data) + (addr >> 8) + (addr & 0xff) + rtype + sum(data)
+    stream.write(":%02X%04X%02X%s%02X\n" % (
+        len(data), addr, rtype, binascii.hexlify(data).upper(),
+        -checksum & 0xff))
+
+def write_hex(stream, image, origin=0, record_bytes=kDefaultRecordBytes):
+    """
+    Write image (any array, e.g. a uint16 flash image; its bytes are
+    written in memory order) as Intel HEX records starting at byte address
+    origin, followed by an end-of-file record.
+    """
+    data = np.ascontiguousarray(image).view(np.uint8)
+    upper = 0
+    offset = 0
+    while offset < len(data):
+        addr = origin + offset
+        if addr >> 16 != upper:
+            upper = addr >> 16
+            _record(stream, kRecordExtLinear, 0,
+                    bytearray([upper >> 8, upper & 0xff]))
+        # Records never cross a 64K boundary
+        count = min(record_bytes, len(data) - offset,
+                    0x10000 - (addr & 0xffff))
+        _record(stream, kRecordData, addr & 0xffff,
+                bytearray(data[offset:offset + count].tobytes()))
+        offset += count
+    _record(stream, kRecordEOF, 0, bytearray())
+
+def write_segment(stream, segment, symbols=None):
+    """Encode a Segment and write it as Intel HEX at its origin."""
+    image = segment.emit(symbols=symbols)
+    origin = segment.origin or 0
+    if segment.seg_type == "CSEG":
+        # origin is a word address; HEX files address bytes
+        write_hex(stream, image[origin:], origin * 2)
+    else:
+        write_hex(stream, image[origin:], origin)
+
+def read_hex(stream, image=None, fill=0xff):
+    """
+    Parse Intel HEX records from stream (any iterable of lines) into
+    image, a preallocated array addressed in bytes through its uint8 view
+    (so a uint16 flash array works). Without an image, a uint8 array just
+    large enough for the data is returned, with gaps set to fill. Returns
+    the image.
+    """
+    if image is not None:
+        target = image.view(np.uint8)
+        grow = None
+    else:
+        target = grow = bytearray()
+    base = 0
+    for lineno, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith(":"):
+            raise HexError("Line %d: missing start code" % lineno)
+        try:
+            record = bytearray(binascii.unhexlify(line[1:]))
+        except (TypeError, binascii.Error):
+            raise HexError("Line %d: invalid hex digits" % lineno)
+        if len(record) < 5 or len(record) != record[0] + 5:
+            raise HexError("Line %d: bad record length" % lineno)
+        if sum(record) & 0xff:
+            raise HexError("Line %d: checksum mismatch" % lineno)
+        count = record[0]
+        addr = (record[1] << 8) | record[2]
+        rtype = record[3]
+        if rtype == kRecordData:
+            start = base + addr
+            end = start + count
+            if grow is not None:
+                if end > len(grow):
+                    grow.extend([fill] * (end - len(grow)))
+                grow[start:end] = record[4:4 + count]
+            else:
+                if end > len(target):
+                    raise HexError("Line %d: data beyond end of image at %x"
+                                   % (lineno, start))
+                target[start:end] = np.frombuffer(record, np.uint8, count, 4)
+        elif rtype == kRecordEOF:
+            break
+        elif rtype in (kRecordExtSegment, kRecordExtLinear):
+            if count != 2:
+                raise HexError("Line %d: bad extended address record"
+                               % lineno)
+            base = (record[4] << 8) | record[5]
+            if rtype == kRecordExtSegment:
+                base <<= 4
+            else:
+                base <<= 16
+        elif rtype in (kRecordStartSegment, kRecordStartLinear):
+            pass
+        else:
+            raise HexError("Line %d: unknown record type %d" % (lineno, rtype))
+    if grow is not None:
+        return np.frombuffer(grow, np.uint8)
+    return image
+
+def load_hex(path, image=None, fill=0xff):
+    with open(path) as f:
+        return read_hex(f, image, fill)
+
+def save_bin(path, image):
+    """Write an image as raw little-endian words (or bytes)."""
+    image.astype(image.dtype.newbyteorder("<")).tofile(path)
+
+def map_bin(path, dtype="<u2"):
+    """
+    Map a raw image file into memory as a read-only array, without reading
+    or copying it. The result can be used as a CPUState's flash directly;
+    the CPU takes a private copy if the program writes flash.
+    """
+    dtype = np.dtype(dtype)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            # mmap refuses empty files
+            return np.zeros(0, dtype)
+        if size % dtype.itemsize:
+            raise HexError("%s: size %d is not a multiple of %d bytes"
+                           % (path, size, dtype.itemsize))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return np.frombuffer(mapped, dtype)
@@ -0,0 +1,413 @@
+"""
+Incremental reassembly.
+
+IncrementalAssembler parses its source one line at a time and keeps what
+each line contributed (labels, instructions, data). When lines are edited,
+only the new lines are parsed; the code after them in the same segment is
+moved by the change in size, and only the instructions that need it are
+encoded again: the new ones, those referring to a label that moved, and
+PC-relative ones that moved themselves. The flash image is updated in
+place.
+
+Edits that add or remove segment, .ORG, .EQU, .DEF or .INCLUDE lines fall
+back to parsing the whole source again.
+"""
+import numpy as np
+
+import program as prog
+from assembler import ASMParser
+
+class _Line(object):
+    __slots__ = ("text", "calls", "segment", "offset", "size", "items",
+                 "labels", "structural", "switches_segment", "index")
+
+    def __init__(self, text, calls, structural, switches_segment):
+        self.text = text
+        # The Segment method calls the line made, replayed to place it
+        self.calls = calls
+        self.structural = structural
+        self.switches_segment = switches_segment
+        # Where the line was placed: the segment current before it and the
+        # byte offset in that segment
+        self.segment = None
+        self.offset = 0
+        self.size = 0
+        self.items = []
+        self.labels = []
+        # Kept up to date only for lines that define variables or registers
+        self.index = None
+
+
+class _LineRecorder(object):
+    """Stands in for the current segment while a line is parsed."""
+    def __init__(self):
+        self.calls = []
+        self.structural = False
+
+    def add_label(self, label):
+        self.calls.append(("add_label", label))
+
+    def add_instruction(self, op, args):
+        self.calls.append(("add_instruction", op, args))
+
+    def define_bytes(self, byte_vals):
+        self.calls.append(("define_bytes", byte_vals))
+
+    def define_words(self, word_vals):
+        self.calls.append(("define_words", word_vals))
+
+    def reserve_bytes(self, nbytes):
+        self.calls.append(("reserve_bytes", nbytes))
+
+    def set_origin(self, address):
+        self.calls.append(("set_origin", address))
+        self.structural = True
+
+
+class _Environment(object):
+    """
+    The .EQU variables (or .DEF registers) visible from one line. table
+    maps each name to its definitions, as (defining line, value) pairs in
+    source order, with None for .UNDEF.
+    """
+    def __init__(self, table, index, line):
+        self.table = table
+        self.index = index
+        self.line = line
+        self.changed = False
+
+    def _lookup(self, name):
+        for line, value in reversed(self.table.get(name, ())):
+            if line.index < self.index:
+                return value
+        return None
+
+    def __contains__(self, name):
+        return self._lookup(name) is not None
+
+    def __getitem__(self, name):
+        value = self._lookup(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name, value):
+        self.line.index = self.index
+        self.table.setdefault(name, []).append((self.line, value))
+        self.changed = True
+
+    def pop(self, name):
+        value = self[name]
+        self.line.index = self.index
+        self.table[name].append((self.line, None))
+        self.changed = True
+        return value
+
+
+_relative_ops = {}
+
+def _relative(op):
+    """Whether op has a PC-relative operand."""
+    relative = _relative_ops.get(op)
+    if relative is None:
+        relative = _relative_ops[op] = any(field.signed for field in op.fields)
+    return relative
+
+
+class IncrementalAssembler(ASMParser):
+    """
+    Assembler for sources that are edited and reassembled repeatedly.
+    After parse(), image holds the encoded code segments; update() and
+    replace_lines() apply edits and return the (start, end) word ranges of
+    the image they changed.
+    """
+    def parse(self, text):
+        if not self.built:
+            self.build()
+        self._variable_table = {}
+        self._def_table = {}
+        self._env_lines = []
+        self._label_lines = {}
+        self._symbols = {}
+        # label -> {instruction: segment} for instructions referring to it
+        self._refs = {}
+        self.cur_seg = prog.Segment("CSEG")
+        self.segments = [self.cur_seg]
+        self.lines = []
+        segment = self.cur_seg
+        for index, text_line in enumerate(text.split("\n")):
+            line = self._parse_line(text_line, index)
+            self.lines.append(line)
+            self._place(line, segment, segment.cur_offset, segment)
+            self._register(line)
+            if line.switches_segment:
+                segment = self.segments[-1]
+            if line.index is not None:
+                self._env_lines.append(line)
+        self.cur_seg = self._end_segment = segment
+        for segment in self.segments:
+            for label in segment.labels:
+                self._symbols[label] = segment.label_address(label)
+        self._emit_all()
+
+    def include(self, name):
+        if not self._includes:
+            # The included file can change without the line changing.
+            self.cur_seg.structural = True
+        ASMParser.include(self, name)
+
+    def source(self):
+        return "\n".join(line.text for line in self.lines)
+
+    def symbols(self):
+        return dict(self._symbols)
+
+    def _parse_line(self, text, index):
+        """Parse one line as seen from line index."""
+        recorder = _LineRecorder()
+        line = _Line(text, recorder.calls, False, False)
+        self.variables = _Environment(self._variable_table, index, line)
+        self.defs = _Environment(self._def_table, index, line)
+        self.cur_seg = recorder
+        segment_count = len(self.segments)
+        self.lexer.lexer.lineno = index + 1
+        self.lexer.lexer.begin("INITIAL")
+        self.parser.parse(text + "\n", lexer=self.lexer.lexer)
+        line.switches_segment = len(self.segments) != segment_count
+        line.structural = (recorder.structural or line.switches_segment
+                           or self.variables.changed or self.defs.changed)
+        if line.index is None and line.structural:
+            line.index = index
+        return line
+
+    def _place(self, line, segment, offset, target):
+        """
+        Replay a parsed line into target, a segment (or scratch copy of
+        one) whose current offset is offset.
+        """
+        line.segment = segment
+        line.offset = offset
+        line.labels = []
+        count = len(target.instructions)
+        for call in line.calls:
+            name, args = call[0], call[1:]
+            if name == "add_label":
+                line.labels.append(args[0])
+            getattr(target, name)(*args)
+        line.items = target.instructions[count:]
+        line.size = target.cur_offset - offset
+
+    def _register(self, line):
+        """Index a placed line's labels and label references."""
+        for label in line.labels:
+            self._label_lines[label] = line
+        for inst in line.items:
+            for arg in getattr(inst, "args", ()):
+                if isinstance(arg, prog.SymbolArg):
+                    self._refs.setdefault(arg.label, {})[inst] = line.segment
+
+    def _remove_refs(self, inst):
+        for arg in getattr(inst, "args", ()):
+            if isinstance(arg, prog.SymbolArg):
+                self._refs.get(arg.label, {}).pop(inst, None)
+
+    def _code_end(self):
+        return max([seg.end_address() for seg in self.segments
+                    if seg.seg_type == "CSEG"] + [0])
+
+    def _emit_all(self):
+        self.image = np.zeros(self._code_end(), "<u2")
+        self._image_valid = False
+        for seg in self.segments:
+            if seg.seg_type == "CSEG":
+                seg.emit(self.image, self._symbols)
+        self._image_valid = True
+        return [(0, len(self.image))]
+
+    def update(self, text):
+        """Reassemble after the source changed to text."""
+        new = text.split("\n")
+        old = self.lines
+        prefix = 0
+        limit = min(len(old), len(new))
+        while prefix < limit and old[prefix].text == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and old[len(old) - 1 - suffix].text == new[len(new) - 1 - suffix]):
+            suffix += 1
+        if prefix == len(old) == len(new):
+            return []
+        return self.replace_lines(prefix, len(old) - suffix,
+                                  new[prefix:len(new) - suffix])
+
+    def _reparse(self, start, end, texts):
+        lines = [line.text for line in self.lines]
+        lines[start:end] = texts
+        self.parse("\n".join(lines))
+        return [(0, len(self.image))]
+
+    def replace_lines(self, start, end, texts):
+        """Replace source lines [start, end) with the lines in texts."""
+        old = self.lines[start:end]
+        if any(line.structural for line in old):
+            return self._reparse(start, end, texts)
+        if start < len(self.lines):
+            segment = self.lines[start].segment
+            offset = self.lines[start].offset
+        else:
+            segment = self._end_segment
+            offset = segment.cur_offset
+        saved_cur_seg = self.cur_seg
+        new = []
+        try:
+            for text in texts:
+                line = self._parse_line(text, start)
+                if line.structural:
+                    return self._reparse(start, end, texts)
+                new.append(line)
+        finally:
+            self.cur_seg = saved_cur_seg
+
+        # Lay the new lines out in a scratch segment, which also checks
+        # them, before changing anything.
+        old_labels = set(label for line in old for label in line.labels)
+        for line in new:
+            for label in line.labels:
+                if label in self._label_lines and label not in old_labels:
+                    raise prog.ASMError("Duplicate label: %s" % label)
+        scratch = prog.Segment(segment.seg_type)
+        scratch._cur_offset = offset
+        for line in new:
+            self._place(line, segment, scratch.cur_offset, scratch)
+        old_end = offset + sum(line.size for line in old)
+        delta = scratch.cur_offset - old_end
+        old_segment_end = segment.end_address()
+
+        changed_labels = set()
+        for line in old:
+            for inst in line.items:
+                self._remove_refs(inst)
+            for label in line.labels:
+                del segment.labels[label]
+                del self._label_lines[label]
+                del self._symbols[label]
+                changed_labels.add(label)
+        for line in new:
+            self._register(line)
+        first = self._find_item(segment, offset)
+        count = sum(len(line.items) for line in old)
+        segment.instructions[first:first + count] = scratch.instructions
+        for label, label_offset in scratch.labels.items():
+            segment.labels[label] = label_offset
+            self._symbols[label] = segment.label_address(label)
+            changed_labels.add(label)
+
+        # Move whatever follows in the same segment.
+        moved = []
+        shifted_labels = set()
+        if delta:
+            segment._cur_offset += delta
+            for line in self.lines[end:]:
+                line.offset += delta
+                for inst in line.items:
+                    inst.addr += delta
+                    moved.append(inst)
+                for label in line.labels:
+                    segment.labels[label] += delta
+                    self._symbols[label] = segment.label_address(label)
+                    shifted_labels.add(label)
+                if line.switches_segment:
+                    break
+
+        self.lines[start:end] = new
+        if len(new) != len(old):
+            for line in reversed(self._env_lines):
+                if line.index < end:
+                    break
+                line.index += len(new) - len(old)
+
+        if (segment.seg_type != "CSEG" and not changed_labels
+            and not shifted_labels):
+            return []
+        return self._update_image(segment, old_end, delta, old_segment_end,
+                                  scratch.instructions, moved,
+                                  changed_labels, shifted_labels)
+
+    def _find_item(self, segment, offset):
+        # Items are in address order and every one has a nonzero size.
+        items = segment.instructions
+        low, high = 0, len(items)
+        while low < high:
+            mid = (low + high) // 2
+            if items[mid].addr < offset:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _overlaps_other_code(self, segment, start, end):
+        for seg in self.segments:
+            if seg is not segment and seg.seg_type == "CSEG":
+                origin = seg.origin or 0
+                if origin < end and seg.end_address() > start:
+                    return True
+        return False
+
+    def _update_image(self, segment, old_end, delta, old_segment_end,
+                      added, moved, changed_labels, shifted_labels):
+        if not self._image_valid:
+            return self._emit_all()
+        ranges = []
+        if segment.seg_type == "CSEG" and delta:
+            origin = segment.origin or 0
+            new_segment_end = segment.end_address()
+            if self._overlaps_other_code(segment, origin,
+                                         max(old_segment_end, new_segment_end)):
+                return self._emit_all()
+            code_end = self._code_end()
+            if code_end > len(self.image):
+                image = np.zeros(code_end, "<u2")
+                image[:len(self.image)] = self.image
+                self.image = image
+            # Move the rest of the segment; NumPy copes with the overlap.
+            old_word = origin + old_end // 2
+            new_word = old_word + delta // 2
+            tail = old_segment_end - old_word
+            self.image[new_word:new_word + tail] = \
+                self.image[old_word:old_word + tail]
+            if new_segment_end < old_segment_end:
+                self.image[new_segment_end:old_segment_end] = 0
+            ranges.append((min(old_word, new_word),
+                           max(old_segment_end, new_segment_end)))
+            if code_end < len(self.image):
+                self.image = self.image[:code_end]
+
+        # A relative reference that moved along with its target still
+        # encodes the same.
+        work = {}
+        moved_relative = set(inst for inst in moved
+                             if type(inst) is prog.Instruction
+                             and _relative(inst.op))
+        if segment.seg_type == "CSEG":
+            for inst in added:
+                work[inst] = segment
+            for inst in moved_relative:
+                targets = [arg.label for arg in inst.args
+                           if isinstance(arg, prog.SymbolArg)]
+                if not targets or not shifted_labels.issuperset(targets):
+                    work[inst] = segment
+        for label in changed_labels:
+            work.update(self._refs.get(label, {}))
+        for label in shifted_labels:
+            for inst, seg in self._refs.get(label, {}).items():
+                if inst not in moved_relative:
+                    work[inst] = seg
+        try:
+            for inst, seg in work.items():
+                ranges.append(seg.emit_item(self.image, inst, self._symbols))
+        except prog.ASMError:
+            # Leave the image to be rebuilt once the source is fixed.
+            self._image_valid = False
+            raise
+        return ranges
@@ -0,0 +1,223 @@
+"""
+Separate assembly and linking.
+
+Each source file is assembled on its own, on a pool of worker processes,
+to an ObjectFile: its segments as parsed, with label references left as
+SymbolArgs, plus the labels it defines and the ones it uses but doesn't
+define. .EQU variables and .DEF registers are local to a file; labels are
+global.
+
+link() then lays the segments of all the objects out, code, data and
+EEPROM each in their own address space: segments with an .ORG stay where
+they are, and the others follow one another in order from the start of
+their space, in the gaps the placed ones leave. Segments that overlap are
+an error. The labels of every object go into one symbol table, which
+the segments are encoded against.
+
+Usage: python linker.py FILE.asm... [-j N] [--relax] [-o OUTPUT.hex]
+"""
+import argparse
+import multiprocessing
+import sys
+
+import numpy as np
+
+import ihex
+import program as prog
+import relax
+from assembler import ASMParser
+
+class ObjectFile(object):
+    """
+    One assembled source file. exports maps each label defined to its
+    segment's index in segments and its offset there; imports is the set
+    of labels referred to but not defined.
+    """
+    def __init__(self, name, segments):
+        self.name = name
+        self.segments = segments
+        self.exports = {}
+        refs = set()
+        for index, segment in enumerate(segments):
+            for label, offset in segment.labels.items():
+                self.exports[label] = (index, offset)
+            for inst in segment.instructions:
+                for arg in getattr(inst, "args", ()):
+                    if isinstance(arg, prog.SymbolArg):
+                        refs.add(arg.label)
+        self.imports = refs - set(self.exports)
+
+    def __repr__(self):
+        return "<ObjectFile %s: %d segments, %d labels>" % (
+            self.name, len(self.segments), len(self.exports))
+
+
+# Per worker process parser, set up by _init_worker
+_parser = None
+
+def _init_worker(table_dir, include_path):
+    global _parser
+    _parser = ASMParser(table_dir=table_dir, include_path=include_path)
+
+def _assemble(path):
+    _parser.parse_file(path)
+    # Empty segments (such as the implicit code segment of a file that
+    # starts with .DSEG) are left out.
+    segments = [seg for seg in _parser.segments
+                if seg.instructions or seg.labels or seg.cur_offset
+                or seg.origin is not None]
+    return ObjectFile(path, segments)
+
+
+def assemble_files(paths, processes=None, table_dir=None, include_path=None):
+    """
+    Assemble each source file in paths to an ObjectFile, returned in the
+    same order. processes defaults to one per CPU; with processes=1 the
+    files are assembled in this process.
+    """
+    paths = list(paths)
+    if processes == 1 or len(paths) <= 1:
+        _init_worker(table_dir, include_path)
+        return [_assemble(path) for path in paths]
+    pool = multiprocessing.Pool(processes, _init_worker,
+                                (table_dir, include_path))
+    try:
+        return pool.map(_assemble, paths, 1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+class LinkedProgram(object):
+    """The result of link(): the placed segments and their labels."""
+    def __init__(self, segments, symbols):
+        self.segments = segments
+        self._symbols = symbols
+
+    def symbols(self):
+        """Addresses of all labels: words for code, bytes for data."""
+        return dict(self._symbols)
+
+    def flash_image(self, size=None):
+        """Encode the code segments, as ASMParser.flash_image does."""
+        code = [seg for seg in self.segments if seg.seg_type == "CSEG"]
+        if size is None:
+            size = max([seg.end_address() for seg in code] + [0])
+        image = np.zeros(size, "<u2")
+        for seg in code:
+            seg.emit(image, self._symbols)
+        return image
+
+    def eeprom_image(self, size=None):
+        eeprom = [seg for seg in self.segments if seg.seg_type == "ESEG"]
+        if size is None:
+            size = max([seg.end_address() for seg in eeprom] + [0])
+        image = np.zeros(size, np.uint8)
+        for seg in eeprom:
+            seg.emit(image, self._symbols)
+        return image
+
+
+def _place(segments, origins):
+    # Segments with an .ORG are reserved first; the others go in order,
+    # each after the one before it, in the first gap big enough.
+    for seg_type, origin in origins.items():
+        space = [seg for seg in segments if seg.seg_type == seg_type]
+        fixed = sorted((seg.origin, seg.end_address()) for seg in space
+                       if seg.origin is not None)
+        cursor = origin
+        for segment in space:
+            if segment.origin is not None:
+                continue
+            size = segment.end_address()
+            moved = True
+            while moved:
+                moved = False
+                for start, end in fixed:
+                    if start < cursor + size and cursor < end and start < end:
+                        cursor = end
+                        moved = True
+            segment.origin = cursor
+            cursor += size
+        _check_overlaps(space)
+
+def _check_overlaps(space):
+    used = sorted((seg.origin, seg.end_address(), seg) for seg in space
+                  if seg.end_address() > seg.origin)
+    for (start, end, seg), (next_start, next_end, _) in zip(used, used[1:]):
+        if next_start < end:
+            raise prog.ASMError("%s segments overlap at %04x-%04x"
+                                % (seg.seg_type, next_start,
+                                   min(end, next_end)))
+
+def link(objects, code_origin=0, data_origin=0, eeprom_origin=0,
+         relax_branches=False):
+    """
+    Link ObjectFiles into a LinkedProgram. Unplaced segments are given
+    origins in place, so objects are consumed by linking. With
+    relax_branches, jumps, calls and branches are relaxed (see relax.py)
+    once all addresses are known.
+    """
+    segments = []
+    owners = {}
+    for obj in objects:
+        for label in obj.exports:
+            if label in owners:
+                raise prog.ASMError("Duplicate label: %s (in %s and %s)"
+                                    % (label, owners[label], obj.name))
+            owners[label] = obj.name
+        segments.extend(obj.segments)
+    missing = set()
+    for obj in objects:
+        missing.update(obj.imports - set(owners))
+    if missing:
+        raise prog.ASMError("Unknown label(s): %s"
+                            % ", ".join(sorted(missing)))
+
+    origins = {"CSEG": code_origin, "DSEG": data_origin,
+               "ESEG": eeprom_origin}
+    unplaced = [seg for seg in segments if seg.origin is None]
+    _place(segments, origins)
+    while relax_branches:
+        # Relaxing changes the size of code segments, and so where the
+        # ones after them go; lay them out again until nothing moves.
+        sizes = [seg.cur_offset for seg in unplaced]
+        relax.relax_segments(segments)
+        if [seg.cur_offset for seg in unplaced] == sizes:
+            break
+        for segment in unplaced:
+            segment.origin = None
+        _place(segments, origins)
+    symbols = {}
+    for segment in segments:
+        for label in segment.labels:
+            symbols[label] = segment.label_address(label)
+    return LinkedProgram(segments, symbols)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Assemble source files in parallel and link them.")
+    parser.add_argument("sources", nargs="+", help="assembly source files")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("-I", "--include", action="append", default=[],
+                        help="directory searched for .INCLUDE files")
+    parser.add_argument("--relax", action="store_true",
+                        help="use the shortest jumps, calls and branches")
+    parser.add_argument("-o", "--output",
+                        help="Intel HEX output (default: stdout)")
+    args = parser.parse_args(argv)
+
+    objects = assemble_files(args.sources, args.jobs,
+                             include_path=args.include)
+    linked = link(objects, relax_branches=args.relax)
+    image = linked.flash_image()
+    if args.output:
+        with open(args.output, "w") as f:
+            ihex.write_hex(f, image)
+    else:
+        ihex.write_hex(sys.stdout, image)
+
+if __name__ == "__main__":
+    main()
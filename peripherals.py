@@ -0,0 +1,163 @@
+"""
+Peripherals driven by a Scheduler.
+
+Each peripheral only does work when one of its events falls due. When it
+has a flag register (a data space address) it sets its flag bits there,
+so firmware can poll them, and when it has an interrupt vector it raises
+it. Registers the firmware reads or writes to talk to a peripheral are
+given I/O handlers on the CPU (see dataspace.py).
+"""
+
+class Timer(object):
+    """
+    A timer counting from 0 to top once every prescaler cycles, with an
+    optional compare match. Overflows happen every (top + 1) * prescaler
+    cycles.
+    """
+    def __init__(self, scheduler, top=0xff, prescaler=1, compare=None,
+                 overflow_vector=None, compare_vector=None,
+                 flag_register=None, overflow_bit=0, compare_bit=1,
+                 on_overflow=None, on_compare=None):
+        self.scheduler = scheduler
+        self.top = top
+        self.prescaler = prescaler
+        self.compare = compare
+        self.overflow_vector = overflow_vector
+        self.compare_vector = compare_vector
+        self.flag_register = flag_register
+        self.overflow_bit = overflow_bit
+        self.compare_bit = compare_bit
+        self.on_overflow = on_overflow
+        self.on_compare = on_compare
+        self.overflows = 0
+        self._start = None
+        self._events = []
+
+    @property
+    def period(self):
+        return (self.top + 1) * self.prescaler
+
+    @property
+    def running(self):
+        return self._start is not None
+
+    @property
+    def count(self):
+        """Current counter value, worked out from the cycle count."""
+        if self._start is None:
+            return 0
+        elapsed = self.scheduler.cpu.cycles - self._start
+        return (elapsed // self.prescaler) % (self.top + 1)
+
+    def start(self):
+        self.stop()
+        self._start = self.scheduler.cpu.cycles
+        self._schedule(self._start)
+
+    def stop(self):
+        for event in self._events:
+            self.scheduler.cancel(event)
+        self._events = []
+        self._start = None
+
+    def _schedule(self, period_start):
+        # Events for one period: the compare match (if any) and the
+        # overflow, which schedules the next period.
+        self._events = []
+        if self.compare is not None and self.compare <= self.top:
+            self._events.append(self.scheduler.at(
+                period_start + (self.compare + 1) * self.prescaler,
+                self._compare_match))
+        self._events.append(self.scheduler.at(period_start + self.period,
+                                              self._overflow))
+
+    def _set_flag(self, bit):
+        if self.flag_register is not None:
+            self.scheduler.cpu.data[self.flag_register] |= 1 << bit
+
+    def _compare_match(self):
+        self._set_flag(self.compare_bit)
+        if self.compare_vector is not None:
+            self.scheduler.raise_interrupt(self.compare_vector)
+        if self.on_compare:
+            self.on_compare()
+
+    def _overflow(self):
+        self.overflows += 1
+        self._set_flag(self.overflow_bit)
+        if self.overflow_vector is not None:
+            self.scheduler.raise_interrupt(self.overflow_vector)
+        if self.on_overflow:
+            self.on_overflow()
+        self._schedule(self._start + self.overflows * self.period)
+
+
+class Uart(object):
+    """
+    Serial port moving one byte every byte_cycles cycles (10 bit times at
+    the configured baud rate for 8N1).
+
+    transmit() queues a byte; it is handed to on_transmit when its last
+    bit has gone out. receive() makes a byte arrive after a delay: it is
+    stored at data_register (if given) and the receive flag and interrupt
+    are raised. Firmware storing to data_register transmits the byte,
+    starting at the end of the storing instruction.
+    """
+    def __init__(self, scheduler, byte_cycles, data_register=None,
+                 status_register=None, rx_bit=7, tx_bit=6,
+                 rx_vector=None, tx_vector=None, on_transmit=None):
+        self.scheduler = scheduler
+        self.byte_cycles = byte_cycles
+        self.data_register = data_register
+        self.status_register = status_register
+        self.rx_bit = rx_bit
+        self.tx_bit = tx_bit
+        self.rx_vector = rx_vector
+        self.tx_vector = tx_vector
+        self.on_transmit = on_transmit
+        self.transmitted = bytearray()
+        self._tx_queue = []
+        self._tx_busy = False
+        if data_register is not None:
+            scheduler.cpu.add_io_handler(
+                data_register, write=lambda addr, value: self.transmit(value))
+
+    @classmethod
+    def for_baud(cls, scheduler, clock_hz, baud, **kwargs):
+        return cls(scheduler, int(round(10.0 * clock_hz / baud)), **kwargs)
+
+    def _set_flag(self, bit):
+        if self.status_register is not None:
+            self.scheduler.cpu.data[self.status_register] |= 1 << bit
+
+    def transmit(self, byte):
+        self._tx_queue.append(byte)
+        if not self._tx_busy:
+            self._tx_busy = True
+            self.scheduler.after(self.byte_cycles, self._transmit_complete)
+
+    def _transmit_complete(self):
+        byte = self._tx_queue.pop(0)
+        self.transmitted.append(byte)
+        self._set_flag(self.tx_bit)
+        if self.tx_vector is not None:
+            self.scheduler.raise_interrupt(self.tx_vector)
+        if self.on_transmit:
+            self.on_transmit(byte)
+        if self._tx_queue:
+            self.scheduler.after(self.byte_cycles, self._transmit_complete)
+        else:
+            self._tx_busy = False
+
+    def receive(self, byte, delay=None):
+        """Have byte arrive delay cycles from now (default: one byte time)."""
+        if delay is None:
+            delay = self.byte_cycles
+        self.scheduler.after(delay, lambda: self._receive_complete(byte))
+
+    def _receive_complete(self, byte):
+        if self.data_register is not None:
+            self.scheduler.cpu.data[self.data_register] = byte
+        self._set_flag(self.rx_bit)
+        if self.rx_vector is not None:
+            self.scheduler.raise_interrupt(self.rx_vector)
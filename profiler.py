@@ -0,0 +1,251 @@
+"""
+Execution profiling and flash coverage.
+
+The Profiler runs a Simulator or BlockSimulator keeping per-PC counts in
+Python lists (for a BlockSimulator, per-block counts, which are spread
+over the block's instructions afterwards), and adds them into the flat
+NumPy arrays of a Profile at the end of each run. Counting costs a list
+increment per instruction, or a dict update per block.
+"""
+import sys
+from functools import partial
+
+import numpy as np
+
+import program as prog
+from simplesim import SimulationError
+from translator import BlockSimulator
+
+kConditionalFlows = (prog.kFlowBranch, prog.kFlowSkip)
+
+def code_labels(segments):
+    """Word addresses of the labels in the code segments among segments."""
+    return dict((label, seg.label_address(label))
+                for seg in segments if seg.seg_type == "CSEG"
+                for label in seg.labels)
+
+
+class Profile(object):
+    """
+    Per-PC execution counts (counts), cycles spent beyond the base cycle
+    count (extra_cycles) and taken counts for branches and skips (taken),
+    all int64 arrays the size of flash.
+    """
+    def __init__(self, flash, decoder):
+        self.flash = flash
+        self.decoder = decoder
+        self.counts = np.zeros(len(flash), np.int64)
+        self.extra_cycles = np.zeros(len(flash), np.int64)
+        self.taken = np.zeros(len(flash), np.int64)
+
+    @property
+    def coverage(self):
+        """Boolean map of the instructions executed at least once."""
+        return self.counts > 0
+
+    def _executed_ops(self):
+        for pc in np.flatnonzero(self.counts):
+            op, operands, size = self.decoder.decode_at(self.flash, pc)
+            yield int(pc), op
+
+    @property
+    def cycles(self):
+        """Total cycles spent at each PC."""
+        base = np.zeros(len(self.flash), np.int64)
+        for pc, op in self._executed_ops():
+            base[pc] = op.cycles if op is not None else 1
+        return base * self.counts + self.extra_cycles
+
+    @property
+    def conditional(self):
+        """Boolean map of the executed branches and skips."""
+        result = np.zeros(len(self.flash), bool)
+        for pc, op in self._executed_ops():
+            result[pc] = op is not None and op.flow in kConditionalFlows
+        return result
+
+    @property
+    def not_taken(self):
+        return np.where(self.conditional, self.counts - self.taken, 0)
+
+    def hot_spots(self, n=20):
+        """The n PCs with the most cycles, as (pc, count, cycles) tuples."""
+        cycles = self.cycles
+        order = np.argsort(-cycles, kind="mergesort")[:n]
+        return [(int(pc), int(self.counts[pc]), int(cycles[pc]))
+                for pc in order if cycles[pc]]
+
+    def functions(self, labels):
+        """
+        Roll the profile up by label: each label covers the code up to the
+        next one. Returns (label, start, end, instructions, cycles) tuples,
+        most cycles first.
+        """
+        cycles = self.cycles
+        starts = sorted((addr, label) for label, addr in labels.items())
+        result = []
+        for i, (start, label) in enumerate(starts):
+            if i + 1 < len(starts):
+                end = starts[i + 1][0]
+            else:
+                end = len(self.flash)
+            result.append((label, start, end,
+                           int(self.counts[start:end].sum()),
+                           int(cycles[start:end].sum())))
+        result.sort(key=lambda f: -f[4])
+        return result
+
+    def coverage_fraction(self, start=0, end=None):
+        """Fraction of the instructions in [start, end) that have run."""
+        if end is None:
+            end = len(self.flash)
+        sizes = self.decoder.sizes
+        pc = start
+        total = covered = 0
+        while pc < end:
+            total += 1
+            if self.counts[pc]:
+                covered += 1
+            pc += max(int(sizes[self.flash[pc]]), 1)
+        return float(covered) / total if total else 0.0
+
+    def report(self, labels=None, n=20, stream=None):
+        stream = stream or sys.stdout
+        total = int(self.cycles.sum())
+        stream.write("Total: %d instructions, %d cycles\n"
+                     % (self.counts.sum(), total))
+        conditional = self.conditional
+        not_taken = self.not_taken
+        stream.write("\nHot spots:\n")
+        stream.write("   pc      count     cycles      %\n")
+        for pc, count, cycles in self.hot_spots(n):
+            line = "%5x %10d %10d %6.2f" % (pc, count, cycles,
+                                             100.0 * cycles / total)
+            if conditional[pc]:
+                line += "  taken %d / not taken %d" % (self.taken[pc],
+                                                       not_taken[pc])
+            stream.write(line + "\n")
+        if labels:
+            stream.write("\nBy label:\n")
+            stream.write("%-20s %10s %10s      %%\n"
+                         % ("label", "count", "cycles"))
+            for label, start, end, count, cycles in self.functions(labels):
+                if count:
+                    stream.write("%-20s %10d %10d %6.2f\n" % (
+                        label, count, cycles, 100.0 * cycles / total))
+
+
+class Profiler(object):
+    def __init__(self, sim):
+        self.sim = sim
+        self.cpu = sim.cpu
+        self.profile = Profile(self.cpu.flash, sim.decoder)
+        self.cpu.add_flash_observer(self._flash_written)
+
+    def _flash_written(self, start, end):
+        self.profile.flash = self.cpu.flash
+
+    def reset(self):
+        self.profile = Profile(self.cpu.flash, self.sim.decoder)
+
+    def run(self, max_cycles=None):
+        """Run as the simulator's run() does, profiling as it goes."""
+        if isinstance(self.sim, BlockSimulator):
+            return self._run_blocks(max_cycles)
+        return self._run_instructions(max_cycles)
+
+    def _run_instructions(self, max_cycles):
+        cpu = self.cpu
+        counts = [0] * len(cpu.flash)
+        extras = [0] * len(cpu.flash)
+        taken = [0] * len(cpu.flash)
+        code = self.sim._code
+        decode = self.sim._decode
+        # As Simulator.run, keep cpu.cycles current for I/O handlers
+        sync = bool(cpu.io_handlers)
+        pc = cpu.pc
+        cycles = cpu.cycles
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cycles + max_cycles
+        try:
+            while cycles < limit:
+                entry = code[pc]
+                if entry is None:
+                    entry = decode(pc)
+                handler, size, cost = entry
+                counts[pc] += 1
+                cpu.pc = pc + size
+                cycles += cost
+                if sync:
+                    cpu.cycles = cycles
+                extra = handler()
+                if extra:
+                    cycles += extra
+                    extras[pc] += extra
+                    taken[pc] += 1
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return e.reason
+        except IndexError:
+            if cpu.pc >= len(code):
+                raise SimulationError("PC out of range: %04x" % cpu.pc)
+            raise
+        finally:
+            cpu.cycles = cycles
+            profile = self.profile
+            profile.counts += counts
+            profile.extra_cycles += extras
+            profile.taken += taken
+        return None
+
+    def _run_blocks(self, max_cycles):
+        cpu = self.cpu
+        sim = self.sim
+        # As BlockSimulator.run, with I/O handlers use the blocks that
+        # keep cpu.cycles current
+        sync = bool(cpu.io_handlers)
+        blocks = sim._synced_blocks if sync else sim._blocks
+        translate = partial(sim.translate, sync=sync)
+        hits = {}
+        extras = {}
+        taken = {}
+        pc = cpu.pc
+        cycles = cpu.cycles
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cycles + max_cycles
+        try:
+            while cycles < limit:
+                block = blocks.get(pc)
+                if block is None:
+                    block = translate(pc)
+                # Counted before running, so that a block stopping
+                # execution (BREAK, SLEEP) is counted too.
+                hits[block] = hits.get(block, 0) + 1
+                if sync:
+                    cpu.cycles = cycles
+                cycles += block.cycles
+                extra = block.func(cpu)
+                if extra:
+                    cycles += extra
+                    extras[block] = extras.get(block, 0) + extra
+                    taken[block] = taken.get(block, 0) + 1
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return e.reason
+        finally:
+            cpu.cycles = cycles
+            profile = self.profile
+            # Blocks are only ever entered at their start and only their
+            # last instruction can leave them, so each run of a block ran
+            # all of its instructions.
+            for block, n in hits.items():
+                profile.counts[list(block.pcs)] += n
+            for block, extra in extras.items():
+                last = block.pcs[-1]
+                profile.extra_cycles[last] += extra
+                profile.taken[last] += taken[block]
+        return None
@@ -4,27 +4,113 @@ import re
 from collections import namedtuple;
 
 class Op(object):
-    def __init__(self, mnemonic, args, opcode, impl):
+    def __init__(self, mnemonic, args, opcode, impl, cycles=1, flow=None):
         self.mnemonic = mnemonic
         self.args = args
         self.opcode = opcode.replace(" ","")        
         self.impl = impl
+        self.cycles = cycles
+        self.flow = flow or kFlowNext
+        self.words = len(self.opcode) // 16
+        self.fixed_mask, self.fixed_bits, self.fields = compile_opcode(
+            self.opcode, args)
 
-    def Apply(self, cpu_state):
-        self.impl(cpu_state)
+    def Apply(self, cpu_state, operands=()):
+        """
+        Execute the op. cpu_state.pc must already point past the
+        instruction. Returns the number of cycles taken.
+        """
+        return self.cycles + (self.impl(cpu_state, *operands) or 0)
 
-    def Emit(self):
-        pass
+    def Decode(self, value):
+        """
+        Extract the operands from an instruction's raw bits. For 32-bit ops,
+        value holds the first word in the high half.
+        """
+        operands = []
+        for field in self.fields:
+            raw = 0
+            for op_shift, mask, value_shift in field.runs:
+                raw |= ((value >> op_shift) & mask) << value_shift
+            if field.signed and raw >> (field.width - 1):
+                raw -= 1 << field.width
+            operands.append(raw * field.scale + field.offset)
+        return tuple(operands)
+
+    def Encode(self, operands):
+        """
+        Inverse of Decode: pack operand values (in field order) into the
+        instruction's raw bits.
+        """
+        value = self.fixed_bits
+        for field, operand in zip(self.fields, operands):
+            raw = operand - field.offset
+            if raw % field.scale:
+                raise ASMError("%s: operand %d must be an even register"
+                               % (self.mnemonic, field.index + 1))
+            raw //= field.scale
+            if field.signed:
+                low, high = -(1 << (field.width - 1)), 1 << (field.width - 1)
+            else:
+                low, high = 0, 1 << field.width
+            if not low <= raw < high:
+                raise ASMError("%s: operand %d out of range: %d"
+                               % (self.mnemonic, field.index + 1, operand))
+            raw &= (1 << field.width) - 1
+            for op_shift, mask, value_shift in field.runs:
+                value |= ((raw >> value_shift) & mask) << op_shift
+        return value
+
+    def Emit(self, args, pc=0, symbols=None):
+        """
+        Encode the instruction with the given OpArgs at word address pc,
+        returning its words. Symbols are looked up in symbols, and
+        PC-relative operands are given as target addresses.
+        """
+        operands = []
+        for field in self.fields:
+            arg = args[field.index]
+            if isinstance(arg, RegisterArg):
+                value = arg.regnum
+            elif isinstance(arg, ConstantArg):
+                value = arg.value
+            elif isinstance(arg, SymbolArg):
+                try:
+                    value = symbols[arg.label]
+                except (KeyError, TypeError):
+                    raise ASMError("Unknown label: %s" % arg.label)
+            else:
+                raise ASMError("%s: unexpected argument %d"
+                               % (self.mnemonic, field.index + 1))
+            if field.signed:
+                value -= pc + self.words
+            operands.append(value)
+        value = self.Encode(operands)
+        if self.words == 2:
+            return (value >> 16, value & 0xffff)
+        return (value,)
 
     def Size(self):
         return len(self.opcode) / 8
-    
+
+    def __reduce__(self):
+        # Ops are pickled by name, so that parsed segments can be sent
+        # between processes.
+        return (_named_op, (self.mnemonic,))
+
 AllOps = {}
 
+def _named_op(mnemonic):
+    return AllOps[mnemonic]
+
+# Segments of large programs hold a great many of these, so they (and the
+# OpArgs) have __slots__ rather than a __dict__ each.
 class Instruction(object):
+    __slots__ = ("op", "args", "addr")
+
     def __init__(self, op, args, addr):
         self.op = op
-        self.args = args[:]
+        self.args = tuple(args)
         self.addr = addr
         
     def __repr__(self):
@@ -35,16 +121,18 @@ class Instruction(object):
         return self.op.Size()
     
 class DefinedBytes(Instruction):
+    __slots__ = ("byte_vals",)
+
     def __init__(self, byte_vals, addr):
-        self.byte_vals = []
+        self.byte_vals = bytearray()
         self.addr = addr
         for idx, val in enumerate(byte_vals):
             if isinstance(val, str):
-                self.byte_vals.extend(ord(c) for c in val)
+                self.byte_vals.extend(val)
             else:
                 if val < -128 or val > 255:
                     raise ASMError("Byte value out of range.")
-                self.byte_vals.append(val)
+                self.byte_vals.append(val & 0xff)
 
     def __repr__(self):
         return (("%04x" % self.addr) + ": DB: " + 
@@ -54,6 +142,8 @@ class DefinedBytes(Instruction):
         return len(self.byte_vals) + len(self.byte_vals) % 2
 
 class DefinedWords(Instruction):
+    __slots__ = ("word_vals",)
+
     def __init__(self, word_vals, addr):
         self.word_vals = word_vals
         self.addr = addr
@@ -80,6 +170,77 @@ class Segment(object):
     def set_origin(self, address):
         self.origin = address
 
+    def label_address(self, label):
+        # Code addresses are in words, data addresses in bytes
+        offset = self.labels[label]
+        if self.seg_type == "CSEG":
+            offset //= 2
+        return (self.origin or 0) + offset
+
+    def end_address(self):
+        if self.seg_type == "CSEG":
+            return (self.origin or 0) + (self.cur_offset + 1) // 2
+        return (self.origin or 0) + self.cur_offset
+
+    def emit(self, image=None, symbols=None):
+        """
+        Encode the segment at its origin into image, allocating it if not
+        given. Code segments are emitted into a little-endian uint16 flash
+        image, EEPROM segments into a uint8 array; data segments have no
+        initial contents. symbols defaults to this segment's labels.
+        """
+        if self.seg_type == "DSEG":
+            raise ASMError("Data segments can not be emitted.")
+        if symbols is None:
+            symbols = dict((label, self.label_address(label))
+                           for label in self.labels)
+        if self.seg_type == "CSEG":
+            if image is None:
+                image = np.zeros(self.end_address(), "<u2")
+        elif image is None:
+            image = np.zeros(self.end_address(), np.uint8)
+        for inst in self.instructions:
+            self.emit_item(image, inst, symbols)
+        return image
+
+    def emit_item(self, image, inst, symbols):
+        """
+        Encode one of the segment's instructions (or data definitions) into
+        image. Returns the (start, end) range of image written.
+        """
+        if self.seg_type == "CSEG":
+            pc, words = self.item_words(inst, symbols)
+            image[pc:pc + len(words)] = words
+            return pc, pc + len(words)
+        addr = (self.origin or 0) + inst.addr
+        if isinstance(inst, DefinedBytes):
+            data = np.frombuffer(bytes(inst.byte_vals), np.uint8)
+        elif isinstance(inst, DefinedWords):
+            data = np.array([w & 0xffff for w in inst.word_vals],
+                            "<u2").view(np.uint8)
+        else:
+            raise ASMError("Instructions are only allowed in code "
+                           "segments.")
+        image[addr:addr + len(data)] = data
+        return addr, addr + len(data)
+
+    def item_words(self, inst, symbols):
+        """
+        Encode one of a code segment's instructions (or data definitions).
+        Returns its word address and its words.
+        """
+        pc = (self.origin or 0) + inst.addr // 2
+        if isinstance(inst, DefinedBytes):
+            data = bytearray(inst.byte_vals)
+            if len(data) % 2:
+                data.append(0)
+            words = np.frombuffer(bytes(data), "<u2")
+        elif isinstance(inst, DefinedWords):
+            words = [w & 0xffff for w in inst.word_vals]
+        else:
+            words = inst.op.Emit(inst.args, pc, symbols)
+        return pc, words
+
     @property
     def cur_offset(self):
         return self._cur_offset;
@@ -123,6 +284,17 @@ kArgZReg = 5
 #Addressing Flags
 kDirect = 0
 
+# How an op affects control flow. Anything other than kFlowNext ends a
+# basic block.
+kFlowNext = 0       # always continues with the next instruction
+kFlowJump = 1       # unconditional jump
+kFlowBranch = 2     # conditional relative branch
+kFlowSkip = 3       # conditionally skips the next instruction
+kFlowCall = 4
+kFlowReturn = 5
+kFlowHalt = 6       # hands control back to the caller (SLEEP, BREAK)
+kFlowFlash = 7      # writes program memory
+
 ArgumentType = namedtuple("ArgumentType", "symbol type bits signed description")
 
 kArgTypes = [
@@ -137,15 +309,98 @@ kArgTypes = [
     ArgumentType("Z", kArgReg, 0, False, "Indirect address register (R31:R30)"),
     ArgumentType("A", kArgConst, None, False, "IO location address"),
     ArgumentType("q", kArgConst, 6, False, "Displacement for direct addressing"),
+    ArgumentType("Rd+1:Rd", kArgReg, 5, False, "Destination register pair"),
+    ArgumentType("Rr+1:Rr", kArgReg, 5, False, "Source register pair"),
     ]
     
 kArgTypesMap = dict((at.symbol,at) for at in kArgTypes)
 
+# Letter used for each argument's bits in an opcode pattern, where it
+# differs from the argument's symbol.
+kFieldLetters = {
+    "Rd": "d",
+    "Rr": "r",
+    "Rd+1:Rd": "d",
+    "Rr+1:Rr": "r",
+}
+
+# Register fields narrower than 5 bits only reach part of the register
+# file: (field width, is pair) -> (first register, register step)
+kRegisterFields = {
+    (5, False): (0, 1),
+    (4, False): (16, 1),
+    (3, False): (16, 1),
+    (4, True): (0, 2),
+    (2, True): (24, 2),
+}
+
+# index is the position of the argument in the op's argument list; runs
+# are (opcode shift, mask, value shift) triples, one per contiguous group
+# of bits.
+OpField = namedtuple("OpField", "index letter width runs offset scale signed")
+
+def compile_opcode(opcode, args):
+    """
+    Split an opcode pattern such as "0000 11rd dddd rrrr" into the mask and
+    value of its fixed bits, plus an OpField for each argument that is
+    encoded in the instruction word(s).
+    """
+    nbits = len(opcode)
+    fixed_mask = 0
+    fixed_bits = 0
+    positions = {}
+    for idx, c in enumerate(opcode):
+        bit = nbits - 1 - idx
+        if c in "01":
+            fixed_mask |= 1 << bit
+            if c == "1":
+                fixed_bits |= 1 << bit
+        else:
+            positions.setdefault(c, []).append(bit)
+
+    fields = []
+    for idx, argtype in enumerate(args):
+        letter = kFieldLetters.get(argtype.symbol, argtype.symbol)
+        bits = positions.pop(letter, [])
+        if not bits:
+            # Implicit operands such as the X/Y/Z pointers
+            continue
+        runs = []
+        # Walk the bits LSB first, merging adjacent ones into runs.
+        for value_shift, op_shift in enumerate(reversed(bits)):
+            if runs and runs[-1][0] + runs[-1][1] == op_shift:
+                runs[-1][1] += 1
+            else:
+                runs.append([op_shift, 1, value_shift])
+        runs = tuple((op_shift, (1 << length) - 1, value_shift)
+                     for op_shift, length, value_shift in runs)
+        width = len(bits)
+        offset, scale, signed = 0, 1, False
+        if argtype.type == kArgReg:
+            pair = argtype.symbol.endswith(":" + argtype.symbol[:2])
+            try:
+                offset, scale = kRegisterFields[(width, pair)]
+            except KeyError:
+                raise ASMError("Unsupported %d-bit register field in %s"
+                               % (width, opcode))
+        elif argtype.signed and width <= 12:
+            # Only the short branch forms (7 and 12 bits) are PC-relative;
+            # JMP, CALL and LDS/STS carry absolute addresses.
+            signed = True
+        fields.append(OpField(idx, letter, width, runs, offset, scale, signed))
+
+    if positions:
+        raise ASMError("Opcode %s has bits for unknown argument(s): %s"
+                       % (opcode, ", ".join(sorted(positions))))
+    return fixed_mask, fixed_bits, fields
+
 class OpArg(object):
-    pass
+    __slots__ = ()
 
 
 class RegisterArg(OpArg):
+    __slots__ = ("regnum", "flags")
+
     def __init__(self, regnum, flags=kDirect):
         self.regnum = regnum
         self.flags = flags
@@ -153,15 +408,96 @@ class RegisterArg(OpArg):
             raise ASMError("Invalid register number %d" % regnum)
         
 class ConstantArg(OpArg):
+    __slots__ = ("value",)
+
     def __init__(self, arg):
         self.value = arg
 
 class SymbolArg(OpArg):
+    __slots__ = ("label",)
+
     def __init__(self, arg):
         self.label = arg
 
+# Pointer addressing modes
+kPointerPlain = 0
+kPointerPostInc = 1
+kPointerPreDec = 2
+kPointerDisplacement = 3
+
+class PointerArg(OpArg):
+    """X, Y or Z used as a pointer: X, X+, -X or Y+q."""
+    __slots__ = ("register", "mode", "displacement")
+
+    def __init__(self, register, mode=kPointerPlain, displacement=0):
+        register = register.upper()
+        if register not in ("X", "Y", "Z"):
+            raise ASMError("Invalid pointer register: %s" % register)
+        self.register = register
+        self.mode = mode
+        self.displacement = displacement
+
+    def __repr__(self):
+        if self.mode == kPointerPostInc:
+            return self.register + "+"
+        elif self.mode == kPointerPreDec:
+            return "-" + self.register
+        elif self.mode == kPointerDisplacement:
+            return "%s+%d" % (self.register, self.displacement)
+        return self.register
+
+# OpArgs are never changed once made, so the assembler shares equal ones.
+_shared_args = {}
+
+def shared_arg(cls, *values):
+    """An OpArg of class cls made from values, shared with equal ones."""
+    key = (cls,) + values
+    arg = _shared_args.get(key)
+    if arg is None:
+        arg = _shared_args[key] = cls(*values)
+    return arg
+
+# One-register instructions that are a two-register op with the register
+# given twice
+kRegisterAliases = {"LSL": "ADD", "ROL": "ADC", "TST": "AND", "CLR": "EOR"}
+
+def resolve_op(mnemonic, args):
+    """
+    Find the op for a mnemonic and its parsed arguments. Ops that take a
+    pointer are declared once per pointer and addressing mode (LD_X_INC,
+    LDD_Y, ...), so the pointer argument picks the op; a displacement is
+    split off into an argument of its own. Returns (op, args).
+    """
+    if mnemonic in kRegisterAliases and len(args) == 1:
+        # LSL r1 is ADD r1, r1 and so on
+        return AllOps[kRegisterAliases[mnemonic]], [args[0], args[0]]
+    pointers = [arg for arg in args if isinstance(arg, PointerArg)]
+    if not pointers:
+        return AllOps[mnemonic], args
+    pointer = pointers[0]
+    if (pointer.mode == kPointerDisplacement
+        or (pointer.mode == kPointerPlain and pointer.register != "X"
+            and mnemonic in ("LD", "ST"))):
+        # LD/ST through Y or Z are LDD/STD with no displacement
+        name = {"LD": "LDD", "ST": "STD"}.get(mnemonic, mnemonic)
+        name += "_" + pointer.register
+        expanded = []
+        for arg in args:
+            expanded.append(arg)
+            if arg is pointer:
+                expanded.append(shared_arg(ConstantArg,
+                                           pointer.displacement))
+        args = expanded
+    else:
+        name = mnemonic + "_" + pointer.register
+        if pointer.mode == kPointerPostInc:
+            name += "_INC"
+        elif pointer.mode == kPointerPreDec:
+            name += "_DEC"
+    return AllOps[name], args
+
 class declare_op(object):
-    def __init__(self, args, opcode):
+    def __init__(self, args, opcode, cycles=1, flow=kFlowNext):
         """
         If there are decorator arguments, the function
         to be decorated is not passed to the constructor!
@@ -172,7 +508,7 @@ class declare_op(object):
                 match = re.match('(\w+):(\d+)', arg)
                 if match:
                     arg = match.group(1)
-                    bits_required = match.group(2)
+                    bits_required = int(match.group(2))
                     argtype = kArgTypesMap[arg]
                     argtype = argtype._replace(bits=bits_required)
                 else:
@@ -181,6 +517,8 @@ class declare_op(object):
                 
             
         self.opcode = opcode.replace(' ','')
+        self.cycles = cycles
+        self.flow = flow
 
     def __call__(self, f):
         """
@@ -188,7 +526,8 @@ class declare_op(object):
         once, as part of the decoration process! You can only give
         it a single argument, which is the function object.
         """
-        op = Op(f.__name__, self.args, self.opcode, f)
+        op = Op(f.__name__, self.args, self.opcode, f, self.cycles,
+                self.flow)
         AllOps[f.__name__] = op
         return f;
     
@@ -220,18 +559,699 @@ class ASMError(Exception):
 
 
 
+# Data space layout shared by the classic AVR cores: the register file and
+# I/O registers are mapped below SRAM.
+kIOOffset = 0x20
+kIOSize = 0x40
+kSPL = 0x5d
+kSPH = 0x5e
+kSREG = 0x5f
+
+# Bits of CPUState.io_mask: the address has a read or write handler (see
+# dataspace.py), so loads and stores go through CPUState.io_read and
+# io_write instead of straight to data.
+kIORead = 0x01
+kIOWrite = 0x02
+
+# SREG bits
+kFlagC = 0x01
+kFlagZ = 0x02
+kFlagN = 0x04
+kFlagV = 0x08
+kFlagS = 0x10
+kFlagH = 0x20
+kFlagT = 0x40
+kFlagI = 0x80
+kFlagNames = "CZNVSHTI"
+
+# Pointer register pairs
+kXReg = 26
+kYReg = 28
+kZReg = 30
+
+class StopExecution(Exception):
+    """
+    Raised by an op to hand control back to whatever is running the
+    simulator, e.g. on BREAK or SLEEP.
+    """
+    def __init__(self, reason):
+        Exception.__init__(self, reason)
+        self.reason = reason
+
+def get_pointer(data, reg):
+    return data[reg] | (data[reg + 1] << 8)
+
+def set_pointer(data, reg, value):
+    data[reg] = value & 0xff
+    data[reg + 1] = (value >> 8) & 0xff
+
+def push(data, value):
+    sp = data[kSPL] | (data[kSPH] << 8)
+    data[sp] = value
+    sp -= 1
+    data[kSPL] = sp & 0xff
+    data[kSPH] = (sp >> 8) & 0xff
+
+def pop(data):
+    sp = (data[kSPL] | (data[kSPH] << 8)) + 1
+    data[kSPL] = sp & 0xff
+    data[kSPH] = (sp >> 8) & 0xff
+    return data[sp]
+
+# Loads and stores anywhere in the data space. Most addresses are plain
+# memory and are indexed directly; only those flagged in io_mask go
+# through their handlers.
+
+def load(cpu_state, addr):
+    if cpu_state.io_mask[addr] & kIORead:
+        return cpu_state.io_read(addr)
+    return cpu_state.data[addr]
+
+def store(cpu_state, addr, value):
+    if cpu_state.io_mask[addr] & kIOWrite:
+        cpu_state.io_write(addr, value)
+    else:
+        cpu_state.data[addr] = value
+
+def push_pc(data, pc):
+    # The low byte goes on the stack first.
+    sp = data[kSPL] | (data[kSPH] << 8)
+    data[sp] = pc & 0xff
+    data[sp - 1] = (pc >> 8) & 0xff
+    sp -= 2
+    data[kSPL] = sp & 0xff
+    data[kSPH] = (sp >> 8) & 0xff
+
+def pop_pc(data):
+    sp = (data[kSPL] | (data[kSPH] << 8)) + 2
+    data[kSPL] = sp & 0xff
+    data[kSPH] = (sp >> 8) & 0xff
+    return (data[sp - 1] << 8) | data[sp]
+
+
+# ALU lookup tables
+
+# The arithmetic and logic ops look their results and SREG flags up in
+# these tables instead of working the flags out bit by bit. They are
+# bytearrays, which are cheap to index from Python; the vector ops use
+# NumPy views of the same memory (see batch.py).
+
+# Flags each kind of op sets; the others are kept
+kArithFlags = kFlagH | kFlagS | kFlagV | kFlagN | kFlagZ | kFlagC
+kLogicFlags = kFlagS | kFlagV | kFlagN | kFlagZ
+kShiftFlags = kFlagS | kFlagV | kFlagN | kFlagZ | kFlagC
+
+def _arith_tables(subtract):
+    # Indexed by (carry << 16) | (a << 8) | b
+    carry, a, b = np.indices((2, 256, 256))
+    if subtract:
+        result = (a - b - carry) & 0xff
+        carries = (~a & b) | (b & result) | (result & ~a)
+        overflow = (a & ~b & ~result) | (~a & b & result)
+    else:
+        result = (a + b + carry) & 0xff
+        carries = (a & b) | (b & ~result) | (~result & a)
+        overflow = (a & b & ~result) | (~a & ~b & result)
+    n = result >> 7
+    v = (overflow >> 7) & 1
+    flags = (((carries >> 7) & 1) * kFlagC | ((carries >> 3) & 1) * kFlagH
+             | (result == 0) * kFlagZ | n * kFlagN | v * kFlagV
+             | (n ^ v) * kFlagS)
+    return (bytearray(result.astype(np.uint8).tobytes()),
+            bytearray(flags.astype(np.uint8).tobytes()))
+
+def _result_flags(result, v):
+    # S, V, N and Z for results (an array) with overflow flags v
+    n = result >> 7
+    return (result == 0) * kFlagZ | n * kFlagN | v * kFlagV | (n ^ v) * kFlagS
+
+def _shift_tables():
+    # Right shifts, indexed by (bit shifted in << 8) | a
+    bit, a = np.indices((2, 256))
+    result = (bit << 7) | (a >> 1)
+    c = a & 1
+    n = result >> 7
+    flags = _result_flags(result, n ^ c) | c * kFlagC
+    return (bytearray(result.astype(np.uint8).tobytes()),
+            bytearray(flags.astype(np.uint8).tobytes()))
+
+def _flag_table(flags):
+    return bytearray(np.asarray(flags).astype(np.uint8).tobytes())
+
+kAddResults, kAddFlags = _arith_tables(False)
+kSubResults, kSubFlags = _arith_tables(True)
+kShiftResults, kShiftFlagTable = _shift_tables()
+_results = np.arange(256)
+# Flags by result: AND/OR/EOR (and COM, which also sets C), INC and DEC
+kLogicFlagTable = _flag_table(_result_flags(_results, 0))
+kIncFlagTable = _flag_table(_result_flags(_results, _results == 0x80))
+kDecFlagTable = _flag_table(_result_flags(_results, _results == 0x7f))
+del _results
+
+# Op implementations take the CPU state followed by the operands decoded
+# from the instruction. The PC has already been advanced past the
+# instruction; ops that take longer than their base cycle count return
+# the extra cycles.
+
+# Arithmetic and logic
+
 @declare_op("Rd,Rr", "0000 11rd dddd rrrr")
-def ADD(cpu_state, inst):
-    print "ADD " + ",".join(inst.args)
+def ADD(cpu_state, d, r):
+    data = cpu_state.data
+    i = (data[d] << 8) | data[r]
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | kAddFlags[i]
+    data[d] = kAddResults[i]
 
-@declare_op("k:14", "1001 010k kkkk 110k kkkk kkkk kkkk kkkk")
-def JMP(cpu_state, inst):
-    print " " + ",".join(inst.args)
+@declare_op("Rd,Rr", "0001 11rd dddd rrrr")
+def ADC(cpu_state, d, r):
+    data = cpu_state.data
+    sreg = data[kSREG]
+    i = ((sreg & kFlagC) << 16) | (data[d] << 8) | data[r]
+    data[kSREG] = (sreg & ~kArithFlags) | kAddFlags[i]
+    data[d] = kAddResults[i]
 
+@declare_op("Rd+1:Rd,K:6", "1001 0110 KKdd KKKK", cycles=2)
+def ADIW(cpu_state, d, k):
+    # The high byte is added with the carry from the low byte; its flags
+    # are the word's, except that Z covers both bytes.
+    data = cpu_state.data
+    low = data[d] + k
+    i = ((low >> 8) << 16) | (data[d + 1] << 8)
+    flags = kAddFlags[i]
+    low &= 0xff
+    if low:
+        flags &= ~kFlagZ
+    data[kSREG] = (data[kSREG] & ~kShiftFlags) | (flags & kShiftFlags)
+    data[d] = low
+    data[d + 1] = kAddResults[i]
+
+@declare_op("Rd,Rr", "0001 10rd dddd rrrr")
+def SUB(cpu_state, d, r):
+    data = cpu_state.data
+    i = (data[d] << 8) | data[r]
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | kSubFlags[i]
+    data[d] = kSubResults[i]
+
+@declare_op("Rd,K", "0101 KKKK dddd KKKK")
+def SUBI(cpu_state, d, k):
+    data = cpu_state.data
+    i = (data[d] << 8) | k
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | kSubFlags[i]
+    data[d] = kSubResults[i]
+
+# With carry, a zero result only leaves Z set if it already was, so that
+# multi-byte compares and subtractions set Z for the whole value.
+
+@declare_op("Rd,Rr", "0000 10rd dddd rrrr")
+def SBC(cpu_state, d, r):
+    data = cpu_state.data
+    sreg = data[kSREG]
+    i = ((sreg & kFlagC) << 16) | (data[d] << 8) | data[r]
+    data[kSREG] = (sreg & ~kArithFlags) | (kSubFlags[i] & (sreg | ~kFlagZ))
+    data[d] = kSubResults[i]
+
+@declare_op("Rd,K", "0100 KKKK dddd KKKK")
+def SBCI(cpu_state, d, k):
+    data = cpu_state.data
+    sreg = data[kSREG]
+    i = ((sreg & kFlagC) << 16) | (data[d] << 8) | k
+    data[kSREG] = (sreg & ~kArithFlags) | (kSubFlags[i] & (sreg | ~kFlagZ))
+    data[d] = kSubResults[i]
+
+@declare_op("Rd+1:Rd,K:6", "1001 0111 KKdd KKKK", cycles=2)
+def SBIW(cpu_state, d, k):
+    data = cpu_state.data
+    low = data[d] - k
+    i = ((low < 0) << 16) | (data[d + 1] << 8)
+    flags = kSubFlags[i]
+    low &= 0xff
+    if low:
+        flags &= ~kFlagZ
+    data[kSREG] = (data[kSREG] & ~kShiftFlags) | (flags & kShiftFlags)
+    data[d] = low
+    data[d + 1] = kSubResults[i]
+
+@declare_op("Rd,Rr", "0001 01rd dddd rrrr")
+def CP(cpu_state, d, r):
+    data = cpu_state.data
+    i = (data[d] << 8) | data[r]
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | kSubFlags[i]
+
+@declare_op("Rd,Rr", "0000 01rd dddd rrrr")
+def CPC(cpu_state, d, r):
+    data = cpu_state.data
+    sreg = data[kSREG]
+    i = ((sreg & kFlagC) << 16) | (data[d] << 8) | data[r]
+    data[kSREG] = (sreg & ~kArithFlags) | (kSubFlags[i] & (sreg | ~kFlagZ))
+
+@declare_op("Rd,K", "0011 KKKK dddd KKKK")
+def CPI(cpu_state, d, k):
+    data = cpu_state.data
+    i = (data[d] << 8) | k
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | kSubFlags[i]
+
+@declare_op("Rd", "1001 010d dddd 0001")
+def NEG(cpu_state, d):
+    data = cpu_state.data
+    i = data[d]     # 0 - Rd
+    data[kSREG] = (data[kSREG] & ~kArithFlags) | kSubFlags[i]
+    data[d] = kSubResults[i]
+
+@declare_op("Rd", "1001 010d dddd 0011")
+def INC(cpu_state, d):
+    data = cpu_state.data
+    result = (data[d] + 1) & 0xff
+    data[kSREG] = (data[kSREG] & ~kLogicFlags) | kIncFlagTable[result]
+    data[d] = result
+
+@declare_op("Rd", "1001 010d dddd 1010")
+def DEC(cpu_state, d):
+    data = cpu_state.data
+    result = (data[d] - 1) & 0xff
+    data[kSREG] = (data[kSREG] & ~kLogicFlags) | kDecFlagTable[result]
+    data[d] = result
+
+@declare_op("Rd,Rr", "0010 00rd dddd rrrr")
+def AND(cpu_state, d, r):
+    data = cpu_state.data
+    result = data[d] & data[r]
+    data[kSREG] = (data[kSREG] & ~kLogicFlags) | kLogicFlagTable[result]
+    data[d] = result
+
+@declare_op("Rd,K", "0111 KKKK dddd KKKK")
+def ANDI(cpu_state, d, k):
+    data = cpu_state.data
+    result = data[d] & k
+    data[kSREG] = (data[kSREG] & ~kLogicFlags) | kLogicFlagTable[result]
+    data[d] = result
+
+@declare_op("Rd,Rr", "0010 10rd dddd rrrr")
+def OR(cpu_state, d, r):
+    data = cpu_state.data
+    result = data[d] | data[r]
+    data[kSREG] = (data[kSREG] & ~kLogicFlags) | kLogicFlagTable[result]
+    data[d] = result
+
+@declare_op("Rd,K", "0110 KKKK dddd KKKK")
+def ORI(cpu_state, d, k):
+    data = cpu_state.data
+    result = data[d] | k
+    data[kSREG] = (data[kSREG] & ~kLogicFlags) | kLogicFlagTable[result]
+    data[d] = result
+
+@declare_op("Rd,Rr", "0010 01rd dddd rrrr")
+def EOR(cpu_state, d, r):
+    data = cpu_state.data
+    result = data[d] ^ data[r]
+    data[kSREG] = (data[kSREG] & ~kLogicFlags) | kLogicFlagTable[result]
+    data[d] = result
+
+@declare_op("Rd", "1001 010d dddd 0000")
+def COM(cpu_state, d):
+    data = cpu_state.data
+    result = data[d] ^ 0xff
+    data[kSREG] = ((data[kSREG] & ~kShiftFlags) | kLogicFlagTable[result]
+                   | kFlagC)
+    data[d] = result
+
+# Right shifts differ only in the bit shifted in at the top.
+
+@declare_op("Rd", "1001 010d dddd 0110")
+def LSR(cpu_state, d):
+    data = cpu_state.data
+    i = data[d]
+    data[kSREG] = (data[kSREG] & ~kShiftFlags) | kShiftFlagTable[i]
+    data[d] = kShiftResults[i]
+
+@declare_op("Rd", "1001 010d dddd 0111")
+def ROR(cpu_state, d):
+    data = cpu_state.data
+    sreg = data[kSREG]
+    i = ((sreg & kFlagC) << 8) | data[d]
+    data[kSREG] = (sreg & ~kShiftFlags) | kShiftFlagTable[i]
+    data[d] = kShiftResults[i]
+
+@declare_op("Rd", "1001 010d dddd 0101")
+def ASR(cpu_state, d):
+    data = cpu_state.data
+    a = data[d]
+    i = ((a >> 7) << 8) | a
+    data[kSREG] = (data[kSREG] & ~kShiftFlags) | kShiftFlagTable[i]
+    data[d] = kShiftResults[i]
+
+@declare_op("Rd", "1001 010d dddd 0010")
+def SWAP(cpu_state, d):
+    data = cpu_state.data
+    a = data[d]
+    data[d] = ((a << 4) | (a >> 4)) & 0xff
+
+# Control flow
+
+@declare_op("k:12", "1100 kkkk kkkk kkkk", cycles=2, flow=kFlowJump)
+def RJMP(cpu_state, k):
+    cpu_state.pc += k
+
+@declare_op("k:12", "1101 kkkk kkkk kkkk", cycles=3, flow=kFlowCall)
+def RCALL(cpu_state, k):
+    push_pc(cpu_state.data, cpu_state.pc)
+    cpu_state.pc += k
+
+@declare_op("k:22", "1001 010k kkkk 110k kkkk kkkk kkkk kkkk",
+            cycles=3, flow=kFlowJump)
+def JMP(cpu_state, k):
+    cpu_state.pc = k
+
+@declare_op("k:22", "1001 010k kkkk 111k kkkk kkkk kkkk kkkk",
+            cycles=4, flow=kFlowCall)
+def CALL(cpu_state, k):
+    push_pc(cpu_state.data, cpu_state.pc)
+    cpu_state.pc = k
+
+@declare_op("", "1001 0100 0000 1001", cycles=2, flow=kFlowJump)
+def IJMP(cpu_state):
+    cpu_state.pc = get_pointer(cpu_state.data, kZReg)
+
+@declare_op("", "1001 0101 0000 1001", cycles=3, flow=kFlowCall)
+def ICALL(cpu_state):
+    push_pc(cpu_state.data, cpu_state.pc)
+    cpu_state.pc = get_pointer(cpu_state.data, kZReg)
+
+@declare_op("", "1001 0101 0000 1000", cycles=4, flow=kFlowReturn)
+def RET(cpu_state):
+    cpu_state.pc = pop_pc(cpu_state.data)
+
+@declare_op("", "1001 0101 0001 1000", cycles=4, flow=kFlowReturn)
+def RETI(cpu_state):
+    data = cpu_state.data
+    cpu_state.pc = pop_pc(data)
+    data[kSREG] |= kFlagI
+
+@declare_op("s,k:7", "1111 00kk kkkk ksss", flow=kFlowBranch)
+def BRBS(cpu_state, s, k):
+    if cpu_state.data[kSREG] & (1 << s):
+        cpu_state.pc += k
+        return 1
+
+@declare_op("s,k:7", "1111 01kk kkkk ksss", flow=kFlowBranch)
+def BRBC(cpu_state, s, k):
+    if not cpu_state.data[kSREG] & (1 << s):
+        cpu_state.pc += k
+        return 1
+
+def _declare_branch(mnemonic, bit, if_set):
+    # BRBS/BRBC with a fixed flag; declared as ops of their own so they
+    # decode (and run) without the flag operand.
+    mask = 1 << bit
+    if if_set:
+        def impl(cpu_state, k):
+            if cpu_state.data[kSREG] & mask:
+                cpu_state.pc += k
+                return 1
+    else:
+        def impl(cpu_state, k):
+            if not cpu_state.data[kSREG] & mask:
+                cpu_state.pc += k
+                return 1
+    impl.__name__ = mnemonic
+    opcode = "1111 0%dkk kkkk k%s" % (0 if if_set else 1, format(bit, "03b"))
+    declare_op("k:7", opcode, flow=kFlowBranch)(impl)
+
+for _set_name, _clear_name, _bit in [("BRCS", "BRCC", 0), ("BREQ", "BRNE", 1),
+                                     ("BRMI", "BRPL", 2), ("BRVS", "BRVC", 3),
+                                     ("BRLT", "BRGE", 4), ("BRHS", "BRHC", 5),
+                                     ("BRTS", "BRTC", 6), ("BRIE", "BRID", 7)]:
+    _declare_branch(_set_name, _bit, True)
+    _declare_branch(_clear_name, _bit, False)
+
+# Same encodings, alternative names
+AllOps["BRLO"] = AllOps["BRCS"]
+AllOps["BRSH"] = AllOps["BRCC"]
+
+@declare_op("Rd,Rr", "0001 00rd dddd rrrr", flow=kFlowSkip)
+def CPSE(cpu_state, d, r):
+    data = cpu_state.data
+    if data[d] == data[r]:
+        return cpu_state.skip()
+
+@declare_op("Rr,b", "1111 110r rrrr 0bbb", flow=kFlowSkip)
+def SBRC(cpu_state, r, b):
+    if not cpu_state.data[r] & (1 << b):
+        return cpu_state.skip()
+
+@declare_op("Rr,b", "1111 111r rrrr 0bbb", flow=kFlowSkip)
+def SBRS(cpu_state, r, b):
+    if cpu_state.data[r] & (1 << b):
+        return cpu_state.skip()
+
+@declare_op("A:5,b", "1001 1001 AAAA Abbb", flow=kFlowSkip)
+def SBIC(cpu_state, a, b):
+    if not load(cpu_state, a + kIOOffset) & (1 << b):
+        return cpu_state.skip()
+
+@declare_op("A:5,b", "1001 1011 AAAA Abbb", flow=kFlowSkip)
+def SBIS(cpu_state, a, b):
+    if load(cpu_state, a + kIOOffset) & (1 << b):
+        return cpu_state.skip()
+
+# Data transfer
+
+@declare_op("Rd,Rr", "0010 11rd dddd rrrr")
+def MOV(cpu_state, d, r):
+    data = cpu_state.data
+    data[d] = data[r]
+
+@declare_op("Rd+1:Rd,Rr+1:Rr", "0000 0001 dddd rrrr")
+def MOVW(cpu_state, d, r):
+    data = cpu_state.data
+    data[d] = data[r]
+    data[d + 1] = data[r + 1]
+
+@declare_op("Rd,K", "1110 KKKK dddd KKKK")
+def LDI(cpu_state, d, k):
+    cpu_state.data[d] = k
+
+@declare_op("Rd,k:16", "1001 000d dddd 0000 kkkk kkkk kkkk kkkk", cycles=2)
+def LDS(cpu_state, d, k):
+    data = cpu_state.data
+    if cpu_state.io_mask[k] & kIORead:
+        data[d] = cpu_state.io_read(k)
+    else:
+        data[d] = data[k]
+
+@declare_op("k:16,Rr", "1001 001r rrrr 0000 kkkk kkkk kkkk kkkk", cycles=2)
+def STS(cpu_state, k, r):
+    data = cpu_state.data
+    if cpu_state.io_mask[k] & kIOWrite:
+        cpu_state.io_write(k, data[r])
+    else:
+        data[k] = data[r]
+
+def _declare_pointer_ops(pointer, reg, ld_code, st_code):
+    # LD/ST through a pointer register, plain, post-increment and
+    # pre-decrement.
+    # The pointer's address is checked against io_mask inline, so that
+    # plain memory costs no more than an index.
+    def ld(cpu_state, d):
+        data = cpu_state.data
+        addr = get_pointer(data, reg)
+        if cpu_state.io_mask[addr] & kIORead:
+            data[d] = cpu_state.io_read(addr)
+        else:
+            data[d] = data[addr]
+    def ld_inc(cpu_state, d):
+        data = cpu_state.data
+        addr = get_pointer(data, reg)
+        set_pointer(data, reg, addr + 1)
+        if cpu_state.io_mask[addr] & kIORead:
+            data[d] = cpu_state.io_read(addr)
+        else:
+            data[d] = data[addr]
+    def ld_dec(cpu_state, d):
+        data = cpu_state.data
+        addr = (get_pointer(data, reg) - 1) & 0xffff
+        set_pointer(data, reg, addr)
+        if cpu_state.io_mask[addr] & kIORead:
+            data[d] = cpu_state.io_read(addr)
+        else:
+            data[d] = data[addr]
+    def st(cpu_state, r):
+        data = cpu_state.data
+        addr = get_pointer(data, reg)
+        if cpu_state.io_mask[addr] & kIOWrite:
+            cpu_state.io_write(addr, data[r])
+        else:
+            data[addr] = data[r]
+    def st_inc(cpu_state, r):
+        data = cpu_state.data
+        addr = get_pointer(data, reg)
+        value = data[r]
+        set_pointer(data, reg, addr + 1)
+        if cpu_state.io_mask[addr] & kIOWrite:
+            cpu_state.io_write(addr, value)
+        else:
+            data[addr] = value
+    def st_dec(cpu_state, r):
+        data = cpu_state.data
+        value = data[r]
+        addr = (get_pointer(data, reg) - 1) & 0xffff
+        set_pointer(data, reg, addr)
+        if cpu_state.io_mask[addr] & kIOWrite:
+            cpu_state.io_write(addr, value)
+        else:
+            data[addr] = value
+
+    variants = [("LD_%s", ld, "Rd,%s", "1001 000d dddd %s" % ld_code[0]),
+                ("LD_%s_INC", ld_inc, "Rd,%s", "1001 000d dddd %s" % ld_code[1]),
+                ("LD_%s_DEC", ld_dec, "Rd,%s", "1001 000d dddd %s" % ld_code[2]),
+                ("ST_%s", st, "%s,Rr", "1001 001r rrrr %s" % st_code[0]),
+                ("ST_%s_INC", st_inc, "%s,Rr", "1001 001r rrrr %s" % st_code[1]),
+                ("ST_%s_DEC", st_dec, "%s,Rr", "1001 001r rrrr %s" % st_code[2])]
+    for name, impl, args, opcode in variants:
+        if opcode.endswith("None"):
+            continue
+        impl.__name__ = name % pointer
+        declare_op(args % pointer, opcode, cycles=2)(impl)
+
+# Y and Z without displacement are encoded as LDD/STD with q = 0.
+_declare_pointer_ops("X", kXReg, ("1100", "1101", "1110"), ("1100", "1101", "1110"))
+_declare_pointer_ops("Y", kYReg, (None, "1001", "1010"), (None, "1001", "1010"))
+_declare_pointer_ops("Z", kZReg, (None, "0001", "0010"), (None, "0001", "0010"))
+
+@declare_op("Rd,Y,q", "10q0 qq0d dddd 1qqq", cycles=2)
+def LDD_Y(cpu_state, d, q):
+    data = cpu_state.data
+    addr = get_pointer(data, kYReg) + q
+    if cpu_state.io_mask[addr] & kIORead:
+        data[d] = cpu_state.io_read(addr)
+    else:
+        data[d] = data[addr]
+
+@declare_op("Rd,Z,q", "10q0 qq0d dddd 0qqq", cycles=2)
+def LDD_Z(cpu_state, d, q):
+    data = cpu_state.data
+    addr = get_pointer(data, kZReg) + q
+    if cpu_state.io_mask[addr] & kIORead:
+        data[d] = cpu_state.io_read(addr)
+    else:
+        data[d] = data[addr]
+
+@declare_op("Y,q,Rr", "10q0 qq1r rrrr 1qqq", cycles=2)
+def STD_Y(cpu_state, q, r):
+    data = cpu_state.data
+    addr = get_pointer(data, kYReg) + q
+    if cpu_state.io_mask[addr] & kIOWrite:
+        cpu_state.io_write(addr, data[r])
+    else:
+        data[addr] = data[r]
+
+@declare_op("Z,q,Rr", "10q0 qq1r rrrr 0qqq", cycles=2)
+def STD_Z(cpu_state, q, r):
+    data = cpu_state.data
+    addr = get_pointer(data, kZReg) + q
+    if cpu_state.io_mask[addr] & kIOWrite:
+        cpu_state.io_write(addr, data[r])
+    else:
+        data[addr] = data[r]
+
+@declare_op("", "1001 0101 1100 1000", cycles=3)
+def LPM(cpu_state):
+    data = cpu_state.data
+    data[0] = cpu_state.read_program_byte(get_pointer(data, kZReg))
+
+@declare_op("Rd,Z", "1001 000d dddd 0100", cycles=3)
+def LPM_Z(cpu_state, d):
+    data = cpu_state.data
+    data[d] = cpu_state.read_program_byte(get_pointer(data, kZReg))
+
+@declare_op("Rd,Z", "1001 000d dddd 0101", cycles=3)
+def LPM_Z_INC(cpu_state, d):
+    data = cpu_state.data
+    addr = get_pointer(data, kZReg)
+    set_pointer(data, kZReg, addr + 1)
+    data[d] = cpu_state.read_program_byte(addr)
+
+@declare_op("", "1001 0101 1110 1000", cycles=2, flow=kFlowFlash)
+def SPM(cpu_state):
+    # Simplified self-programming: R1:R0 is written straight to the flash
+    # word addressed by Z, without the page buffer.
+    data = cpu_state.data
+    cpu_state.write_flash(get_pointer(data, kZReg) >> 1,
+                          [data[0] | (data[1] << 8)])
+
+@declare_op("Rd,A:6", "1011 0AAd dddd AAAA")
+def IN(cpu_state, d, a):
+    cpu_state.data[d] = load(cpu_state, a + kIOOffset)
+
+@declare_op("A:6,Rr", "1011 1AAr rrrr AAAA")
+def OUT(cpu_state, a, r):
+    store(cpu_state, a + kIOOffset, cpu_state.data[r])
+
+@declare_op("Rr", "1001 001r rrrr 1111", cycles=2)
+def PUSH(cpu_state, r):
+    data = cpu_state.data
+    sp = data[kSPL] | (data[kSPH] << 8)
+    if cpu_state.io_mask[sp] & kIOWrite:
+        cpu_state.io_write(sp, data[r])
+    else:
+        data[sp] = data[r]
+    sp -= 1
+    data[kSPL] = sp & 0xff
+    data[kSPH] = (sp >> 8) & 0xff
+
+@declare_op("Rd", "1001 000d dddd 1111", cycles=2)
+def POP(cpu_state, d):
+    data = cpu_state.data
+    sp = (data[kSPL] | (data[kSPH] << 8)) + 1
+    data[kSPL] = sp & 0xff
+    data[kSPH] = (sp >> 8) & 0xff
+    if cpu_state.io_mask[sp] & kIORead:
+        data[d] = cpu_state.io_read(sp)
+    else:
+        data[d] = data[sp]
+
+# Bit and status register ops
+
+@declare_op("s", "1001 0100 0sss 1000")
+def BSET(cpu_state, s):
+    cpu_state.data[kSREG] |= 1 << s
+
+@declare_op("s", "1001 0100 1sss 1000")
+def BCLR(cpu_state, s):
+    cpu_state.data[kSREG] &= ~(1 << s) & 0xff
+
+def _declare_flag_op(mnemonic, bit, value):
+    mask = 1 << bit
+    if value:
+        def impl(cpu_state):
+            cpu_state.data[kSREG] |= mask
+    else:
+        def impl(cpu_state):
+            cpu_state.data[kSREG] &= ~mask & 0xff
+    impl.__name__ = mnemonic
+    declare_op("", "1001 0100 %d%s 1000" % (0 if value else 1,
+                                            format(bit, "03b")))(impl)
+
+for _bit, _flag in enumerate(kFlagNames):
+    _declare_flag_op("SE" + _flag, _bit, True)
+    _declare_flag_op("CL" + _flag, _bit, False)
+
+# MCU control
 
 @declare_op("", "0000 0000 0000 0000")
-def NOP(cpu_state, inst):
-    print "No-op"
+def NOP(cpu_state):
+    pass
+
+@declare_op("", "1001 0101 1000 1000", flow=kFlowHalt)
+def SLEEP(cpu_state):
+    raise StopExecution("sleep")
+
+@declare_op("", "1001 0101 1001 1000", flow=kFlowHalt)
+def BREAK(cpu_state):
+    raise StopExecution("break")
+
+@declare_op("", "1001 0101 1010 1000")
+def WDR(cpu_state):
+    pass
 
 
 # Idea: decorate function for ops, which takes syntax, args, and validators
@@ -0,0 +1,242 @@
+"""
+Branch relaxation.
+
+Jumps, calls and conditional branches to labels are given the shortest
+encoding that reaches their target:
+
+    RJMP / JMP      RJMP within 2K words, else JMP
+    RCALL / CALL    RCALL within 2K words, else CALL
+    BRxx            BRxx within 64 words, else the opposite branch
+                    skipping an RJMP, or a JMP if even that is too far
+
+Every such instruction starts in its short form and only ever grows, so
+the pass settles after a few iterations. Addresses are never recomputed
+by walking the segments: the instructions that can change size are kept
+in arrays ordered by their original offset, and the address of anything
+is its original offset plus the size changes of the candidates before it,
+looked up with a cumulative sum and a binary search.
+"""
+import numpy as np
+
+import program as prog
+
+# Each family's encodings, shortest first
+kJumpForms = {"RJMP": ("RJMP", "JMP"), "JMP": ("RJMP", "JMP"),
+              "RCALL": ("RCALL", "CALL"), "CALL": ("RCALL", "CALL")}
+kBranchBit = 0x0400     # BRBS/BRBC (and the aliases) differ in this bit
+
+kShortRange = (-2048, 2047)
+kBranchRange = (-64, 63)
+
+class LongBranch(object):
+    """
+    Stands in for a branch op whose target is out of reach: the opposite
+    branch, skipping over a jump to the target.
+    """
+    def __init__(self, branch, inverse, jump):
+        self.mnemonic = branch.mnemonic
+        self.args = branch.args
+        self.branch = branch
+        self.inverse = inverse
+        self.jump = jump
+        self.fields = branch.fields
+        self.flow = prog.kFlowBranch
+        self.cycles = branch.cycles
+        self.words = 1 + jump.words
+
+    def Emit(self, args, pc=0, symbols=None):
+        skip = prog.ConstantArg(pc + self.words)
+        words = self.inverse.Emit(list(args[:-1]) + [skip], pc, symbols)
+        return words + self.jump.Emit(args[-1:], pc + 1, symbols)
+
+    def Size(self):
+        return 2 * self.words
+
+    def __repr__(self):
+        return "<LongBranch %s via %s>" % (self.mnemonic, self.jump.mnemonic)
+
+
+_long_branches = {}
+
+def _long_branch(branch, inverse, jump):
+    key = (branch, jump)
+    if key not in _long_branches:
+        _long_branches[key] = LongBranch(branch, inverse, jump)
+    return _long_branches[key]
+
+def _inverse_branch(op):
+    for other in prog.AllOps.values():
+        if (other.fixed_mask == op.fixed_mask
+            and other.fixed_bits == op.fixed_bits ^ kBranchBit
+            and len(other.args) == len(op.args)):
+            return other
+    return None
+
+def _short_op(op):
+    if isinstance(op, LongBranch):
+        return op.branch
+    forms = kJumpForms.get(op.mnemonic)
+    if forms:
+        return prog.AllOps[forms[0]]
+    return op
+
+def _forms(op):
+    """The encodings op can take, shortest first, or None."""
+    op = _short_op(op)
+    forms = kJumpForms.get(op.mnemonic)
+    if forms:
+        return [prog.AllOps[name] for name in forms]
+    if op.flow == prog.kFlowBranch:
+        inverse = _inverse_branch(op)
+        if inverse is not None:
+            return [op, _long_branch(op, inverse, prog.AllOps["RJMP"]),
+                    _long_branch(op, inverse, prog.AllOps["JMP"])]
+    return None
+
+
+class _SegmentIndex(object):
+    """The relaxable instructions of one code segment."""
+    def __init__(self, segment):
+        self.segment = segment
+        self.origin = segment.origin or 0
+        self.insts = []
+        self.forms = []
+        previous = None
+        for inst in segment.instructions:
+            after_skip = (previous is not None
+                          and getattr(previous.op, "flow", None)
+                          == prog.kFlowSkip)
+            previous = inst if type(inst) is prog.Instruction else None
+            if type(inst) is not prog.Instruction or not inst.args:
+                continue
+            if not isinstance(inst.args[-1], prog.SymbolArg):
+                continue
+            forms = _forms(inst.op)
+            if forms:
+                if after_skip and len(forms) == 3:
+                    # A skip would only step over the inverted branch, so
+                    # a branch after one has to stay a branch.
+                    forms = forms[:1]
+                self.insts.append(inst)
+                self.forms.append(forms)
+        n = len(self.insts)
+        self.offsets = np.array([inst.addr for inst in self.insts], np.int64)
+        self.original_size = np.array([inst.op.Size() for inst in self.insts],
+                                      np.int64)
+        # Byte size of each candidate's forms (padded to three forms)
+        self.sizes = np.zeros((n, 3), np.int64)
+        for i, forms in enumerate(self.forms):
+            sizes = [form.Size() for form in forms]
+            sizes += [sizes[-1]] * (3 - len(sizes))
+            self.sizes[i] = sizes
+        self.is_branch = np.array([forms[0].flow == prog.kFlowBranch
+                                   for forms in self.forms], bool)
+        self.max_level = np.array([len(forms) - 1 for forms in self.forms],
+                                  np.int64)
+        self.levels = np.zeros(n, np.int64)
+        self.update_deltas()
+
+    def update_deltas(self):
+        deltas = self.sizes[np.arange(len(self.insts)), self.levels] \
+                 - self.original_size
+        # before[i] is the change in size of candidates 0 .. i-1
+        self.before = np.concatenate(([0], np.cumsum(deltas)))
+
+    def shift(self, offsets):
+        """Size change ahead of the given original byte offsets."""
+        return self.before[np.searchsorted(self.offsets, offsets, "left")]
+
+    def word_address(self, offsets):
+        return self.origin + (offsets + self.shift(offsets)) // 2
+
+
+def relax_segments(segments, symbols=None):
+    """
+    Relax the jumps, calls and branches in the code segments among
+    segments, in place. Returns the number of instructions whose encoding
+    changed.
+    """
+    code = [_SegmentIndex(seg) for seg in segments if seg.seg_type == "CSEG"]
+    labels = {}
+    for index in code:
+        for label, offset in index.segment.labels.items():
+            labels[label] = (index, offset)
+    external = dict(symbols or {})
+    for seg in segments:
+        if seg.seg_type != "CSEG":
+            for label in seg.labels:
+                external[label] = seg.label_address(label)
+
+    # Resolve each candidate's target once, as (segment index, original
+    # offset) or a fixed address. Targets are grouped by the segment they
+    # are in, as (segment index, mask of candidates, offsets).
+    targets = []
+    for index in code:
+        label_index = []
+        label_offsets = np.zeros(len(index.insts), np.int64)
+        fixed = np.zeros(len(index.insts), np.int64)
+        for i, inst in enumerate(index.insts):
+            label = inst.args[-1].label
+            if label in labels:
+                target_index, offset = labels[label]
+                label_index.append(target_index)
+                label_offsets[i] = offset
+            elif label in external:
+                label_index.append(None)
+                fixed[i] = external[label]
+            else:
+                raise prog.ASMError("Unknown label: %s" % label)
+        groups = []
+        for target_index in code:
+            mask = np.array([t is target_index for t in label_index], bool)
+            if mask.any():
+                groups.append((target_index, mask, label_offsets[mask]))
+        targets.append((groups, fixed))
+
+    changed = True
+    while changed:
+        changed = False
+        for index, (groups, fixed) in zip(code, targets):
+            if not len(index.insts):
+                continue
+            pcs = index.word_address(index.offsets)
+            target = fixed.copy()
+            for target_index, mask, offsets in groups:
+                target[mask] = target_index.word_address(offsets)
+            # Distances for the short form and for a jump placed after the
+            # inverted branch
+            near = target - (pcs + 1)
+            after_skip = target - (pcs + 2)
+            short_ok = np.where(index.is_branch,
+                                (near >= kBranchRange[0])
+                                & (near <= kBranchRange[1]),
+                                (near >= kShortRange[0])
+                                & (near <= kShortRange[1]))
+            rjmp_ok = ((after_skip >= kShortRange[0])
+                       & (after_skip <= kShortRange[1]))
+            needed = np.where(short_ok, 0,
+                              np.where(index.is_branch & rjmp_ok, 1, 2))
+            needed = np.minimum(needed, index.max_level)
+            grown = needed > index.levels
+            if grown.any():
+                index.levels = np.maximum(index.levels, needed)
+                index.update_deltas()
+                changed = True
+
+    count = 0
+    for index in code:
+        if not len(index.insts):
+            continue
+        segment = index.segment
+        for inst, forms, level in zip(index.insts, index.forms, index.levels):
+            if inst.op is not forms[level]:
+                count += 1
+                inst.op = forms[level]
+        offsets = np.array([inst.addr for inst in segment.instructions],
+                           np.int64)
+        for inst, shift in zip(segment.instructions, index.shift(offsets)):
+            inst.addr += int(shift)
+        for label, offset in segment.labels.items():
+            segment.labels[label] = offset + int(index.shift(offset))
+        segment._cur_offset += int(index.before[-1])
+    return count
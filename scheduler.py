@@ -0,0 +1,179 @@
+"""
+Cycle-counted event scheduling for peripherals.
+
+Peripherals don't run alongside every instruction; instead they schedule
+events at the cycle they are due, kept in a heap. The simulator runs
+straight up to the next due event, the events fire, and any interrupt they
+raised is taken. While the CPU sleeps, or spins in a loop that can only be
+ended by an event, the cycle count jumps straight to the next event.
+"""
+import heapq
+import itertools
+
+import program as prog
+
+# Longest stretch run between checks for a busy-wait loop while events are
+# pending, and so also the latency of detecting one.
+kIdleCheckCycles = 1000
+# Longest loop recognised as a busy-wait, in instructions
+kIdleProbeInstructions = 32
+# While an interrupt is pending but masked, how often to check whether it
+# has been enabled
+kPendingCheckCycles = 8
+# Cycles from accepting an interrupt to the first vector instruction
+kInterruptResponseCycles = 4
+
+class Event(object):
+    __slots__ = ("cycle", "callback", "cancelled")
+
+    def __init__(self, cycle, callback):
+        self.cycle = cycle
+        self.callback = callback
+        self.cancelled = False
+
+    def __repr__(self):
+        return "<Event at %d: %r>" % (self.cycle, self.callback)
+
+
+class Scheduler(object):
+    """
+    Drives a Simulator along with the events of its peripherals.
+
+    Interrupts are numbered by vector; vector n lives at word address
+    n * vector_words (2 on parts whose vector table holds JMPs, 1 where it
+    holds RJMPs).
+    """
+    def __init__(self, sim, vector_words=2):
+        self.sim = sim
+        self.cpu = sim.cpu
+        self.vector_words = vector_words
+        self.pending = set()
+        self.sleeping = False
+        self.skipped_cycles = 0
+        self._queue = []
+        self._seq = itertools.count()
+
+    def at(self, cycle, callback):
+        """Call callback() once cpu.cycles reaches cycle."""
+        event = Event(cycle, callback)
+        heapq.heappush(self._queue, (cycle, next(self._seq), event))
+        return event
+
+    def after(self, delay, callback):
+        return self.at(self.cpu.cycles + delay, callback)
+
+    def cancel(self, event):
+        event.cancelled = True
+
+    def next_due(self):
+        queue = self._queue
+        while queue and queue[0][2].cancelled:
+            heapq.heappop(queue)
+        if queue:
+            return queue[0][0]
+        return None
+
+    def raise_interrupt(self, vector):
+        self.pending.add(vector)
+
+    def clear_interrupt(self, vector):
+        self.pending.discard(vector)
+
+    def _fire_due(self):
+        queue = self._queue
+        cycles = self.cpu.cycles
+        while queue and queue[0][0] <= cycles:
+            event = heapq.heappop(queue)[2]
+            if not event.cancelled:
+                event.callback()
+
+    def _dispatch_interrupt(self):
+        cpu = self.cpu
+        data = cpu.data
+        if not self.pending or not data[prog.kSREG] & prog.kFlagI:
+            return
+        # Lower vectors have priority
+        vector = min(self.pending)
+        self.pending.discard(vector)
+        prog.push_pc(data, cpu.pc)
+        data[prog.kSREG] &= ~prog.kFlagI & 0xff
+        cpu.pc = vector * self.vector_words
+        cpu.cycles += kInterruptResponseCycles
+        self.sleeping = False
+
+    def _skip(self, cycles):
+        self.cpu.cycles += cycles
+        self.skipped_cycles += cycles
+
+    def _busy_wait_period(self):
+        """
+        Check whether the CPU is spinning in a loop that only an event can
+        end: run up to kIdleProbeInstructions instructions and see whether
+        we come back to the same PC with the data space unchanged. If so,
+        every further iteration would do exactly the same, and the loop's
+        length in cycles is returned. Loops that touch I/O registers with
+        handlers never count.
+        """
+        cpu = self.cpu
+        start_pc = cpu.pc
+        start_cycles = cpu.cycles
+        start_accesses = cpu.io_accesses
+        before = bytes(cpu.data)
+        for _ in range(kIdleProbeInstructions):
+            self.sim.step()
+            if cpu.pc == start_pc:
+                break
+        else:
+            return None
+        # A peripheral's handlers may give a different value next time
+        if cpu.data != before or cpu.io_accesses != start_accesses:
+            return None
+        return cpu.cycles - start_cycles
+
+    def run(self, max_cycles=None):
+        """
+        Run for max_cycles (forever if None). Returns None when the limit
+        is reached, "break" on BREAK, "sleep" if the CPU went to sleep with
+        no event left to wake it, or "idle" if it is busy-waiting with no
+        event left to end the wait.
+        """
+        cpu = self.cpu
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cpu.cycles + max_cycles
+        while cpu.cycles < limit:
+            self._fire_due()
+            self._dispatch_interrupt()
+            due = self.next_due()
+            target = limit if due is None else min(due, limit)
+            if target <= cpu.cycles:
+                continue
+            if self.sleeping:
+                if target == float("inf"):
+                    return "sleep"
+                self._skip(target - cpu.cycles)
+                continue
+
+            run_cycles = target - cpu.cycles
+            if self.pending:
+                run_cycles = min(run_cycles, kPendingCheckCycles)
+            else:
+                run_cycles = min(run_cycles, kIdleCheckCycles)
+            try:
+                reason = self.sim.run(run_cycles)
+                if (reason is None and not self.pending
+                    and cpu.cycles < target):
+                    period = self._busy_wait_period()
+                    if period:
+                        if target == float("inf"):
+                            return "idle"
+                        iterations = -(-(target - cpu.cycles) // period)
+                        self._skip(iterations * period)
+            except prog.StopExecution as e:
+                reason = e.reason
+            if reason == "sleep":
+                self.sleeping = True
+            elif reason is not None:
+                return reason
+        return None
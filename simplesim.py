@@ -1,188 +1,382 @@
+import weakref
+from functools import partial
 
 import numpy as np
-import re
-
-kTokenizeRE = re.compile('\s+|(,)')
-kRegisterRE = re.compile('[rR](\d\d?)')
-kConstantRE = re.compile('[+-]?\d+')
-kLabelRE = re.compile('^([a-zA-Z_][a-zA-Z_0-9]+)$')
-
-class Op(object):
-    def __init__(self, mnemonic, args, opcode, impl):
-        self.mnemonic = mnemonic
-        self.args = args
-        self.opcode = opcode.replace(" ","")        
-        self.impl = impl
-
-    def Apply(self, cpu_state):
-        self.impl(cpu_state)
-
-    def Emit(self):
-        pass
-
-    def Size(self):
-        return len(self.opcode) / 8
-    
-AllOps = {}
-
-class Instruction(object):
-    def __init__(self, op, addr, args):
-        self.op = op
-        self.addr = addr
-        self.args = args[:]
-        
-    def __repr__(self):
-        return (("%04x" % self.addr) + ": <" + self.op.mnemonic + " "
-                + ','.join([str(x) for x in self.args]) + '>')
-    
-    def Size(self):
-        return self.op.Size()
-    
-# Arg types:
-kArgConst = 1
-kArgReg = 2
-kArgXReg = 3
-kArgYReg = 4
-kArgZReg = 5
-
-class OpArg(object):
+
+import dataspace
+import fusion
+import program as prog
+from decoder import default_decoder
+
+# 16K words (32K bytes) of program memory
+kDefaultFlashWords = 0x4000
+
+class SimulationError(Exception):
     pass
 
-class RegisterArg(OpArg):
-    def __init__(self, arg):
-        m = kRegisterRE.match(arg)
-        if not m or int(m.group(1)) >= 32:
-            raise ASMError("Invalid register argument: " + arg)
-        self.register = int(m.group(1))
-    def __repr__(self):
-        return "R%d" % self.register
-
-class ConstantArg(OpArg):
-    def __init__(self, arg):
-        self.value = int(arg)
-
-class LabelArg(OpArg):
-    def __init__(self, arg):
-        self.label = arg
-
-def parse_arg(arg, oparg):
-    if oparg.startswith('R'):
-        return RegisterArg(arg)
-    elif arg in ["X", "Y", "Z"]:
-        return arg
-    elif arg :
-        return LabelArg(arg)
-    else:
-        return int(arg)
-
-class declare_op(object):
-
-    def __init__(self, args, opcode):
+class _WeakMethod(object):
+    # A bound method held without keeping its object alive; calling this
+    # gives the method back, or None once the object is gone.
+    def __init__(self, method):
+        self.obj = weakref.ref(method.__self__)
+        self.func = method.__func__
+
+    def __call__(self):
+        obj = self.obj()
+        if obj is None:
+            return None
+        return self.func.__get__(obj, type(obj))
+
+def _observer_ref(observer):
+    if getattr(observer, "__self__", None) is not None:
+        return _WeakMethod(observer)
+    return lambda: observer
+
+
+class CPUState(object):
+    def __init__(self, ramsize, flashsize=kDefaultFlashWords, device=None):
+        # The whole data space (registers, I/O and SRAM). The ops work on
+        # the bytearray directly, since indexing it is much cheaper than
+        # indexing a NumPy array; ram is a view of the same memory.
+        self.data = bytearray(ramsize)
+        self.ram = np.frombuffer(self.data, np.uint8)
+        # I/O handlers: io_mask flags the addresses that have them (see
+        # dataspace.py), io_handlers maps those to (read, write).
+        self.io_mask = bytearray(ramsize)
+        self.io_handlers = {}
+        # Number of accesses that went to a handler
+        self.io_accesses = 0
+        self.device = device
+        self.flash = np.zeros(flashsize, np.uint16)
+        # References to the callbacks of add_flash_observer()
+        self.flash_observers = []
+        self.instruction_sizes = default_decoder().sizes
+        self.reset()
+
+    @classmethod
+    def for_device(cls, device):
+        """A CPU laid out as device, a DeviceProfile or its name."""
+        if isinstance(device, basestring):
+            device = dataspace.get_device(device)
+        return cls(device.data_size, device.flash_words, device)
+
+    def add_io_handler(self, addr, read=None, write=None):
         """
-        If there are decorator arguments, the function
-        to be decorated is not passed to the constructor!
+        Have loads from data space address addr return read(addr), and
+        stores to it call write(addr, value). data[addr] still holds the
+        last value read or written, for anything looking at the memory
+        directly. While a handler is called, cpu.cycles counts up to the
+        end of the instruction making the access (see Simulator). Only I/O
+        and extended I/O registers can have handlers, except SREG and the
+        stack pointer, which the ops use directly.
         """
-        self.args = args.split(',')
-        self.opcode = opcode.replace(' ','')
+        if self.device is not None:
+            region = self.device.region(addr)
+            valid = region in (dataspace.kIORegion,
+                               dataspace.kExtendedIORegion)
+        else:
+            valid = prog.kIOOffset <= addr < len(self.data)
+        if not valid or addr in (prog.kSPL, prog.kSPH, prog.kSREG):
+            raise SimulationError("Can't handle accesses to %04x" % addr)
+        self.io_handlers[addr] = (read, write)
+        self.io_mask[addr] = ((prog.kIORead if read else 0)
+                              | (prog.kIOWrite if write else 0))
+
+    def remove_io_handler(self, addr):
+        self.io_handlers.pop(addr, None)
+        self.io_mask[addr] = 0
+
+    def io_read(self, addr):
+        self.io_accesses += 1
+        value = self.io_handlers[addr][0](addr) & 0xff
+        self.data[addr] = value
+        return value
+
+    def io_write(self, addr, value):
+        self.io_accesses += 1
+        self.data[addr] = value
+        self.io_handlers[addr][1](addr, value)
+
+    def reset(self):
+        self.ram[:] = 0
+        self.pc = 0
+        self.cycles = 0
+        if self.device is not None:
+            self.sp = self.device.ramend
+        else:
+            self.sp = len(self.data) - 1
+
+    @property
+    def sp(self):
+        return self.data[prog.kSPL] | (self.data[prog.kSPH] << 8)
+
+    @sp.setter
+    def sp(self, value):
+        prog.set_pointer(self.data, prog.kSPL, value)
+
+    @property
+    def sreg(self):
+        return self.data[prog.kSREG]
 
-    def __call__(self, f):
+    @sreg.setter
+    def sreg(self, value):
+        self.data[prog.kSREG] = value
+
+    def skip(self):
         """
-        If there are decorator arguments, __call__() is only called
-        once, as part of the decoration process! You can only give
-        it a single argument, which is the function object.
+        Step over the instruction at the PC, as the skip ops do. Returns
+        the number of words skipped, which is also the extra cycle count.
         """
-        op = Op(f.__name__, self.args, self.opcode, f)
-        AllOps[f.__name__] = op
-        return f;
-    
-    
-class CPUState(object):
-    # Need program mem as the main thing, but should have ways to set
-    # status reg flags, SP, etc
-    def __init__(self, ramsize):
-        self.ram = np.zeros(ramsize, np.uint8)
+        size = int(self.instruction_sizes[self.flash[self.pc]])
+        self.pc += size
+        return size
 
-class ASMError(Exception):
-    pass
+    def read_program_byte(self, addr):
+        word = int(self.flash[addr >> 1])
+        if addr & 1:
+            return word >> 8
+        return word & 0xff
 
-def tokenize(line):
-    for token in kTokenizeRE.split(line.strip()):
-        if token:
-            yield token
-
-def parse_asm(text):
-    cur_addr = 0
-    labels = {}
-    result = []
-    lineno = 0
-    for line in text.splitlines():
-        lineno += 1
-        # remove comments
-        line = line.split(';',1)[0]
-        toks = list(tokenize(line))
-        tok_idx = 0
-        if len(toks) == 0:
-            continue
-
-        tok = toks[tok_idx]
-        if tok.startswith('.'):
-            print "Saw directive; skipping line"
-            continue
-        elif tok.endswith(':'):
-            label = tok[:-1]
-            if not kLabelRE.match(label):
-                raise ASMError("Invalid label: " + label)
-            if label in labels:
-                raise ASMError("Label " + label + " redeclared at line:" + str(lineno) + ".")
-            labels[label] = cur_addr
-            tok_idx += 1
-            if tok_idx >= len(toks):
-                continue
-            tok = toks[tok_idx]
-        if tok_idx < len(toks):
-            if tok in AllOps:
-                op = AllOps[tok]
-                args = [tok for tok in toks[tok_idx + 1:] if tok != ',']
-                if len(args) != len(op.args):
-                    raise ASMError("Operation %s takes %d arguments." % (tok, len(op.args)))
-                parsed_args = [parse_arg(arg, op_arg) for (arg, op_arg) in zip(args, op.args)]
-                inst = Instruction(op, cur_addr, parsed_args)
-                cur_addr += inst.Size()
-                result.append(inst)
+    def write_flash(self, addr, words):
+        words = np.asarray(words, np.uint16)
+        end = addr + len(words)
+        if addr < 0 or end > len(self.flash):
+            raise SimulationError("Can't write %d words at %04x: flash is "
+                                  "%d words" % (len(words), addr,
+                                                len(self.flash)))
+        if not self.flash.flags.writeable:
+            # Flash shared with other CPUs; take a private copy first.
+            self.flash = self.flash.copy()
+        self.flash[addr:end] = words
+        for ref in list(self.flash_observers):
+            observer = ref()
+            if observer is None:
+                self.flash_observers.remove(ref)
             else:
-                raise ASMError("Unknown operation " + op + " at line:" + str(lineno) + ".")
+                observer(addr, end)
+
+    def add_flash_observer(self, observer):
+        """
+        Have observer(start, end) called with the word addresses written
+        whenever flash changes. A bound method doesn't keep its object
+        alive: once the simulator (or debugger, ...) it belongs to is gone,
+        it is dropped.
+        """
+        self.flash_observers = [ref for ref in self.flash_observers
+                                if ref() is not None]
+        self.flash_observers.append(_observer_ref(observer))
+
+    def remove_flash_observer(self, observer):
+        for ref in self.flash_observers:
+            if ref() == observer:
+                self.flash_observers.remove(ref)
+                return
+
+    def load_image(self, image, origin=0):
+        """Copy a flash image (a sequence of 16-bit words) into flash."""
+        self.write_flash(origin, image)
+
 
-    # resolve labels:
-    for inst in result:
-        for idx,arg in enumerate(inst.args):
-            if isinstance(arg, LabelArg):
-                try:                    
-                    inst.args[idx] = labels[arg.label]
-                except KeyError:
-                    raise ASMError("Unknown label " + arg.label + " at line:" + str(lineno) + ".")
+class Simulator(object):
+    """
+    Execution engine for a CPUState.
 
-                
-    return result
+    Program memory is decoded up front into one entry per word address
+    holding the op implementation with its operands already bound, the
+    instruction size and its base cycle count, so that running an
+    instruction is a list lookup and a call. Entries are dropped when the
+    flash words they were decoded from are written, and decoded again the
+    next time they are reached.
 
+    With fuse, run() executes runs of instructions that have a
+    superinstruction (see fusion.py) as one entry. Cycle limits are then
+    only checked between superinstructions.
 
-@declare_op("Rd,Rr", "0000 11rd dddd rrrr")
-def ADD(cpu_state, inst):
-    print "ADD " + ",".join(inst.args)
+    The cycle count is kept in a local while running and only stored in
+    cpu.cycles when run() returns, except when the CPU has I/O handlers:
+    then cpu.cycles is kept current, so that a handler sees the count up
+    to the end of the instruction making the access.
+    """
+    def __init__(self, cpu, decoder=None, fuse=False):
+        self.cpu = cpu
+        self.decoder = decoder or default_decoder()
+        self.fuse = fuse
+        self._code = [None] * len(cpu.flash)
+        # What run() executes with fuse: a superinstruction's entry where
+        # one starts, else the same as _code. _code always has the single
+        # instructions, for step() and the debugger, tracer and profiler.
+        self._fused = [None] * len(cpu.flash)
+        cpu.add_flash_observer(self.invalidate)
+        self.predecode()
 
-@declare_op("k", "1001 010k kkkk 110k kkkk kkkk kkkk kkkk")
-def JMP(cpu_state, inst):
-    print " " + ",".join(inst.args)
+    def predecode(self):
+        for pc in range(len(self._code)):
+            self._decode(pc)
 
+    def invalidate(self, start, end):
+        # A 32-bit instruction starting just before start includes the
+        # first written word.
+        code = self._code
+        for pc in range(max(start - 1, 0), min(end, len(code))):
+            code[pc] = None
+        fused = self._fused
+        for pc in range(max(start - fusion.kMaxFusionWords + 1, 0),
+                        min(end, len(fused))):
+            fused[pc] = None
 
-@declare_op("", "0000 0000 0000 0000")
-def NOP(cpu_state, inst):
-    print "No-op"
+    def _decode(self, pc):
+        flash = self.cpu.flash
+        op, operands, size = self.decoder.decode_at(flash, pc)
+        if op is None:
+            entry = (partial(_illegal_instruction, pc, int(flash[pc])), 1, 1)
+        else:
+            entry = (partial(op.impl, self.cpu, *operands), size, op.cycles)
+        self._code[pc] = entry
+        return entry
+
+    def _decode_fused(self, pc):
+        match = fusion.match(self.decoder, self.cpu.flash, pc)
+        if match is None:
+            entry = self._code[pc] or self._decode(pc)
+        else:
+            fused, operands, size = match
+            entry = (partial(fused.impl, self.cpu, *operands), size,
+                     fused.cycles)
+        self._fused[pc] = entry
+        return entry
+
+    def run(self, max_cycles=None):
+        """
+        Run until max_cycles have elapsed or an op stops execution (BREAK,
+        SLEEP). Returns the reason for stopping, or None if the cycle
+        limit was reached.
+        """
+        cpu = self.cpu
+        if cpu.io_handlers:
+            return self._run_synced(max_cycles)
+        if self.fuse:
+            code = self._fused
+            decode = self._decode_fused
+        else:
+            code = self._code
+            decode = self._decode
+        pc = cpu.pc
+        cycles = cpu.cycles
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cycles + max_cycles
+        try:
+            while cycles < limit:
+                entry = code[pc]
+                if entry is None:
+                    entry = decode(pc)
+                handler, size, cost = entry
+                cpu.pc = pc + size
+                cycles += cost
+                extra = handler()
+                if extra:
+                    cycles += extra
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return e.reason
+        except IndexError:
+            if cpu.pc >= len(code):
+                raise SimulationError("PC out of range: %04x" % cpu.pc)
+            raise
+        finally:
+            cpu.cycles = cycles
+        return None
+
+    def _run_synced(self, max_cycles):
+        # run(), storing the cycle count before each instruction runs
+        cpu = self.cpu
+        if self.fuse:
+            code = self._fused
+            decode = self._decode_fused
+        else:
+            code = self._code
+            decode = self._decode
+        pc = cpu.pc
+        cycles = cpu.cycles
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cycles + max_cycles
+        try:
+            while cycles < limit:
+                entry = code[pc]
+                if entry is None:
+                    entry = decode(pc)
+                handler, size, cost = entry
+                cpu.pc = pc + size
+                cycles += cost
+                cpu.cycles = cycles
+                extra = handler()
+                if extra:
+                    cycles += extra
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return e.reason
+        except IndexError:
+            if cpu.pc >= len(code):
+                raise SimulationError("PC out of range: %04x" % cpu.pc)
+            raise
+        finally:
+            cpu.cycles = cycles
+        return None
+
+    def run_instructions(self, count):
+        """
+        Run at most count instructions. Returns (instructions executed,
+        reason) where reason is as for run().
+        """
+        cpu = self.cpu
+        code = self._code
+        decode = self._decode
+        pc = cpu.pc
+        cycles = cpu.cycles
+        executed = 0
+        try:
+            while executed < count:
+                entry = code[pc]
+                if entry is None:
+                    entry = decode(pc)
+                handler, size, cost = entry
+                cpu.pc = pc + size
+                cycles += cost
+                cpu.cycles = cycles
+                executed += 1
+                extra = handler()
+                if extra:
+                    cycles += extra
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return executed, e.reason
+        except IndexError:
+            if cpu.pc >= len(code):
+                raise SimulationError("PC out of range: %04x" % cpu.pc)
+            raise
+        finally:
+            cpu.cycles = cycles
+        return executed, None
 
+    def step(self):
+        """Execute a single instruction, returning the cycles it took."""
+        cpu = self.cpu
+        if not 0 <= cpu.pc < len(self._code):
+            raise SimulationError("PC out of range: %04x" % cpu.pc)
+        entry = self._code[cpu.pc]
+        if entry is None:
+            entry = self._decode(cpu.pc)
+        handler, size, cost = entry
+        cpu.pc += size
+        try:
+            cost += handler() or 0
+        finally:
+            cpu.cycles += cost
+        return cost
 
-# Idea: decorate function for ops, which takes syntax, args, and validators
-# Decorator registers function (hasta deal with same mnemonic for things like LD
-# which have multiple addressing modes
-# Perhaps we should just special case LD, ST, LPM, SPM
 
-# The function then takes a cpu state (mem, regs, clock?) and modifies it
-# How to deal with different archs? maybe stick w/tiny for now.
+def _illegal_instruction(pc, word, *args):
+    raise SimulationError("Illegal instruction %04x at %04x" % (word, pc))
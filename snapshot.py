@@ -0,0 +1,170 @@
+"""
+Cheap snapshots of CPU state, and rewinding execution.
+
+The data space (which includes the registers, SREG and SP) is stored as
+fixed-size pages. A snapshot shares every page that hasn't been written
+since the previous snapshot with it, so taking one costs a comparison of
+the data space against the last snapshot plus a copy of just the pages
+that changed.
+"""
+import bisect
+
+import numpy as np
+
+kPageSize = 256
+kDefaultInterval = 1000
+kDefaultMaxCheckpoints = 1000
+
+class Snapshot(object):
+    def __init__(self, pc, cycles, pages, position=None):
+        self.pc = pc
+        self.cycles = cycles
+        # Tuple of read-only arrays, shared between snapshots
+        self.pages = pages
+        self.position = position
+
+    def ram(self):
+        """The data space as one (new) array."""
+        return np.concatenate(self.pages)
+
+    def __repr__(self):
+        return "<Snapshot pc=%04x cycles=%d>" % (self.pc, self.cycles)
+
+
+class Snapshotter(object):
+    def __init__(self, cpu, page_size=kPageSize):
+        self.cpu = cpu
+        self.page_size = page_size
+        size = len(cpu.ram)
+        self._bounds = [(start, min(start + page_size, size))
+                        for start in range(0, size, page_size)]
+        self._full_pages = size // page_size
+        self._shadow = None
+        self._pages = None
+        self.pages_copied = 0
+
+    def _copy_page(self, index):
+        start, end = self._bounds[index]
+        page = self.cpu.ram[start:end].copy()
+        page.flags.writeable = False
+        self.pages_copied += 1
+        return page
+
+    def _changed_pages(self):
+        ram = self.cpu.ram
+        shadow = self._shadow
+        full = self._full_pages * self.page_size
+        changed = np.flatnonzero(
+            (ram[:full].reshape(-1, self.page_size)
+             != shadow[:full].reshape(-1, self.page_size)).any(axis=1))
+        changed = changed.tolist()
+        if full < len(ram) and (ram[full:] != shadow[full:]).any():
+            changed.append(self._full_pages)
+        return changed
+
+    def take(self, position=None):
+        cpu = self.cpu
+        if self._pages is None or len(self._shadow) != len(cpu.ram):
+            self._pages = [self._copy_page(i) for i in range(len(self._bounds))]
+            self._shadow = cpu.ram.copy()
+        else:
+            for index in self._changed_pages():
+                page = self._copy_page(index)
+                self._pages[index] = page
+                start, end = self._bounds[index]
+                self._shadow[start:end] = page
+        return Snapshot(cpu.pc, cpu.cycles, tuple(self._pages), position)
+
+    def restore(self, snapshot):
+        cpu = self.cpu
+        for (start, end), page in zip(self._bounds, snapshot.pages):
+            cpu.ram[start:end] = page
+        cpu.pc = snapshot.pc
+        cpu.cycles = snapshot.cycles
+        # The next snapshot is taken relative to this one.
+        self._pages = list(snapshot.pages)
+        self._shadow = cpu.ram.copy()
+
+
+class Rewinder(object):
+    """
+    Runs a Simulator forwards while keeping a checkpoint every interval
+    instructions, so that it can be moved back to any earlier instruction
+    by restoring the nearest checkpoint at or before it and running
+    forwards again. Positions are counted in instructions executed.
+
+    When there are more than max_checkpoints, every other old one is
+    dropped, so checkpoints get sparser towards the start of the run.
+    Flash writes are not undone.
+    """
+    def __init__(self, sim, interval=kDefaultInterval,
+                 max_checkpoints=kDefaultMaxCheckpoints):
+        self.sim = sim
+        self.snapshotter = Snapshotter(sim.cpu)
+        self.interval = interval
+        self.max_checkpoints = max_checkpoints
+        self.position = 0
+        self._positions = []
+        self._checkpoints = []
+        self._checkpoint()
+
+    def _checkpoint(self):
+        index = bisect.bisect_left(self._positions, self.position)
+        if (index < len(self._positions)
+            and self._positions[index] == self.position):
+            return
+        del self._positions[index:]
+        del self._checkpoints[index:]
+        self._positions.append(self.position)
+        self._checkpoints.append(self.snapshotter.take(self.position))
+        if len(self._checkpoints) > self.max_checkpoints:
+            # Keep the first and the most recent half; thin out the rest.
+            half = len(self._checkpoints) // 2
+            keep = list(range(0, half, 2)) + list(range(half,
+                                                       len(self._checkpoints)))
+            self._positions = [self._positions[i] for i in keep]
+            self._checkpoints = [self._checkpoints[i] for i in keep]
+
+    def run(self, count):
+        """
+        Run up to count instructions forwards. Returns the number executed
+        and the reason execution stopped (see Simulator.run).
+        """
+        done = 0
+        reason = None
+        while done < count:
+            chunk = min(count - done,
+                        self.interval - self.position % self.interval)
+            executed, reason = self.sim.run_instructions(chunk)
+            done += executed
+            self.position += executed
+            if self.position % self.interval == 0:
+                self._checkpoint()
+            if reason is not None:
+                break
+        return done, reason
+
+    def step(self):
+        return self.run(1)
+
+    def goto(self, position):
+        """Move to the state after position instructions."""
+        if position < 0:
+            raise ValueError("Can't go to position %d" % position)
+        if position > self.position:
+            self.run(position - self.position)
+            return
+        index = bisect.bisect_right(self._positions, position) - 1
+        # The checkpoint at position 0 is never thinned out
+        assert index >= 0
+        self.snapshotter.restore(self._checkpoints[index])
+        self.position = self._positions[index]
+        # Replay without disturbing the checkpoints after this point.
+        while self.position < position:
+            executed, reason = self.sim.run_instructions(position - self.position)
+            self.position += executed
+            if reason is not None:
+                break
+
+    def reverse_step(self, count=1):
+        self.goto(max(self.position - count, 0))
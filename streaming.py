@@ -0,0 +1,144 @@
+"""
+Streaming assembly.
+
+StreamingAssembler reads its source a line at a time and hands out each
+instruction's words as soon as they can be encoded, instead of keeping the
+whole program until the end. Nothing is kept of an instruction once it is
+encoded; what stays in memory is the symbol table, the .EQU/.DEF
+definitions and, for instructions referring to labels not defined yet, a
+fixup each. Such instructions are given as zeros at first, and given
+again with their real words when the last label they need is defined.
+
+A code segment's .ORG has to come before anything in it, since what comes
+before has already been given out. Data and EEPROM segments only define
+labels; their contents aren't emitted, as with ASMParser.flash_image().
+Branch relaxation needs the whole program, so it isn't available here.
+"""
+import program as prog
+from assembler import ASMParser
+
+class _Fixup(object):
+    __slots__ = ("segment", "inst", "pending")
+
+    def __init__(self, segment, inst, pending):
+        self.segment = segment
+        self.inst = inst
+        # Number of the instruction's labels still undefined
+        self.pending = pending
+
+
+class _StreamSegment(prog.Segment):
+    """A Segment that passes its contents on instead of keeping them."""
+    def __init__(self, seg_type, assembler):
+        prog.Segment.__init__(self, seg_type)
+        self.assembler = assembler
+
+    def set_origin(self, address):
+        if self.cur_offset:
+            raise prog.ASMError(".ORG must come first in a segment when "
+                                "streaming")
+        prog.Segment.set_origin(self, address)
+
+    def add_label(self, label):
+        if label in self.assembler._symbols:
+            raise prog.ASMError("Duplicate label: %s" % label)
+        prog.Segment.add_label(self, label)
+        self.assembler._define(label, self.label_address(label))
+        del self.labels[label]
+
+    def _pass_on(self):
+        item = self.instructions.pop()
+        if self.seg_type == "CSEG":
+            self.assembler._place(self, item)
+        return item
+
+    def add_instruction(self, op, args):
+        prog.Segment.add_instruction(self, op, args)
+        return self._pass_on()
+
+    def define_bytes(self, byte_vals):
+        prog.Segment.define_bytes(self, byte_vals)
+        self._pass_on()
+
+    def define_words(self, word_vals):
+        prog.Segment.define_words(self, word_vals)
+        self._pass_on()
+
+
+class StreamingAssembler(ASMParser):
+    """
+    stream() assembles a source given as lines (a file, or any iterable of
+    lines, or a string) and yields (word address, words) pairs, in source
+    order except for the fixups, which come once they can be encoded.
+    assemble_into() writes them into an image instead, such as an
+    np.memmap of the output file.
+    """
+    def __init__(self, table_dir=None, debug=False, include_path=None):
+        ASMParser.__init__(self, table_dir, debug,
+                           include_path=include_path)
+
+    def make_segment(self, seg_type):
+        return _StreamSegment(seg_type, self)
+
+    def _define(self, label, address):
+        self._symbols[label] = address
+        for fixup in self._fixups.pop(label, ()):
+            fixup.pending -= 1
+            if not fixup.pending:
+                self._output.append(
+                    fixup.segment.item_words(fixup.inst, self._symbols))
+
+    def _place(self, segment, item):
+        missing = set(arg.label for arg in getattr(item, "args", ())
+                      if isinstance(arg, prog.SymbolArg)
+                      and arg.label not in self._symbols)
+        if missing:
+            fixup = _Fixup(segment, item, len(missing))
+            for label in missing:
+                self._fixups.setdefault(label, []).append(fixup)
+            pc = (segment.origin or 0) + item.addr // 2
+            self._output.append((pc, (0,) * item.op.words))
+        else:
+            self._output.append(segment.item_words(item, self._symbols))
+
+    def symbols(self):
+        return dict(self._symbols)
+
+    def stream(self, source):
+        if not self.built:
+            self.build()
+        if isinstance(source, basestring):
+            source = source.splitlines()
+        self.variables = {}
+        self.defs = {}
+        self._symbols = {}
+        # label -> fixups of the instructions waiting for it
+        self._fixups = {}
+        self._output = []
+        self._includes = []
+        self.segments = []
+        self.new_segment("CSEG")
+        lexer = self.lexer.lexer
+        for lineno, line in enumerate(source):
+            lexer.lineno = lineno + 1
+            lexer.begin("INITIAL")
+            self.parser.parse(line.rstrip("\r\n") + "\n", lexer=lexer)
+            if self._output:
+                output = self._output
+                self._output = []
+                for chunk in output:
+                    yield chunk
+        if self._fixups:
+            raise prog.ASMError("Unknown label(s): %s"
+                                % ", ".join(sorted(self._fixups)))
+
+    def assemble_into(self, source, image):
+        """
+        Assemble source into image, a uint16 array. Returns the address
+        just past the highest word written.
+        """
+        end = 0
+        for pc, words in self.stream(source):
+            image[pc:pc + len(words)] = words
+            end = max(end, pc + len(words))
+        return end
@@ -0,0 +1,165 @@
+"""
+Execution traces.
+
+Each executed instruction becomes one fixed-width record (kTraceDtype) in
+a preallocated ring buffer. When a trace file is given, full buffers are
+appended to it as raw records, so a whole run can be recorded in constant
+memory; otherwise the buffer keeps the most recent records. Trace files
+have no header and are read back with load_trace, which maps them rather
+than reading them.
+
+Tracing has its own run loop, so the simulator's normal run() doesn't pay
+for it.
+"""
+import numpy as np
+
+import program as prog
+from debugger import MemoryAccesses
+from simplesim import SimulationError
+
+# pc and opcode are words; cycle is the cycle count before the instruction
+# and sreg its value after. If the instruction accessed the data space,
+# flags has kTraceAccess set (and kTraceWrite for a store) and addr and
+# value give the (first) address and the value there afterwards.
+kTraceDtype = np.dtype([("pc", "<u2"), ("opcode", "<u2"), ("cycle", "<u8"),
+                        ("sreg", "u1"), ("flags", "u1"), ("addr", "<u2"),
+                        ("value", "u1")])
+
+kTraceAccess = 1
+kTraceWrite = 2
+
+kDefaultCapacity = 1 << 16
+
+class TraceRecorder(object):
+    def __init__(self, sim, capacity=kDefaultCapacity, path=None):
+        self.sim = sim
+        self.cpu = sim.cpu
+        self.buffer = np.zeros(capacity, kTraceDtype)
+        self.count = 0          # records in the buffer
+        self.total = 0          # records ever written
+        self._next = 0
+        self._file = open(path, "wb") if path is not None else None
+        self._accesses = [None] * len(self.cpu.flash)
+        self.cpu.add_flash_observer(self._invalidate)
+
+    def _invalidate(self, start, end):
+        accesses = self._accesses
+        for pc in range(max(start - 1, 0), min(end, len(accesses))):
+            accesses[pc] = None
+
+    def _lookup_access(self, pc):
+        op, operands, size = self.sim.decoder.decode_at(self.cpu.flash, pc)
+        access = False
+        if op is not None and op.mnemonic in MemoryAccesses:
+            f = MemoryAccesses[op.mnemonic]
+            access = lambda: f(self.cpu, *operands)
+        self._accesses[pc] = access
+        return access
+
+    def flush(self):
+        """Append the buffered records to the trace file, if there is one."""
+        if self._file is None or not self.count:
+            return
+        self.records().tofile(self._file)
+        self._file.flush()
+        self.count = 0
+        self._next = 0
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def records(self):
+        """The buffered records, oldest first (a copy)."""
+        if self.count < len(self.buffer):
+            return self.buffer[:self.count].copy()
+        return np.concatenate((self.buffer[self._next:],
+                               self.buffer[:self._next]))
+
+    def run(self, max_cycles=None, max_instructions=None):
+        """Run the simulator as Simulator.run does, tracing every instruction."""
+        cpu = self.cpu
+        code = self.sim._code
+        decode = self.sim._decode
+        accesses = self._accesses
+        lookup_access = self._lookup_access
+        buffer = self.buffer
+        capacity = len(buffer)
+        data = cpu.data
+        flash = cpu.flash
+        pc = cpu.pc
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cpu.cycles + max_cycles
+        if max_instructions is None:
+            max_instructions = float("inf")
+        executed = 0
+        try:
+            while cpu.cycles < limit and executed < max_instructions:
+                entry = code[pc]
+                if entry is None:
+                    entry = decode(pc)
+                access = accesses[pc]
+                if access is None:
+                    access = lookup_access(pc)
+                if access:
+                    addr, write = access()[0]
+                    flags = kTraceWrite | kTraceAccess if write else kTraceAccess
+                else:
+                    addr = flags = 0
+                opcode = int(flash[pc])
+                cycle = cpu.cycles
+                handler, size, cost = entry
+                cpu.pc = pc + size
+                cpu.cycles += cost
+                executed += 1
+                try:
+                    extra = handler()
+                finally:
+                    # Record the instruction even if it stopped execution.
+                    if self.count == capacity:
+                        if self._file is not None:
+                            self.flush()
+                        else:
+                            self.count -= 1
+                    buffer[self._next] = (pc, opcode, cycle, data[prog.kSREG],
+                                          flags, addr,
+                                          data[addr] if flags else 0)
+                    self._next = (self._next + 1) % capacity
+                    self.count += 1
+                    self.total += 1
+                if extra:
+                    cpu.cycles += extra
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return e.reason
+        except IndexError:
+            if cpu.pc >= len(code):
+                raise SimulationError("PC out of range: %04x" % cpu.pc)
+            raise
+        return None
+
+
+def load_trace(path):
+    """Map a trace file as a read-only array of kTraceDtype records."""
+    return np.memmap(path, kTraceDtype, "r")
+
+def first_difference(a, b, fields=("pc", "opcode", "sreg", "addr", "value")):
+    """
+    Index of the first record where traces a and b differ in any of
+    fields, or None if they match (the shorter being a prefix of the
+    other counts as a difference at its end).
+    """
+    n = min(len(a), len(b))
+    differs = np.zeros(n, bool)
+    for field in fields:
+        differs |= a[field][:n] != b[field][:n]
+    index = np.flatnonzero(differs)
+    if len(index):
+        return int(index[0])
+    if len(a) != len(b):
+        return n
+    return None
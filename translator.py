@@ -0,0 +1,187 @@
+from functools import partial
+
+import fusion
+import program as prog
+from simplesim import Simulator, SimulationError, _illegal_instruction
+
+# Longest run of instructions compiled into a single block. Also bounds how
+# far back a flash write has to look for blocks covering it.
+kMaxBlockWords = 64
+
+class Block(object):
+    def __init__(self, start, end, func, cycles, count, pcs=()):
+        self.start = start
+        self.end = end
+        self.func = func
+        self.cycles = cycles
+        self.count = count
+        # Address of each instruction in the block
+        self.pcs = pcs
+
+    def __repr__(self):
+        return "<Block %04x-%04x: %d instructions>" % (self.start, self.end,
+                                                      self.count)
+
+
+class BlockSimulator(Simulator):
+    """
+    Simulator that runs whole basic blocks at a time.
+
+    Starting from an address, instructions are collected until the first
+    one that can change the flow of control (jumps, branches, skips, calls,
+    returns, SLEEP/BREAK and SPM) and compiled into one Python function
+    that calls each op implementation in turn with its operands as
+    constants. Blocks are cached by start address and thrown away when
+    the flash they were built from is written.
+
+    Cycle limits are only checked between blocks, so run() may overshoot
+    max_cycles by up to one block. With fuse, runs of instructions that
+    have a superinstruction (see fusion.py) are one call in the block;
+    as blocks already avoid dispatching each instruction, that gains
+    much less than it does on Simulator.
+
+    When the CPU has I/O handlers, run() uses blocks translated to add
+    each instruction's cycles to cpu.cycles before calling it, kept apart
+    from the plain ones, so that handlers see the current count.
+    """
+    def __init__(self, cpu, decoder=None, fuse=False):
+        self._blocks = {}
+        self._synced_blocks = {}
+        Simulator.__init__(self, cpu, decoder, fuse)
+
+    def predecode(self):
+        # Blocks are built on first use.
+        pass
+
+    def invalidate(self, start, end):
+        Simulator.invalidate(self, start, end)
+        for blocks in (self._blocks, self._synced_blocks):
+            for addr in range(max(start - kMaxBlockWords, 0), end):
+                block = blocks.get(addr)
+                if block is not None and block.end > start:
+                    del blocks[addr]
+
+    def translate(self, start, sync=False):
+        flash = self.cpu.flash
+        if not 0 <= start < len(flash):
+            raise SimulationError("PC out of range: %04x" % start)
+        decode = self.decoder.decode_at
+        handlers = []
+        pcs = []
+        lines = []
+        cycles = 0
+        pc = start
+        end_pc = min(start + kMaxBlockWords, len(flash))
+        terminated = False
+        while pc < end_pc:
+            match = None
+            if self.fuse:
+                match = fusion.match(self.decoder, flash, pc)
+            if match is not None and pc + match[2] <= end_pc:
+                fused, operands, size = match
+                impl, op_cycles, flow = fused.impl, fused.cycles, fused.flow
+                addr = pc
+                for op in fused.ops:
+                    pcs.append(addr)
+                    addr += op.words
+            else:
+                op, operands, size = decode(flash, pc)
+                if op is None:
+                    if pc == start:
+                        handlers.append(partial(_illegal_instruction, pc,
+                                                int(flash[pc])))
+                        pcs.append(pc)
+                        if sync:
+                            lines.append("    cpu.cycles += 1")
+                        lines.append("    h0(cpu)")
+                        cycles += 1
+                        pc += 1
+                        terminated = True
+                    break
+                impl, op_cycles, flow = op.impl, op.cycles, op.flow
+                pcs.append(pc)
+            name = "h%d" % len(handlers)
+            handlers.append(impl)
+            call = "%s(cpu%s)" % (name, "".join(", %d" % x for x in operands))
+            cycles += op_cycles
+            pc += size
+            if sync:
+                lines.append("    cpu.cycles += %d" % op_cycles)
+            if flow != prog.kFlowNext:
+                lines.append("    cpu.pc = %d" % pc)
+                lines.append("    return " + call)
+                terminated = True
+                break
+            lines.append("    " + call)
+        if not terminated:
+            lines.append("    cpu.pc = %d" % pc)
+
+        names = ", ".join("h%d" % i for i in range(len(handlers)))
+        source = "\n".join(["def make_block(%s):" % names,
+                            "  def block_%04x(cpu):" % start]
+                           + ["  " + line for line in lines]
+                           + ["  return block_%04x" % start])
+        namespace = {}
+        exec(compile(source, "<block %04x>" % start, "exec"), namespace)
+        func = namespace["make_block"](*handlers)
+        block = Block(start, pc, func, cycles, len(pcs), tuple(pcs))
+        if sync:
+            self._synced_blocks[start] = block
+        else:
+            self._blocks[start] = block
+        return block
+
+    def run(self, max_cycles=None):
+        cpu = self.cpu
+        if cpu.io_handlers:
+            return self._run_synced(max_cycles)
+        blocks = self._blocks
+        translate = self.translate
+        pc = cpu.pc
+        cycles = cpu.cycles
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cycles + max_cycles
+        try:
+            while cycles < limit:
+                block = blocks.get(pc)
+                if block is None:
+                    block = translate(pc)
+                cycles += block.cycles
+                extra = block.func(cpu)
+                if extra:
+                    cycles += extra
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return e.reason
+        finally:
+            cpu.cycles = cycles
+        return None
+
+    def _run_synced(self, max_cycles):
+        # run(), with the blocks that keep cpu.cycles current
+        cpu = self.cpu
+        blocks = self._synced_blocks
+        pc = cpu.pc
+        cycles = cpu.cycles
+        if max_cycles is None:
+            limit = float("inf")
+        else:
+            limit = cycles + max_cycles
+        try:
+            while cycles < limit:
+                block = blocks.get(pc)
+                if block is None:
+                    block = self.translate(pc, sync=True)
+                cpu.cycles = cycles
+                cycles += block.cycles
+                extra = block.func(cpu)
+                if extra:
+                    cycles += extra
+                pc = cpu.pc
+        except prog.StopExecution as e:
+            return e.reason
+        finally:
+            cpu.cycles = cycles
+        return None